@@ -0,0 +1,30 @@
+"""
+URL configuration used when the project is served through BE/asgi.py.
+
+The read endpoints are routed to their native async views so they run on
+the event loop instead of going through a thread-sensitive sync_to_async
+shim, and signup/login await password hashing on the hashing pool; every
+other route is shared with BE/urls.py. ASGI-only routes such as the
+progress event stream are added here as well.
+"""
+from django.urls import path
+
+from BE.urls import urlpatterns as sync_urlpatterns
+from course.views import (
+    aenter_course, aget_course_progress, aget_course_workspace, alist_up_courses, course_progress_stream,
+)
+from todo.views import alistup_todo
+from user.views import alogin_view, asign_up_view
+
+urlpatterns = [
+    path('signup/', asign_up_view, name='signup'),
+    path('login/', alogin_view, name='login'),
+    path('course/list/', alist_up_courses, name='list_up_courses'),
+    path('course/<int:course_id>', aenter_course, name='enter_course'),
+    path('course/<int:course_id>/participants/', aget_course_progress, name='get_course_progress'),
+    path('course/<int:course_id>/list', alistup_todo, name='listup_todo'),
+    path('course/<int:course_id>/workspace/', aget_course_workspace, name='get_course_workspace'),
+    # 진행률 대시보드 SSE (WSGI에서는 스트림을 유지할 수 없으므로 ASGI 전용)
+    path('course/<int:course_id>/participants/stream/', course_progress_stream, name='course_progress_stream'),
+    *sync_urlpatterns,
+]
@@ -0,0 +1,201 @@
+"""
+Several API calls in one HTTP request.
+
+``POST /batch/`` takes ``{"requests": [{"method", "path", "body"}, ...],
+"atomic": false}``. Each sub-request is resolved against ``BE/urls.py`` and
+its view is called directly on the same thread, so all of them share one
+DB connection. The batch itself is authenticated with ``JWTAuthentication``,
+which loads the user, so inactive accounts are rejected up front. Each
+sub-request carries the caller's ``Authorization`` header and is
+authenticated again by its own view's ``authentication_classes``. Write
+endpoints therefore keep their ``is_active`` check, and a token revoked by a
+``/logout/`` sub-request is refused by the sub-requests after it.
+Sub-requests skip the middleware chain.
+
+The response is ``{"responses": [{"status", "body"}, ...], "rolled_back"}``
+in request order. With ``"atomic": true`` everything runs in one
+transaction. The first sub-response with status >= 400 rolls it back, and
+the remaining sub-requests are not run (status 424). Views publish SSE
+events on commit, so a rolled-back batch sends none. Membership cache
+entries added during a rolled-back batch are invalidated.
+
+Work is bounded by ``BATCH_MAX_REQUESTS`` sub-requests, ``BATCH_MAX_SECONDS``
+of wall time (checked before each sub-request) and
+``BATCH_MAX_RESPONSE_BYTES`` of collected response bodies.
+"""
+import json
+import logging
+import time
+from io import BytesIO
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.http import JsonResponse
+from django.urls import Resolver404, resolve
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from course import membership
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_REQUESTS = 20
+DEFAULT_MAX_SECONDS = 10
+DEFAULT_MAX_RESPONSE_BYTES = 5 * 2 ** 20
+METHODS = ('GET', 'POST', 'PUT', 'PATCH', 'DELETE')
+URLCONF = 'BE.urls'
+# 하위 요청에 넘기지 않는 상위 요청 META (본문/경로/조건부 요청 관련)
+REQUEST_ONLY_META = ('REQUEST_METHOD', 'PATH_INFO', 'QUERY_STRING', 'CONTENT_TYPE', 'CONTENT_LENGTH')
+
+
+class ResponseTooLarge(Exception):
+    pass
+
+
+def _result(status, body):
+    return {'status': status, 'body': body}
+
+
+def _error(status, message):
+    return _result(status, {'error': message})
+
+
+def _sub_request(parent, method, path, body):
+    path, _, query = path.partition('?')
+    content = b'' if body is None else json.dumps(body, cls=DjangoJSONEncoder).encode()
+    environ = {
+        key: value for key, value in parent.META.items()
+        if not key.startswith(('wsgi.', 'HTTP_IF_')) and key not in REQUEST_ONLY_META
+    }
+    environ.update({
+        'REQUEST_METHOD': method,
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+        'CONTENT_TYPE': 'application/json',
+        'CONTENT_LENGTH': str(len(content)),
+        'wsgi.input': BytesIO(content),
+        'wsgi.url_scheme': parent.scheme,
+    })
+    # Authorization 헤더는 그대로 전달: 각 view가 자기 인증 방식으로 다시 인증 (폐기/비활성 반영)
+    return WSGIRequest(environ)
+
+
+def _read_body(response, budget):
+    """응답 본문을 읽어 JSON이면 파싱해서 반환. budget보다 크면 ResponseTooLarge."""
+    try:
+        if response.streaming:
+            chunks = []
+            size = 0
+            for chunk in response.streaming_content:
+                size += len(chunk)
+                if size > budget:
+                    raise ResponseTooLarge
+                chunks.append(chunk)
+            content = b''.join(chunks)
+        else:
+            content = response.content
+            if len(content) > budget:
+                raise ResponseTooLarge
+    finally:
+        response.close()
+    if not content:
+        return None, 0
+    if response.get('Content-Type', '').startswith('application/json'):
+        return json.loads(content), len(content)
+    return content.decode(response.charset or 'utf-8', errors='replace'), len(content)
+
+
+def _run(parent, entry, budget):
+    """하위 요청 하나를 실행하고 (결과, 응답 본문 크기)를 반환."""
+    if not isinstance(entry, dict):
+        return _error(400, "Each request must be an object"), 0
+    method = str(entry.get('method', 'GET')).upper()
+    path = entry.get('path')
+    body = entry.get('body')
+    if method not in METHODS:
+        return _error(400, f"method must be one of {', '.join(METHODS)}"), 0
+    if not isinstance(path, str) or not path.startswith('/'):
+        return _error(400, "path must be an absolute path such as /course/list/"), 0
+    if body is not None and not isinstance(body, (dict, list)):
+        return _error(400, "body must be a JSON object or array"), 0
+
+    request = _sub_request(parent, method, path, body)
+    try:
+        match = resolve(request.path_info, urlconf=URLCONF)
+    except Resolver404:
+        return _error(404, "Not found"), 0
+    if match.url_name == 'batch':
+        return _error(400, "Batch requests cannot be nested"), 0
+
+    request.resolver_match = match
+    try:
+        response = match.func(request, *match.args, **match.kwargs)
+        # DRF Response(인증 실패 401 등)는 handler처럼 render 후 본문을 읽음
+        if hasattr(response, 'render') and callable(response.render):
+            response = response.render()
+        content, size = _read_body(response, budget)
+    except ResponseTooLarge:
+        return _error(413, "Response too large for batch"), 0
+    except Exception as e:
+        logger.error(f"Error in batch request {method} {path}: {str(e)}")
+        return _error(500, "Internal server error"), 0
+    return _result(response.status_code, content), size
+
+
+def run_batch(parent, entries, atomic=False):
+    """하위 요청들을 순서대로 실행하고 (결과 목록, atomic 배치 실패 여부)를 반환."""
+    deadline = time.monotonic() + getattr(settings, 'BATCH_MAX_SECONDS', DEFAULT_MAX_SECONDS)
+    budget = getattr(settings, 'BATCH_MAX_RESPONSE_BYTES', DEFAULT_MAX_RESPONSE_BYTES)
+    results = []
+    failed = False
+    for entry in entries:
+        if failed:
+            results.append(_error(424, "Not run because an earlier request in the atomic batch failed"))
+            continue
+        if time.monotonic() > deadline:
+            result = _error(503, "Batch time limit exceeded")
+        else:
+            result, size = _run(parent, entry, budget)
+            budget -= size
+        results.append(result)
+        failed = atomic and result['status'] >= 400
+    return results, failed
+
+
+@csrf_exempt
+@api_view(['POST'])
+# 쓰기 요청이 포함될 수 있으므로 DB에서 사용자를 조회해 비활성 계정을 거름
+@authentication_classes([JWTAuthentication])
+@permission_classes([IsAuthenticated])
+def batch_view(request):
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse({"error": "Invalid JSON format"}, status=400)
+
+    entries = data.get('requests') if isinstance(data, dict) else None
+    atomic = data.get('atomic', False) if isinstance(data, dict) else False
+    if not isinstance(entries, list) or not entries:
+        return JsonResponse({"error": "requests must be a non-empty list"}, status=400)
+    if not isinstance(atomic, bool):
+        return JsonResponse({"error": "atomic must be a boolean"}, status=400)
+    max_requests = getattr(settings, 'BATCH_MAX_REQUESTS', DEFAULT_MAX_REQUESTS)
+    if len(entries) > max_requests:
+        return JsonResponse({"error": f"Too many requests (max {max_requests})"}, status=400)
+
+    if atomic:
+        with membership.tracking() as cached, transaction.atomic():
+            results, rolled_back = run_batch(request, entries, atomic=True)
+            if rolled_back:
+                transaction.set_rollback(True)
+        # rollback된 수강 등록으로 캐시된 참여 여부가 남지 않도록
+        if rolled_back:
+            for course_id, user_id in cached:
+                membership.invalidate(course_id, user_id)
+    else:
+        results, rolled_back = run_batch(request, entries)
+    return JsonResponse({"responses": results, "rolled_back": rolled_back}, status=200)
@@ -0,0 +1,86 @@
+"""
+Conditional GET (ETag / 304) and rendered-body caching for the listing views.
+
+A listing's version comes from one aggregate query (row count, latest
+timestamp, ...) and is hashed into a strong ETag together with everything
+else the body depends on (scope, page parameters). A matching
+``If-None-Match`` is answered with 304 before any row is fetched, and a body
+that was already rendered for the same ETag is served from the Django cache
+without fetching or serializing the rows again. Streamed bodies are never
+cached; they still get an ETag.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+
+DEFAULT_RESPONSE_CACHE_TTL = 300
+
+
+def make_etag(*parts):
+    """응답 본문을 결정하는 값들로 strong ETag 생성."""
+    digest = hashlib.sha1(repr(parts).encode(), usedforsecurity=False).hexdigest()
+    return f'"{digest}"'
+
+
+def set_validators(response, etag):
+    response['ETag'] = etag
+    # 응답은 사용자별이므로 공유 캐시 금지, 브라우저는 매번 재검증
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def not_modified(request, etag):
+    """If-None-Match가 현재 ETag와 일치하면 304 응답, 아니면 None."""
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        set_validators(response, etag)
+    return response
+
+
+def _cache_key(etag):
+    return 'response:' + etag.strip('"')
+
+
+def _cache_ttl():
+    return getattr(settings, 'RESPONSE_CACHE_TTL', DEFAULT_RESPONSE_CACHE_TTL)
+
+
+def _cached(body):
+    return HttpResponse(body, content_type='application/json')
+
+
+def cached_response(etag, render):
+    """
+    ETag에 해당하는 렌더링된 본문이 캐시에 있으면 그대로 반환하고,
+    없으면 ``render()``로 만든 200 응답의 본문을 캐시에 저장.
+    """
+    ttl = _cache_ttl()
+    body = cache.get(_cache_key(etag)) if ttl else None
+    if body is not None:
+        return set_validators(_cached(body), etag)
+
+    response = render()
+    if response.status_code != 200:
+        return response
+    # 스트리밍 응답(BE/streaming.py)은 본문을 메모리에 모으지 않으므로 캐시하지 않음
+    if ttl and not response.streaming:
+        cache.set(_cache_key(etag), response.content, ttl)
+    return set_validators(response, etag)
+
+
+async def acached_response(etag, arender):
+    """cached_response()의 async 버전."""
+    ttl = _cache_ttl()
+    body = await cache.aget(_cache_key(etag)) if ttl else None
+    if body is not None:
+        return set_validators(_cached(body), etag)
+
+    response = await arender()
+    if response.status_code != 200:
+        return response
+    if ttl and not response.streaming:
+        await cache.aset(_cache_key(etag), response.content, ttl)
+    return set_validators(response, etag)
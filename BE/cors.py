@@ -0,0 +1,85 @@
+"""
+CORS preflight fast path.
+
+``PreflightMiddleware`` sits first in ``MIDDLEWARE`` and answers browser
+preflights (``OPTIONS`` with ``Access-Control-Request-Method``) itself, so
+they skip the session, CSRF, auth, messages and metrics middleware. The
+response headers are the ones ``corsheaders.middleware.CorsMiddleware``
+would have sent. Everything except ``Access-Control-Allow-Origin`` is built
+once when the middleware is loaded. ``CORS_PREFLIGHT_MAX_AGE`` lets
+browsers cache the answer.
+
+Origins are decided only from static settings (``CORS_ALLOW_ALL_ORIGINS``,
+``CORS_ALLOWED_ORIGINS``, ``CORS_ALLOWED_ORIGIN_REGEXES``). A preflight
+that does not match them goes through the normal chain, where
+``CorsMiddleware`` can still consult its ``check_request_enabled`` signal.
+"""
+import re
+from urllib.parse import urlparse
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from corsheaders.conf import conf
+from corsheaders.middleware import (
+    ACCESS_CONTROL_ALLOW_CREDENTIALS, ACCESS_CONTROL_ALLOW_HEADERS, ACCESS_CONTROL_ALLOW_METHODS,
+    ACCESS_CONTROL_ALLOW_ORIGIN, ACCESS_CONTROL_EXPOSE_HEADERS, ACCESS_CONTROL_MAX_AGE, CorsMiddleware,
+)
+from django.http import HttpResponse
+
+
+class PreflightMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+        # origin 판단은 corsheaders와 같은 함수 사용 (signal 제외)
+        self.cors = CorsMiddleware(get_response)
+        self.urls_regex = re.compile(conf.CORS_URLS_REGEX)
+        self.allow_all = conf.CORS_ALLOW_ALL_ORIGINS
+        # 모든 origin 허용이어도 credentials를 허용하면 '*' 대신 요청 origin을 돌려줘야 함
+        self.wildcard = conf.CORS_ALLOW_ALL_ORIGINS and not conf.CORS_ALLOW_CREDENTIALS
+        self.headers = {'Content-Length': '0', 'Vary': 'Origin'}
+        if conf.CORS_ALLOW_CREDENTIALS:
+            self.headers[ACCESS_CONTROL_ALLOW_CREDENTIALS] = 'true'
+        if conf.CORS_EXPOSE_HEADERS:
+            self.headers[ACCESS_CONTROL_EXPOSE_HEADERS] = ', '.join(conf.CORS_EXPOSE_HEADERS)
+        self.headers[ACCESS_CONTROL_ALLOW_HEADERS] = ', '.join(conf.CORS_ALLOW_HEADERS)
+        self.headers[ACCESS_CONTROL_ALLOW_METHODS] = ', '.join(conf.CORS_ALLOW_METHODS)
+        if conf.CORS_PREFLIGHT_MAX_AGE:
+            self.headers[ACCESS_CONTROL_MAX_AGE] = str(conf.CORS_PREFLIGHT_MAX_AGE)
+
+    def __call__(self, request):
+        response = self.preflight(request)
+        if response is not None:
+            if iscoroutinefunction(self):
+                return self._respond(response)
+            return response
+        return self.get_response(request)
+
+    @staticmethod
+    async def _respond(response):
+        return response
+
+    def preflight(self, request):
+        """바로 응답할 수 있는 preflight면 응답, 아니면 None."""
+        if request.method != 'OPTIONS' or 'HTTP_ACCESS_CONTROL_REQUEST_METHOD' not in request.META:
+            return None
+        origin = request.META.get('HTTP_ORIGIN')
+        if not origin or not self.urls_regex.match(request.path_info):
+            return None
+        if not self.allow_all:
+            try:
+                url = urlparse(origin)
+            except ValueError:
+                return None
+            if not self.cors.origin_found_in_white_lists(origin, url):
+                return None
+
+        response = HttpResponse()
+        for header, value in self.headers.items():
+            response[header] = value
+        response[ACCESS_CONTROL_ALLOW_ORIGIN] = '*' if self.wildcard else origin
+        return response
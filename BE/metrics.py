@@ -0,0 +1,221 @@
+"""
+Per-view request/latency/SQL metrics exposed in Prometheus text format.
+
+``MetricsMiddleware`` records every request under the resolved URL name
+(``create_course``, ``listup_todo``, ...) and ``metrics_view`` renders the
+counters on ``/metrics``. Streaming responses are recorded when their body
+has been sent, so queries run while the body is produced are counted and
+latency covers the whole body. Metrics live in process memory, so with several
+worker processes every worker reports its own series.
+"""
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.http import HttpResponse
+
+# 요청 처리 시간 histogram bucket(초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNRESOLVED = '<unresolved>'
+
+
+class ViewMetrics:
+    __slots__ = ('requests', 'bucket_counts', 'latency_sum', 'queries', 'query_seconds')
+
+    def __init__(self):
+        self.requests = {}  # (method, status) -> count
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)  # 마지막 칸은 +Inf
+        self.latency_sum = 0.0
+        self.queries = 0
+        self.query_seconds = 0.0
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+
+    def record(self, view, method, status, latency, queries, query_seconds):
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, latency)
+        with self._lock:
+            metrics = self._views.get(view)
+            if metrics is None:
+                metrics = self._views[view] = ViewMetrics()
+            key = (method, status)
+            metrics.requests[key] = metrics.requests.get(key, 0) + 1
+            metrics.bucket_counts[bucket] += 1
+            metrics.latency_sum += latency
+            metrics.queries += queries
+            metrics.query_seconds += query_seconds
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+
+    def render(self):
+        with self._lock:
+            views = sorted(self._views.items())
+            lines = [
+                '# HELP http_requests_total Total HTTP requests by view, method and status.',
+                '# TYPE http_requests_total counter',
+            ]
+            for view, metrics in views:
+                for (method, status), count in sorted(metrics.requests.items()):
+                    lines.append(
+                        f'http_requests_total{{view="{view}",method="{method}",status="{status}"}} {count}'
+                    )
+
+            lines += [
+                '# HELP http_request_duration_seconds Request latency by view.',
+                '# TYPE http_request_duration_seconds histogram',
+            ]
+            for view, metrics in views:
+                cumulative = 0
+                for le, count in zip((*LATENCY_BUCKETS, '+Inf'), metrics.bucket_counts):
+                    cumulative += count
+                    lines.append(f'http_request_duration_seconds_bucket{{view="{view}",le="{le}"}} {cumulative}')
+                lines.append(f'http_request_duration_seconds_sum{{view="{view}"}} {metrics.latency_sum:.6f}')
+                lines.append(f'http_request_duration_seconds_count{{view="{view}"}} {cumulative}')
+
+            lines += [
+                '# HELP db_queries_total SQL queries executed by view.',
+                '# TYPE db_queries_total counter',
+            ]
+            lines += [f'db_queries_total{{view="{view}"}} {metrics.queries}' for view, metrics in views]
+            lines += [
+                '# HELP db_query_duration_seconds_total Time spent in SQL by view.',
+                '# TYPE db_query_duration_seconds_total counter',
+            ]
+            lines += [
+                f'db_query_duration_seconds_total{{view="{view}"}} {metrics.query_seconds:.6f}'
+                for view, metrics in views
+            ]
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+
+class QueryCounter:
+    """요청 하나에서 실행된 SQL 수와 시간."""
+    __slots__ = ('count', 'seconds')
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+# async view의 ORM 호출은 sync_to_async 스레드에서 실행되므로
+# 요청별 counter는 ContextVar로 전달 (asgiref가 context를 스레드로 복사함)
+_current_counter = ContextVar('query_counter', default=None)
+
+
+def count_queries(execute, sql, params, many, context):
+    counter = _current_counter.get()
+    if counter is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        counter.seconds += time.perf_counter() - start
+        counter.count += 1
+
+
+def install_query_counter(connection, **kwargs):
+    if count_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_queries)
+
+
+connection_created.connect(install_query_counter)
+
+
+class MetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        # 시그널 연결 전에 만들어진 연결에도 적용
+        install_query_counter(connection)
+        counter = QueryCounter()
+        token = _current_counter.set(counter)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_counter.reset(token)
+        return self.finish(request, response, start, counter)
+
+    async def __acall__(self, request):
+        counter = QueryCounter()
+        token = _current_counter.set(counter)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_counter.reset(token)
+        return self.finish(request, response, start, counter)
+
+    def finish(self, request, response, start, counter):
+        if not response.streaming:
+            self.record(request, response, time.perf_counter() - start, counter)
+            return response
+        # 스트리밍 응답(BE/streaming.py)은 본문을 읽는 동안 쿼리가 실행되므로
+        # 본문 전송이 끝나 close()가 호출될 때 기록
+        if response.is_async:
+            response.streaming_content = _acounted(response.streaming_content, counter)
+        else:
+            response.streaming_content = _counted(response.streaming_content, counter)
+        response._resource_closers.append(
+            lambda: self.record(request, response, time.perf_counter() - start, counter)
+        )
+        return response
+
+    @staticmethod
+    def record(request, response, latency, counter):
+        match = request.resolver_match
+        view = match.url_name if match is not None and match.url_name else UNRESOLVED
+        registry.record(view, request.method, response.status_code, latency, counter.count, counter.seconds)
+
+
+def _counted(content, counter):
+    # chunk를 만드는 동안만 counter를 켬 (yield 사이에는 다른 요청이 같은 context를 쓸 수 있음)
+    iterator = iter(content)
+    while True:
+        token = _current_counter.set(counter)
+        try:
+            chunk = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            _current_counter.reset(token)
+        yield chunk
+
+
+async def _acounted(content, counter):
+    iterator = aiter(content)
+    while True:
+        token = _current_counter.set(counter)
+        try:
+            chunk = await anext(iterator)
+        except StopAsyncIteration:
+            return
+        finally:
+            _current_counter.reset(token)
+        yield chunk
+
+
+def metrics_view(request):
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
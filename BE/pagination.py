@@ -0,0 +1,91 @@
+"""
+Keyset (cursor) pagination shared by the listing views.
+
+Rows are ordered by ``(created_at, id)`` and the cursor encodes the key of the
+last row that was returned, so page N costs the same as page 1 (no OFFSET).
+"""
+import base64
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import Q
+
+DEFAULT_MAX_LIMIT = 100
+
+
+class InvalidPageParams(ValueError):
+    pass
+
+
+def get_page_params(request):
+    """
+    ``limit``/``cursor`` query parameters를 읽음.
+    ``limit``이 없으면 페이지네이션을 쓰지 않는 요청이므로 ``(None, None)``을 반환.
+    """
+    raw_limit = request.GET.get('limit')
+    raw_cursor = request.GET.get('cursor')
+    if raw_limit is None and raw_cursor is None:
+        return None, None
+
+    max_limit = getattr(settings, 'PAGINATION_MAX_LIMIT', DEFAULT_MAX_LIMIT)
+    try:
+        limit = int(raw_limit) if raw_limit is not None else max_limit
+    except ValueError:
+        raise InvalidPageParams("limit must be an integer")
+    if limit < 1:
+        raise InvalidPageParams("limit must be positive")
+    limit = min(limit, max_limit)
+
+    cursor = decode_cursor(raw_cursor) if raw_cursor else None
+    return limit, cursor
+
+
+def encode_cursor(created_at, pk):
+    raw = f"{created_at.isoformat()}|{pk}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, pk = base64.urlsafe_b64decode(padded).decode().split('|')
+        return datetime.fromisoformat(created_at), int(pk)
+    except (ValueError, UnicodeDecodeError):
+        raise InvalidPageParams("Invalid cursor")
+
+
+def _row_key(row):
+    if isinstance(row, dict):
+        return row['created_at'], row['id']
+    return row.created_at, row.id
+
+
+def _page_queryset(queryset, limit, cursor):
+    queryset = queryset.order_by('created_at', 'id')
+    if cursor is not None:
+        created_at, pk = cursor
+        queryset = queryset.filter(
+            Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+        )
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    return queryset[:limit + 1]
+
+
+def _split_page(rows, limit):
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(*_row_key(rows[-1]))
+
+
+def paginate(queryset, limit, cursor=None):
+    """
+    queryset을 ``(created_at, id)`` 순으로 정렬해 ``limit``개만 가져옴.
+    (rows, next_cursor)를 반환하며 마지막 페이지면 next_cursor는 None.
+    """
+    return _split_page(list(_page_queryset(queryset, limit, cursor)), limit)
+
+
+async def apaginate(queryset, limit, cursor=None):
+    """paginate()의 async 버전."""
+    return _split_page([row async for row in _page_queryset(queryset, limit, cursor)], limit)
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 from datetime import timedelta
 import json
@@ -46,26 +47,49 @@ INSTALLED_APPS = [
     'user',
     'course',
     'todo',
+    'bench',
     'corsheaders'
 ]
 
+# JWT만 사용: 로그인/회원가입 시 세션을 만들지 않고 세션/사용자/메시지 middleware도 제외
+# (세션 로그인이 필요한 배포는 JWT_STATELESS_AUTH=0, 만료된 세션은 SESSION_PURGE_INTERVAL로 정리)
+JWT_STATELESS_AUTH = os.environ.get('JWT_STATELESS_AUTH', '1') == '1'
+
 MIDDLEWARE = [
+    # CORS preflight는 세션/인증 middleware를 거치지 않고 바로 응답 (BE/cors.py)
+    'BE.cors.PreflightMiddleware',
+    # view별 요청 수/지연 시간/SQL 수 집계 (/metrics)
+    'BE.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    # 다른 middleware가 만든 응답(redirect 등)에도 CORS 헤더가 붙도록 CommonMiddleware보다 앞에 둠
+    'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'corsheaders.middleware.CorsMiddleware',
 ]
+if JWT_STATELESS_AUTH:
+    MIDDLEWARE = [m for m in MIDDLEWARE if m not in (
+        'django.contrib.sessions.middleware.SessionMiddleware',
+        'django.contrib.auth.middleware.AuthenticationMiddleware',
+        'django.contrib.messages.middleware.MessageMiddleware',
+    )]
 
 CORS_ALLOW_ALL_ORIGINS = True
+# 브라우저가 preflight 결과를 캐시하는 시간(초). 브라우저별 상한이 있음 (Chromium 2시간, Firefox 24시간)
+CORS_PREFLIGHT_MAX_AGE = 86400
 CSRF_TRUSTED_ORIGINS = ["http://localhost:3001", "http://localhost:3000",'http://127.0.0.1:3000']
 ALLOWED_HOSTS = ['*']
 SESSION_COOKIE_AGE = 3600
+# 세션을 쓰는 경우 만료된 세션을 삭제하는 주기(초), None이면 백그라운드 정리 안 함 (user/sessions.py)
+SESSION_PURGE_INTERVAL = None if JWT_STATELESS_AUTH else 600
+# 한 번에 삭제하는 세션 수 (배치 사이에는 write lock을 놓아 로그인 요청이 끼어들 수 있음)
+SESSION_PURGE_BATCH_SIZE = 1000
 
-ROOT_URLCONF = 'BE.urls'
+# BE/asgi.py는 DJANGO_ROOT_URLCONF=BE.asgi_urls로 async view를 사용
+ROOT_URLCONF = os.environ.get('DJANGO_ROOT_URLCONF', 'BE.urls')
 
 TEMPLATES = [
     {
@@ -90,10 +114,31 @@ WSGI_APPLICATION = 'BE.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# SQLite 운영 프로파일 (옵션 설명은 BE/sqlite/base.py)
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
+        'ENGINE': 'BE.sqlite',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # 요청마다 연결을 새로 열지 않고 재사용 (끊긴 연결은 재사용 전에 확인)
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            # busy timeout(초): 다른 writer가 lock을 가진 동안 대기
+            'timeout': 5,
+            # 쓰기 트랜잭션은 시작 시점에 write lock 획득
+            'transaction_mode': 'IMMEDIATE',
+            'lock_retries': 3,
+            'lock_retry_delay': 0.05,
+            'pragmas': {
+                # WAL: reader가 writer를 기다리지 않음
+                'journal_mode': 'WAL',
+                # WAL에서는 NORMAL로도 DB 손상 없음 (전원 장애 시 마지막 커밋만 유실 가능)
+                'synchronous': 'NORMAL',
+                'cache_size': -20000,  # KiB 단위 (약 20MB)
+                'mmap_size': 268435456,  # 256MB
+                'temp_store': 'MEMORY',
+            },
+        },
     }
 }
 
@@ -102,6 +147,19 @@ AUTH_USER_MODEL = 'user.User'
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
+PASSWORD_HASHERS = [
+    # PASSWORD_HASH_ITERATIONS로 비용을 조절하는 PBKDF2 (기존 pbkdf2_sha256 해시와 호환)
+    'user.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+# PBKDF2 반복 횟수. 바꾸면 기존 사용자는 다음 로그인 때 새 비용으로 다시 해시됨
+PASSWORD_HASH_ITERATIONS = 600000
+# 동시에 비밀번호를 해시하는 스레드 수, None이면 CPU 코어 수의 절반
+PASSWORD_HASHING_WORKERS = None
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -159,6 +217,38 @@ REST_FRAMEWORK = {
     ],
 }
 
+# 목록 API cursor 페이지네이션(limit/cursor) 최대 limit
+PAGINATION_MAX_LIMIT = 100
+
+# add_todo 한 번에 추가할 수 있는 To-Do 최대 개수
+TODO_MAX_BATCH_SIZE = 500
+
+# enroll_students 한 번에 등록할 수 있는 최대 학생 수
+ROSTER_MAX_SIZE = 5000
+
+# 종료된 수업의 To-Do/완료 기록/참여자를 한 번에 삭제하는 행 수 (course/purge.py)
+COURSE_PURGE_BATCH_SIZE = 1000
+
+# /batch/ 한 번에 실행할 수 있는 하위 요청 수, 전체 실행 시간(초), 모은 응답 본문 크기 상한 (BE/batch.py)
+BATCH_MAX_REQUESTS = 20
+BATCH_MAX_SECONDS = 10
+BATCH_MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+
+# 수강 여부(course_id, user_id) 프로세스 내 캐시 유지 시간(초)
+MEMBERSHIP_CACHE_TTL = 300
+
+# 목록 API(ETag 기준) 렌더링된 응답 본문 캐시 시간(초), 0이면 캐시하지 않음
+RESPONSE_CACHE_TTL = 300
+
+# 목록 행 수가 이 이상이면 JSON을 chunk 단위로 스트리밍 (None이면 항상 JsonResponse)
+STREAMING_JSON_MIN_ROWS = 1000
+
+# 진행률 SSE: heartbeat 간격, 전체 snapshot 재전송 간격, 연결 최대 유지 시간(초), 연결별 대기 이벤트 수
+SSE_HEARTBEAT_SECONDS = 15
+SSE_RESYNC_SECONDS = 60
+SSE_MAX_SECONDS = 300
+SSE_QUEUE_SIZE = 100
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=1),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
@@ -168,8 +258,18 @@ SIMPLE_JWT = {
     'AUTH_HEADER_NAME': 'HTTP_AUTHORIZATION',
     'USER_ID_FIELD': 'id',
     'USER_ID_CLAIM': 'user_id',
+    # 로그아웃한 토큰(denylist)을 거부하는 AccessToken
+    'AUTH_TOKEN_CLASSES': ('user.tokens.AccessToken',),
 }
 
+# 로그아웃한 토큰 jti 목록 파일 (모든 worker 프로세스가 공유), None이면 프로세스 메모리에만 보관
+JWT_DENYLIST_PATH = os.environ.get('JWT_DENYLIST_PATH', BASE_DIR / 'jwt_denylist')
+
+# login 시 access token에 user_type, first_name claim 포함 (StatelessJWTAuthentication에서 DB 조회 생략)
+JWT_EMBED_USER_CLAIMS = True
+# token에 없는 사용자 필드 조회 결과 캐시 시간(초), 0이면 캐시하지 않음
+JWT_USER_CACHE_TTL = 0
+
 CORS_ALLOW_METHODS = [
     'DELETE',
     'GET',
@@ -0,0 +1,7 @@
+"""
+SQLite database backend for the production profile (``ENGINE: 'BE.sqlite'``).
+
+Extends Django's sqlite3 backend with the options Django 4.2 does not have
+(``init_command``/``transaction_mode`` only arrive in 5.1); see
+``BE/sqlite/base.py`` for the supported ``OPTIONS`` keys.
+"""
@@ -0,0 +1,72 @@
+"""
+Django's sqlite3 backend plus the SQLite production profile.
+
+Extra ``OPTIONS`` keys (everything else is passed to ``sqlite3.connect``,
+e.g. ``timeout`` for the busy timeout in seconds):
+
+* ``pragmas``: ``{name: value}`` applied to every new connection
+  (``journal_mode=WAL`` lets readers run while a write is in progress).
+* ``transaction_mode``: ``DEFERRED``/``IMMEDIATE``/``EXCLUSIVE`` used by
+  ``transaction.atomic()``. With ``IMMEDIATE`` a write transaction takes the
+  write lock up front, so it waits in the busy handler instead of failing
+  with "database is locked" when it upgrades from a read lock mid-way.
+* ``lock_retries``/``lock_retry_delay``: if the write lock still cannot be
+  taken within the busy timeout, ``BEGIN`` is retried this many times with
+  jittered exponential backoff before the error is raised.
+"""
+import random
+import time
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import OperationalError
+from django.db.backends.sqlite3 import base
+
+DEFAULT_LOCK_RETRIES = 3
+DEFAULT_LOCK_RETRY_DELAY = 0.05
+TRANSACTION_MODES = ('DEFERRED', 'IMMEDIATE', 'EXCLUSIVE')
+PROFILE_OPTIONS = ('pragmas', 'transaction_mode', 'lock_retries', 'lock_retry_delay')
+
+
+def is_lock_error(error):
+    # "database is locked", "database table is locked"
+    return 'locked' in str(error)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    @property
+    def profile_options(self):
+        return self.settings_dict['OPTIONS']
+
+    def get_connection_params(self):
+        kwargs = super().get_connection_params()
+        # sqlite3.connect()가 모르는 옵션은 제외
+        for key in PROFILE_OPTIONS:
+            kwargs.pop(key, None)
+        return kwargs
+
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        for name, value in self.profile_options.get('pragmas', {}).items():
+            conn.execute(f'PRAGMA {name} = {value}')
+        return conn
+
+    def _start_transaction_under_autocommit(self):
+        mode = self.profile_options.get('transaction_mode')
+        if mode is None:
+            return super()._start_transaction_under_autocommit()
+        if mode.upper() not in TRANSACTION_MODES:
+            raise ImproperlyConfigured(
+                f"transaction_mode must be one of {', '.join(TRANSACTION_MODES)}, got {mode!r}"
+            )
+
+        retries = self.profile_options.get('lock_retries', DEFAULT_LOCK_RETRIES)
+        delay = self.profile_options.get('lock_retry_delay', DEFAULT_LOCK_RETRY_DELAY)
+        for attempt in range(retries + 1):
+            try:
+                self.cursor().execute(f'BEGIN {mode.upper()}')
+                return
+            except OperationalError as e:
+                if attempt == retries or not is_lock_error(e):
+                    raise
+            # 동시에 실패한 writer들이 한꺼번에 재시도하지 않도록 jitter
+            time.sleep(delay * 2 ** attempt * random.uniform(0.5, 1.0))
@@ -0,0 +1,92 @@
+"""
+Streaming JSON bodies for listings too large to build in memory.
+
+The envelope fields are written first, then the rows of a ``.iterator()``
+queryset (or any iterable) are encoded ``CHUNK_SIZE`` at a time, so peak
+memory is one chunk rather than the whole list plus its encoded copy. The
+bytes are exactly what ``JsonResponse`` would have produced for the same
+data. Views only stream once the row count, which they already know from an
+aggregate, reaches ``STREAMING_JSON_MIN_ROWS``. Smaller listings keep using
+``JsonResponse`` and the rendered-body cache. ``stream_json_lists`` writes
+several such lists one after another in a single body.
+"""
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+DEFAULT_MIN_ROWS = 1000
+CHUNK_SIZE = 2000
+
+# 행마다 encoder를 새로 만들지 않도록 한 번만 생성 (datetime은 DjangoJSONEncoder 형식)
+_encode = DjangoJSONEncoder().encode
+
+
+def should_stream(row_count):
+    """STREAMING_JSON_MIN_ROWS 이상이면 스트리밍 (None이면 스트리밍하지 않음)."""
+    min_rows = getattr(settings, 'STREAMING_JSON_MIN_ROWS', DEFAULT_MIN_ROWS)
+    return min_rows is not None and row_count >= min_rows
+
+
+def _chunk(rows, first):
+    return (b'' if first else b', ') + ', '.join(rows).encode()
+
+
+def _heads(fields, lists):
+    # JsonResponse와 같은 구분자로 '{...fields, "key1": [' 와 '], "key2": [' 를 만듦
+    head = _encode(fields)[:-1]
+    separator = ', ' if fields else ''
+    for key in lists:
+        yield (head + separator + _encode(key) + ': [').encode()
+        head, separator = ']', ', '
+
+
+def _body(fields, lists):
+    for head, rows in zip(_heads(fields, lists), lists.values()):
+        yield head
+        first = True
+        buffer = []
+        for row in rows:
+            buffer.append(_encode(row))
+            if len(buffer) == CHUNK_SIZE:
+                yield _chunk(buffer, first)
+                first = False
+                buffer = []
+        if buffer:
+            yield _chunk(buffer, first)
+    yield b']}'
+
+
+async def _abody(fields, lists):
+    for head, rows in zip(_heads(fields, lists), lists.values()):
+        yield head
+        first = True
+        buffer = []
+        async for row in rows:
+            buffer.append(_encode(row))
+            if len(buffer) == CHUNK_SIZE:
+                yield _chunk(buffer, first)
+                first = False
+                buffer = []
+        if buffer:
+            yield _chunk(buffer, first)
+    yield b']}'
+
+
+def stream_json(fields, key, rows):
+    """``{**fields, key: [rows...]}`` 를 스트리밍하는 응답. rows는 한 번만 순회됨."""
+    return stream_json_lists(fields, {key: rows})
+
+
+def astream_json(fields, key, rows):
+    """stream_json()의 async 버전. rows는 async iterable (ASGI에서 사용)."""
+    return astream_json_lists(fields, {key: rows})
+
+
+def stream_json_lists(fields, lists):
+    """``{**fields, key1: [...], key2: [...]}`` 를 스트리밍하는 응답. lists는 key -> rows (순서대로 기록)."""
+    return StreamingHttpResponse(_body(fields, lists), content_type='application/json')
+
+
+def astream_json_lists(fields, lists):
+    """stream_json_lists()의 async 버전. rows는 async iterable."""
+    return StreamingHttpResponse(_abody(fields, lists), content_type='application/json')
@@ -0,0 +1,557 @@
+import datetime
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from unittest import mock
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.cache import cache
+from django.db import OperationalError
+from django.db.utils import ConnectionHandler
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from BE import streaming
+from BE.metrics import registry
+from bench.preflight import FULL_CHAIN
+from course import membership, purge
+from course.models import Course
+from todo.models import ToDo
+from user.authentication import get_tokens_for_user
+from user.models import User
+
+
+class MetricsTest(TestCase):
+    def setUp(self):
+        registry.reset()
+        cache.clear()
+        self.teacher = User.objects.create_user(
+            user_id=1001, first_name='Professor', password='password', user_type='t'
+        )
+        self.course = Course.objects.create(name='Cloud', teacher=self.teacher)
+        self.headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(self.teacher)}"}
+
+    def test_records_view_metrics(self):
+        self.client.get(reverse('list_up_courses'), **self.headers)
+        self.client.get(reverse('list_up_courses'), **self.headers)
+        self.client.get(reverse('listup_todo', kwargs={'course_id': self.course.id}), **self.headers)
+        self.client.get('/no-such-page/')
+
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        body = response.content.decode()
+
+        self.assertIn('http_requests_total{view="list_up_courses",method="GET",status="200"} 2', body)
+        self.assertIn('http_requests_total{view="listup_todo",method="GET",status="200"} 1', body)
+        self.assertIn('http_requests_total{view="<unresolved>",method="GET",status="404"} 1', body)
+        self.assertIn('http_request_duration_seconds_bucket{view="list_up_courses",le="+Inf"} 2', body)
+        self.assertIn('http_request_duration_seconds_count{view="list_up_courses"} 2', body)
+        # JWT 사용자 조회 + 버전 집계 + 수업 조회, 두 번째는 캐시된 본문 사용
+        self.assertIn('db_queries_total{view="list_up_courses"} 5', body)
+        self.assertIn('db_query_duration_seconds_total{view="list_up_courses"}', body)
+
+    @override_settings(ROOT_URLCONF='BE.asgi_urls')
+    async def test_records_async_view_metrics(self):
+        headers = {'Authorization': self.headers['HTTP_AUTHORIZATION']}
+        response = await self.async_client.get(
+            reverse('listup_todo', kwargs={'course_id': self.course.id}), headers=headers
+        )
+        self.assertEqual(response.status_code, 200)
+
+        body = registry.render()
+        self.assertIn('http_requests_total{view="listup_todo",method="GET",status="200"} 1', body)
+        # sync_to_async 스레드에서 실행된 쿼리도 집계 (JWT 사용자 조회 + 수업 조회 + 버전 집계 + ToDo 조회)
+        self.assertIn('db_queries_total{view="listup_todo"} 4', body)
+
+
+    @override_settings(STREAMING_JSON_MIN_ROWS=0)
+    def test_streamed_listing_is_recorded_after_body(self):
+        ToDo.objects.bulk_create([ToDo(course=self.course, content=f'Step {i}') for i in range(3)])
+        response = self.client.get(reverse('listup_todo', kwargs={'course_id': self.course.id}), **self.headers)
+        self.assertTrue(response.streaming)
+        # 본문을 다 읽기 전에는 기록되지 않음
+        self.assertNotIn('view="listup_todo"', registry.render())
+
+        b''.join(response.streaming_content)
+        body = registry.render()
+        self.assertIn('http_requests_total{view="listup_todo",method="GET",status="200"} 1', body)
+        # JWT 사용자 조회 + 수업 조회 + 버전 집계 + 본문을 읽는 동안 실행된 ToDo 조회
+        self.assertIn('db_queries_total{view="listup_todo"} 4', body)
+
+    @override_settings(ROOT_URLCONF='BE.asgi_urls', STREAMING_JSON_MIN_ROWS=0)
+    async def test_async_streamed_listing_is_recorded_after_body(self):
+        headers = {'Authorization': self.headers['HTTP_AUTHORIZATION']}
+        response = await self.async_client.get(
+            reverse('get_course_progress', kwargs={'course_id': self.course.id}), headers=headers
+        )
+        self.assertTrue(response.streaming)
+        b''.join([chunk async for chunk in response.streaming_content])
+
+        body = registry.render()
+        self.assertIn('http_requests_total{view="get_course_progress",method="GET",status="200"} 1', body)
+        # JWT 사용자 조회 + 수업(+참여자 수) 조회 + 전체 To-Do COUNT + 학생별 완료 수 집계
+        self.assertIn('db_queries_total{view="get_course_progress"} 4', body)
+
+
+class CorsPreflightTest(TestCase):
+    origin = 'http://localhost:3000'
+
+    def preflight(self, origin=None):
+        return self.client.options(
+            reverse('create_course'), HTTP_ORIGIN=origin or self.origin, HTTP_ACCESS_CONTROL_REQUEST_METHOD='POST'
+        )
+
+    @staticmethod
+    def cors_headers(response):
+        return {k: v for k, v in response.items() if k.startswith('Access-Control-') or k == 'Vary'}
+
+    def test_skips_other_middleware(self):
+        registry.reset()
+        with mock.patch('django.contrib.sessions.middleware.SessionMiddleware.process_request') as session, \
+                self.assertNumQueries(0):
+            response = self.preflight()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['Access-Control-Max-Age'], str(settings.CORS_PREFLIGHT_MAX_AGE))
+        session.assert_not_called()
+        # MetricsMiddleware도 거치지 않음
+        self.assertNotIn('view=', registry.render())
+
+    def test_same_headers_as_corsheaders(self):
+        expected = self.cors_headers(self.preflight())
+        with override_settings(MIDDLEWARE=FULL_CHAIN):
+            response = self.preflight()
+        self.assertEqual(self.cors_headers(response), expected)
+        self.assertEqual(expected['Access-Control-Allow-Origin'], self.origin)
+        self.assertEqual(expected['Access-Control-Allow-Credentials'], 'true')
+
+    @override_settings(CORS_ALLOW_ALL_ORIGINS=False, CORS_ALLOWED_ORIGINS=['http://localhost:3000'])
+    def test_unknown_origin_falls_through(self):
+        response = self.preflight()
+        self.assertEqual(response['Access-Control-Allow-Origin'], self.origin)
+
+        # 허용되지 않은 origin은 CorsMiddleware가 처리 (check_request_enabled signal 확인, CORS 헤더 없음)
+        with mock.patch('corsheaders.middleware.CorsMiddleware.check_signal', return_value=False) as signal:
+            response = self.preflight('http://evil.example')
+        signal.assert_called()
+        self.assertNotIn('Access-Control-Allow-Origin', response)
+
+    def test_plain_options_not_intercepted(self):
+        response = self.client.options(reverse('create_course'), HTTP_ORIGIN=self.origin)
+        # Access-Control-Request-Method가 없으면 preflight가 아니므로 view까지 전달 (인증 필요)
+        self.assertEqual(response.status_code, 401)
+
+    async def test_async_handler(self):
+        response = await self.async_client.options(
+            reverse('create_course'), headers={'Origin': self.origin, 'Access-Control-Request-Method': 'POST'}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Access-Control-Allow-Origin'], self.origin)
+
+
+class BatchTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        membership.clear()
+        self.teacher = User.objects.create_user(
+            user_id=1001, first_name='Professor', password='password', user_type='t'
+        )
+        self.student = User.objects.create_user(
+            user_id=9001, first_name='Student', password='password', user_type='s'
+        )
+        self.course = Course.objects.create(name='Cloud', teacher=self.teacher)
+        self.course.participants.add(self.student)
+        ToDo.objects.create(course=self.course, content='Step 1')
+        self.teacher_headers = {"HTTP_AUTHORIZATION": f"Bearer {get_tokens_for_user(self.teacher)[1]}"}
+        self.student_headers = {"HTTP_AUTHORIZATION": f"Bearer {get_tokens_for_user(self.student)[1]}"}
+
+    def batch(self, requests, headers=None, **data):
+        return self.client.post(
+            reverse('batch'), json.dumps({'requests': requests, **data}), content_type='application/json',
+            **(self.teacher_headers if headers is None else headers)
+        )
+
+    def test_runs_sub_requests_in_order(self):
+        todo_url = reverse('listup_todo', kwargs={'course_id': self.course.id})
+        response = self.batch([
+            {'method': 'GET', 'path': reverse('enter_course', kwargs={'course_id': self.course.id})},
+            {'method': 'POST', 'path': reverse('add_todo', kwargs={'course_id': self.course.id}),
+             'body': {'todos': ['Step 2']}},
+            {'path': todo_url + '?limit=1'},
+            {'path': todo_url},
+        ])
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertFalse(body['rolled_back'])
+        self.assertEqual([r['status'] for r in body['responses']], [200, 201, 200, 200])
+        self.assertEqual(body['responses'][0]['body']['course_code'], self.course.code)
+        self.assertEqual(len(body['responses'][2]['body']['todo_list']), 1)
+        self.assertEqual([t['content'] for t in body['responses'][3]['body']['todo_list']], ['Step 1', 'Step 2'])
+
+    def test_sub_requests_keep_permissions(self):
+        response = self.batch([
+            {'path': reverse('get_course_progress', kwargs={'course_id': self.course.id})},
+            {'method': 'POST', 'path': reverse('complete_todo', kwargs={'course_id': self.course.id}),
+             'body': {'todo_ids': [ToDo.objects.get().id]}},
+        ], self.student_headers)
+        self.assertEqual([r['status'] for r in response.json()['responses']], [403, 200])
+
+    def test_inactive_user_is_rejected(self):
+        User.objects.filter(id=self.teacher.id).update(is_active=False)
+        response = self.batch([
+            {'method': 'POST', 'path': reverse('create_course'), 'body': {'name': 'Python'}},
+        ])
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(Course.objects.count(), 1)
+
+    @override_settings(JWT_DENYLIST_PATH=None)
+    def test_logout_revokes_later_sub_requests(self):
+        response = self.batch([
+            {'path': reverse('list_up_courses')},
+            {'method': 'POST', 'path': reverse('logout')},
+            {'path': reverse('list_up_courses')},
+            {'method': 'POST', 'path': reverse('create_course'), 'body': {'name': 'Python'}},
+        ])
+        self.assertEqual([r['status'] for r in response.json()['responses']], [200, 200, 401, 401])
+        self.assertEqual(Course.objects.count(), 1)
+
+    def test_atomic_rolls_back(self):
+        requests = [
+            {'method': 'POST', 'path': reverse('create_course'), 'body': {'name': 'Python'}},
+            {'method': 'DELETE', 'path': reverse('end_course', kwargs={'course_id': 9999})},
+            {'path': reverse('list_up_courses')},
+        ]
+        response = self.batch(requests, atomic=True)
+        body = response.json()
+        self.assertTrue(body['rolled_back'])
+        self.assertEqual([r['status'] for r in body['responses']], [201, 404, 424])
+        self.assertEqual(Course.objects.count(), 1)
+
+        # atomic이 아니면 실패한 요청과 관계없이 모두 실행
+        response = self.batch(requests)
+        self.assertFalse(response.json()['rolled_back'])
+        self.assertEqual([r['status'] for r in response.json()['responses']], [201, 404, 200])
+        self.assertEqual(Course.objects.count(), 2)
+
+    def test_rollback_drops_cached_membership(self):
+        course = Course.objects.create(name='Python', teacher=self.teacher)
+        enter_url = reverse('enter_course', kwargs={'course_id': course.id})
+        response = self.batch([
+            {'method': 'POST', 'path': reverse('register_course'), 'body': {'code': course.code}},
+            # 등록 직후 조회로 참여 여부가 캐시됨
+            {'path': enter_url},
+            {'method': 'POST', 'path': reverse('register_course'), 'body': {'code': 'nope'}},
+        ], self.student_headers, atomic=True)
+        body = response.json()
+        self.assertTrue(body['rolled_back'])
+        self.assertEqual([r['status'] for r in body['responses']], [200, 200, 404])
+
+        self.assertFalse(course.participants.exists())
+        self.assertFalse(membership._cached(course.id, self.student.id))
+        response = self.client.get(enter_url, **self.student_headers)
+        self.assertEqual(response.status_code, 403)
+
+    def test_invalid_sub_requests(self):
+        response = self.batch([
+            'not an object',
+            {'method': 'TRACE', 'path': '/course/list/'},
+            {'path': 'course/list/'},
+            {'method': 'POST', 'path': reverse('create_course'), 'body': 'name'},
+            {'path': '/no-such-page/'},
+            {'method': 'POST', 'path': reverse('batch'), 'body': {'requests': []}},
+        ])
+        self.assertEqual([r['status'] for r in response.json()['responses']], [400, 400, 400, 400, 404, 400])
+
+    def test_invalid_batch(self):
+        self.assertEqual(self.batch([]).status_code, 400)
+        self.assertEqual(self.batch([{'path': '/course/list/'}], atomic='yes').status_code, 400)
+        with override_settings(BATCH_MAX_REQUESTS=2):
+            response = self.batch([{'path': '/course/list/'}] * 3)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error'], 'Too many requests (max 2)')
+        response = self.client.post(reverse('batch'), {'requests': []}, content_type='application/json')
+        self.assertEqual(response.status_code, 401)
+
+    def test_work_limits(self):
+        requests = [{'path': reverse('list_up_courses')}] * 3
+        # 두 번째 요청 전에 BATCH_MAX_SECONDS가 지남
+        with mock.patch('BE.batch.time.monotonic', side_effect=[0, 0, 11, 11]):
+            response = self.batch(requests)
+        self.assertEqual([r['status'] for r in response.json()['responses']], [200, 503, 503])
+
+        size = len(self.client.get(reverse('list_up_courses'), **self.teacher_headers).content)
+        with override_settings(BATCH_MAX_RESPONSE_BYTES=size * 2 + 1):
+            response = self.batch(requests)
+        self.assertEqual([r['status'] for r in response.json()['responses']], [200, 200, 413])
+
+    @override_settings(STREAMING_JSON_MIN_ROWS=0)
+    def test_streamed_sub_response(self):
+        response = self.batch([{'path': reverse('listup_todo', kwargs={'course_id': self.course.id})}])
+        self.assertEqual(response.json()['responses'][0]['body']['todo_list'][0]['content'], 'Step 1')
+
+
+class StreamingJsonTest(SimpleTestCase):
+    def body(self, fields, key, rows):
+        return b''.join(streaming.stream_json(fields, key, iter(rows)).streaming_content)
+
+    def test_same_bytes_as_json_response(self):
+        created_at = datetime.datetime(2024, 3, 1, 9, 30, 15, 123456, tzinfo=datetime.timezone.utc)
+        rows = [{'id': i, 'content': f'Step "{i}"', 'created_at': created_at} for i in range(7)]
+        fields = {'course_name': '클라우드', 'user_name': 'Professor'}
+        # chunk 경계(3개씩)를 여러 번 넘도록
+        with mock.patch.object(streaming, 'CHUNK_SIZE', 3):
+            for count in [0, 1, 3, 7]:
+                expected = json.dumps({**fields, 'participants': rows[:count]}, cls=DjangoJSONEncoder)
+                self.assertEqual(self.body(fields, 'participants', rows[:count]), expected.encode())
+        self.assertEqual(self.body({}, 'todo_list', rows[:2]), json.dumps(
+            {'todo_list': rows[:2]}, cls=DjangoJSONEncoder
+        ).encode())
+
+    def test_several_lists(self):
+        lists = {'todo_list': [{'id': i} for i in range(5)], 'participants': [], 'extra': [{'id': 'x'}]}
+        with mock.patch.object(streaming, 'CHUNK_SIZE', 2):
+            for fields in [{}, {'course_name': 'Cloud'}]:
+                response = streaming.stream_json_lists(fields, {key: iter(rows) for key, rows in lists.items()})
+                expected = json.dumps({**fields, **lists}, cls=DjangoJSONEncoder)
+                self.assertEqual(b''.join(response.streaming_content), expected.encode())
+
+    def test_chunks_are_bounded(self):
+        with mock.patch.object(streaming, 'CHUNK_SIZE', 100):
+            chunks = list(streaming.stream_json({}, 'rows', ({'id': i} for i in range(1000))).streaming_content)
+        # 여는 부분 + 10개 chunk + 닫는 부분
+        self.assertEqual(len(chunks), 12)
+
+    @override_settings(STREAMING_JSON_MIN_ROWS=None)
+    def test_streaming_disabled(self):
+        self.assertFalse(streaming.should_stream(10 ** 6))
+
+
+class SQLiteProfileTest(SimpleTestCase):
+    # 테스트 DB는 메모리 DB라 WAL이 적용되지 않으므로 임시 파일 DB로 확인
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        database = {
+            'ENGINE': 'BE.sqlite',
+            'NAME': os.path.join(directory.name, 'profile.sqlite3'),
+            'OPTIONS': settings.DATABASES['default']['OPTIONS'],
+        }
+        self.connections = ConnectionHandler({
+            'default': database,
+            # reader는 busy timeout 0: 한 번이라도 lock을 기다려야 하면 바로 실패
+            'reader': {**database, 'OPTIONS': {**database['OPTIONS'], 'timeout': 0}},
+            'contender': {**database, 'OPTIONS': {
+                **database['OPTIONS'], 'timeout': 0.01, 'lock_retries': 2, 'lock_retry_delay': 0.01,
+            }},
+            'patient': {**database, 'OPTIONS': {
+                **database['OPTIONS'], 'timeout': 0.01, 'lock_retries': 5, 'lock_retry_delay': 0.05,
+            }},
+        })
+        self.writer = self.connect('default')
+        with self.writer.cursor() as cursor:
+            cursor.execute('CREATE TABLE item (id INTEGER PRIMARY KEY, value TEXT)')
+
+    def connect(self, alias):
+        connection = self.connections.create_connection(alias)
+        self.addCleanup(connection.close)
+        return connection
+
+    @staticmethod
+    @contextmanager
+    def atomic(connection):
+        # transaction.atomic()과 같은 방식으로 트랜잭션 시작
+        connection.set_autocommit(False, force_begin_transaction_with_broken_autocommit=True)
+        try:
+            yield connection.cursor()
+            connection.commit()
+        finally:
+            connection.set_autocommit(True)
+
+    def test_pragmas_applied(self):
+        with self.writer.cursor() as cursor:
+            self.assertEqual(cursor.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+            self.assertEqual(cursor.execute('PRAGMA synchronous').fetchone()[0], 1)  # NORMAL
+            self.assertEqual(cursor.execute('PRAGMA temp_store').fetchone()[0], 2)  # MEMORY
+            self.assertEqual(cursor.execute('PRAGMA busy_timeout').fetchone()[0], 5000)
+
+    def test_write_lock_taken_at_begin(self):
+        contender = self.connect('contender')
+        with self.atomic(self.writer):
+            # 아직 아무것도 쓰지 않았어도 다른 writer는 lock을 얻지 못함
+            with mock.patch('BE.sqlite.base.time.sleep') as sleep:
+                with self.assertRaises(OperationalError):
+                    with self.atomic(contender):
+                        pass
+            # 재시도 횟수는 lock_retries로 제한됨
+            self.assertEqual(sleep.call_count, 2)
+
+    def test_lock_retry_succeeds_after_release(self):
+        contender = self.connect('patient')
+        self.writer.set_autocommit(False, force_begin_transaction_with_broken_autocommit=True)
+        self.writer.inc_thread_sharing()
+        self.addCleanup(self.writer.dec_thread_sharing)
+        release = threading.Timer(0.05, self.writer.commit)
+        release.start()
+        self.addCleanup(release.join)
+
+        with self.atomic(contender) as cursor:
+            cursor.execute("INSERT INTO item (value) VALUES ('after retry')")
+        self.writer.set_autocommit(True)
+        with self.writer.cursor() as cursor:
+            self.assertEqual(cursor.execute('SELECT COUNT(*) FROM item').fetchone()[0], 1)
+
+    def test_readers_never_block(self):
+        stop = threading.Event()
+        errors = []
+        reads = []
+
+        def write():
+            writer = self.connections.create_connection('default')
+            try:
+                while not stop.is_set():
+                    with self.atomic(writer) as cursor:
+                        cursor.executemany(
+                            'INSERT INTO item (value) VALUES (%s)', [('x' * 100,)] * 200
+                        )
+                        # 커밋 전까지 write lock을 잡고 있는 시간
+                        time.sleep(0.005)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                writer.close()
+
+        def read():
+            reader = self.connections.create_connection('reader')
+            count = 0
+            try:
+                while not stop.is_set():
+                    with reader.cursor() as cursor:
+                        cursor.execute('SELECT COUNT(*) FROM item')
+                        cursor.fetchone()
+                    count += 1
+            except Exception as e:
+                errors.append(e)
+            finally:
+                reader.close()
+            reads.append(count)
+
+        threads = [threading.Thread(target=write)] + [threading.Thread(target=read) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.5)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertTrue(all(count > 0 for count in reads))
+        with self.writer.cursor() as cursor:
+            self.assertGreater(cursor.execute('SELECT COUNT(*) FROM item').fetchone()[0], 0)
+
+
+class QueryPlanTest(TestCase):
+    """각 view가 실행하는 쿼리의 EXPLAIN QUERY PLAN에 전체 스캔/정렬용 임시 B-tree가 없어야 함."""
+    def setUp(self):
+        cache.clear()
+        membership.clear()
+        self.teacher = User.objects.create_user(
+            user_id=1001, first_name='Professor', password='password', user_type='t'
+        )
+        self.student = User.objects.create_user(
+            user_id=9001, first_name='Student', password='password', user_type='s'
+        )
+        self.student2 = User.objects.create_user(
+            user_id=9002, first_name='Student2', password='password', user_type='s'
+        )
+        self.course = Course.objects.create(name='Cloud', teacher=self.teacher)
+        self.other_course = Course.objects.create(name='Python', teacher=self.teacher)
+        self.course.participants.add(self.student)
+        self.other_course.participants.add(self.student)
+        self.todos = ToDo.objects.bulk_create([ToDo(course=self.course, content=f'Step {i}') for i in range(5)])
+        self.todos[0].completed_by.add(self.student)
+
+    @staticmethod
+    def plan(sql):
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return [row[3] for row in cursor.fetchall()]
+
+    def assertIndexed(self, method, url, user=None, allow=(), **kwargs):
+        if user is not None:
+            kwargs['HTTP_AUTHORIZATION'] = f'Bearer {get_tokens_for_user(user)[1]}'
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(self.client, method)(url, **kwargs)
+        self.assertLess(response.status_code, 400, response.content)
+
+        checked = 0
+        for query in queries:
+            if not query['sql'].startswith(('SELECT', 'UPDATE', 'DELETE')):
+                continue
+            checked += 1
+            for detail in self.plan(query['sql']):
+                if detail in allow:
+                    continue
+                full_scan = detail.startswith('SCAN ') and detail != 'SCAN CONSTANT ROW'
+                self.assertFalse(full_scan or 'TEMP B-TREE' in detail, f'{detail}\n{query["sql"]}')
+        self.assertGreater(checked, 0)
+
+    def post(self, url, user, data):
+        return self.assertIndexed('post', url, user, data=json.dumps(data), content_type='application/json')
+
+    def test_course_listing(self):
+        url = reverse('list_up_courses')
+        for params in [{}, {'limit': 1}]:
+            self.assertIndexed('get', url, self.teacher, data=params)
+            self.assertIndexed('get', url, self.student, data={})
+        # 학생의 수업은 참여자 테이블에서 찾으므로 수업의 (created_at, id) 순서는 인덱스로 얻을 수 없음.
+        # 정렬 대상은 그 학생의 수강 목록으로 한정됨
+        self.assertIndexed('get', url, self.student, data={'limit': 1}, allow=('USE TEMP B-TREE FOR ORDER BY',))
+
+    def test_course_views(self):
+        self.assertIndexed('get', reverse('enter_course', kwargs={'course_id': self.course.id}), self.student)
+        self.assertIndexed('get', reverse('get_course_progress', kwargs={'course_id': self.course.id}), self.teacher)
+        self.post(reverse('register_course'), self.student2, {'code': self.course.code})
+        self.post(
+            reverse('enroll_students', kwargs={'course_id': self.other_course.id}), self.teacher,
+            {'user_ids': [self.student.user_id, self.student2.user_id]},
+        )
+        workspace_url = reverse('get_course_workspace', kwargs={'course_id': self.course.id})
+        self.assertIndexed('get', workspace_url, self.teacher)
+        self.assertIndexed('get', workspace_url, self.student)
+        self.assertIndexed('delete', reverse('end_course', kwargs={'course_id': self.course.id}), self.teacher)
+
+    def test_course_purge(self):
+        self.course.end()
+        with CaptureQueriesContext(connection) as queries:
+            purge.purge_ended_courses(batch_size=2, pause=0)
+        self.assertFalse(Course.all_objects.filter(id=self.course.id).exists())
+        for query in queries:
+            if query['sql'].startswith(('SELECT', 'DELETE')):
+                for detail in self.plan(query['sql']):
+                    self.assertFalse(detail.startswith('SCAN ') or 'TEMP B-TREE' in detail, f'{detail}\n{query["sql"]}')
+
+    def test_todo_views(self):
+        url = reverse('listup_todo', kwargs={'course_id': self.course.id})
+        for params in [{}, {'limit': 2}]:
+            self.assertIndexed('get', url, self.student, data=params)
+        self.post(reverse('add_todo', kwargs={'course_id': self.course.id}), self.teacher, {'todos': ['Step 5']})
+        complete_url = reverse('complete_todo', kwargs={'course_id': self.course.id})
+        ids = [todo.id for todo in self.todos[:3]]
+        self.post(complete_url, self.student, {'todo_ids': ids})
+        self.post(complete_url, self.student, {'todo_ids': ids, 'completed': False})
+
+    def test_login_looks_up_user_id(self):
+        self.assertIndexed(
+            'post', reverse('login'),
+            data=json.dumps({'user_id': 1001, 'password': 'password', 'user_type': 't'}),
+            content_type='application/json',
+        )
@@ -16,6 +16,8 @@ Including another URLconf
 """
 # from django.contrib import admin
 from django.urls import path, include
+from BE.batch import batch_view
+from BE.metrics import metrics_view
 from course.views import create_course
 from user import views
 
@@ -26,4 +28,6 @@ urlpatterns = [
     path('logout/', views.logout_view, name='logout'),
     path('course/', include('course.urls')),
     path("", include("todo.urls")),
+    path('metrics/', metrics_view, name='metrics'),
+    path('batch/', batch_view, name='batch'),
 ]
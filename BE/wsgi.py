@@ -14,3 +14,13 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'BE.settings')
 
 application = get_wsgi_application()
+
+# 세션 로그인을 쓰는 경우 만료된 세션을 백그라운드에서 정리 (user/sessions.py)
+from user.sessions import start_background_purge  # noqa: E402
+
+start_background_purge()
+
+# 이전 프로세스가 삭제하지 못한 종료된 수업이 남아 있으면 이어서 삭제 (course/purge.py)
+from course.purge import enqueue  # noqa: E402
+
+enqueue()
@@ -0,0 +1,118 @@
+"""
+WSGI vs ASGI throughput for the read endpoints.
+
+Both sides run in-process against the same seeded database, so the numbers
+compare the request handling models rather than a particular server:
+
+* WSGI: a fixed pool of worker threads (like gunicorn ``--threads``) drives
+  ``BE.urls`` with the sync test client; a slow client occupies a thread for
+  its whole delay.
+* ASGI: one event loop drives ``BE.asgi_urls`` with the async test client;
+  a slow client only suspends its coroutine.
+
+``client_delay`` models the time a slow client keeps the connection busy.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection
+from django.test import AsyncClient, Client, override_settings
+from django.urls import reverse
+
+from .runner import auth_headers, latency_summary
+from .seed import seed
+
+READ_ENDPOINTS = ('list_up_courses', 'enter_course', 'get_course_progress', 'listup_todo')
+
+
+def endpoint_requests(data):
+    """엔드포인트 이름 -> (path, 인증 사용자)."""
+    teacher = data['teachers'][0]
+    course = next(c for c in data['courses'] if c.teacher_id == teacher.id)
+    student = next(s for s in data['students'] if s.id in data['course_participants'][course.id])
+    return {
+        'list_up_courses': (reverse('list_up_courses'), teacher),
+        'enter_course': (reverse('enter_course', kwargs={'course_id': course.id}), student),
+        'get_course_progress': (reverse('get_course_progress', kwargs={'course_id': course.id}), teacher),
+        'listup_todo': (reverse('listup_todo', kwargs={'course_id': course.id}), student),
+    }
+
+
+def run_wsgi(path, authorization, requests, threads, client_delay):
+    local = threading.local()
+
+    def one_request(_):
+        if not hasattr(local, 'client'):
+            local.client = Client()
+        start = time.perf_counter()
+        # 느린 클라이언트가 worker 스레드를 점유하는 시간
+        time.sleep(client_delay)
+        local.client.get(path, HTTP_AUTHORIZATION=authorization)
+        return time.perf_counter() - start
+
+    def close_connection(_):
+        connection.close()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        latencies = list(executor.map(one_request, range(requests)))
+        list(executor.map(close_connection, range(threads)))
+    return latencies, time.perf_counter() - start
+
+
+async def run_asgi(path, authorization, requests, clients, client_delay):
+    client = AsyncClient()
+    semaphore = asyncio.Semaphore(clients)
+
+    async def one_request():
+        async with semaphore:
+            start = time.perf_counter()
+            # 느린 클라이언트를 기다리는 동안 event loop는 다른 요청을 처리
+            await asyncio.sleep(client_delay)
+            await client.get(path, headers={'Authorization': authorization})
+            return time.perf_counter() - start
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(one_request() for _ in range(requests)))
+    return list(latencies), time.perf_counter() - start
+
+
+def run_concurrency_benchmark(requests=500, threads=4, clients=100, client_delay=0.05, endpoints=None,
+                              **seed_options):
+    data = seed(**seed_options)
+    targets = endpoint_requests(data)
+    results = {}
+    for name in endpoints or READ_ENDPOINTS:
+        path, user = targets[name]
+        authorization = auth_headers(user)['HTTP_AUTHORIZATION']
+
+        with override_settings(ROOT_URLCONF='BE.urls'):
+            wsgi_latencies, wsgi_seconds = run_wsgi(path, authorization, requests, threads, client_delay)
+        with override_settings(ROOT_URLCONF='BE.asgi_urls'):
+            asgi_latencies, asgi_seconds = asyncio.run(
+                run_asgi(path, authorization, requests, clients, client_delay)
+            )
+
+        results[name] = {
+            'wsgi': {
+                'requests_per_second': round(requests / wsgi_seconds, 2),
+                **latency_summary(wsgi_latencies),
+            },
+            'asgi': {
+                'requests_per_second': round(requests / asgi_seconds, 2),
+                **latency_summary(asgi_latencies),
+            },
+        }
+
+    return {
+        'meta': {
+            'requests': requests,
+            'wsgi_threads': threads,
+            'asgi_clients': clients,
+            'client_delay_ms': client_delay * 1000,
+            'dataset': data['counts'],
+        },
+        'endpoints': results,
+    }
@@ -0,0 +1,143 @@
+"""
+Login throughput: logins per second at a given concurrency and hash cost.
+
+* WSGI: ``concurrency`` worker threads call ``login_view``; each thread
+  blocks until its hash is done on the hashing pool.
+* ASGI: one event loop keeps ``concurrency`` logins in flight against
+  ``alogin_view`` and awaits the hashing pool.
+
+While the logins run, a probe client keeps requesting ``list_up_courses``.
+The report therefore also shows how much a login storm slows down the
+other endpoints.
+"""
+import asyncio
+import itertools
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+from django.conf import settings
+from django.db import connection
+from django.test import AsyncClient, Client, override_settings
+from django.urls import reverse
+
+from user import hashing
+
+from .runner import auth_headers, latency_summary
+from .seed import PASSWORD, seed
+
+
+def login_bodies(students, logins):
+    users = itertools.cycle(students)
+    return [
+        json.dumps({'user_id': next(users).user_id, 'password': PASSWORD, 'user_type': 's'})
+        for _ in range(logins)
+    ]
+
+
+def mode_report(latencies, statuses, seconds, probe_latencies):
+    return {
+        'logins_per_second': round(len(latencies) / seconds, 2),
+        'failures': sum(status != 200 for status in statuses),
+        **latency_summary(latencies),
+        # 로그인이 몰리는 동안 다른 엔드포인트의 지연 시간
+        'probe': latency_summary(probe_latencies) if probe_latencies else None,
+    }
+
+
+def run_wsgi(bodies, concurrency, probe_path, probe_authorization):
+    local = threading.local()
+    done = threading.Event()
+    probe_latencies = []
+
+    def one_login(body):
+        if not hasattr(local, 'client'):
+            local.client = Client()
+        start = time.perf_counter()
+        response = local.client.post(reverse('login'), data=body, content_type='application/json')
+        return time.perf_counter() - start, response.status_code
+
+    def probe():
+        client = Client()
+        while not done.is_set():
+            start = time.perf_counter()
+            client.get(probe_path, HTTP_AUTHORIZATION=probe_authorization)
+            probe_latencies.append(time.perf_counter() - start)
+        connection.close()
+
+    def close_connection(_):
+        connection.close()
+
+    probe_thread = threading.Thread(target=probe)
+    probe_thread.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        results = list(executor.map(one_login, bodies))
+        seconds = time.perf_counter() - start
+        list(executor.map(close_connection, range(concurrency)))
+    done.set()
+    probe_thread.join()
+
+    latencies, statuses = zip(*results)
+    return mode_report(latencies, statuses, seconds, probe_latencies)
+
+
+async def run_asgi(bodies, concurrency, probe_path, probe_authorization):
+    client = AsyncClient()
+    semaphore = asyncio.Semaphore(concurrency)
+    done = asyncio.Event()
+    probe_latencies = []
+
+    async def one_login(body):
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(reverse('login'), data=body, content_type='application/json')
+            return time.perf_counter() - start, response.status_code
+
+    async def probe():
+        while not done.is_set():
+            start = time.perf_counter()
+            await client.get(probe_path, headers={'Authorization': probe_authorization})
+            probe_latencies.append(time.perf_counter() - start)
+
+    probe_task = asyncio.create_task(probe())
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one_login(body) for body in bodies))
+    seconds = time.perf_counter() - start
+    done.set()
+    await probe_task
+
+    latencies, statuses = zip(*results)
+    return mode_report(latencies, statuses, seconds, probe_latencies)
+
+
+def run_login_benchmark(logins=200, concurrency=20, users=50, iterations=None):
+    """
+    users명의 학생을 만든 뒤 WSGI/ASGI 각각 logins번 로그인한 결과 report(dict)를 반환.
+    iterations를 주면 그 PBKDF2 비용으로 해시한 계정으로 측정.
+    """
+    cost = override_settings(PASSWORD_HASH_ITERATIONS=iterations) if iterations else nullcontext()
+    with cost:
+        data = seed(students=users, teachers=1, courses=1, todos=10, enrollments=1)
+        bodies = login_bodies(data['students'], logins)
+        probe_path = reverse('list_up_courses')
+        probe_authorization = auth_headers(data['teachers'][0])['HTTP_AUTHORIZATION']
+
+        with override_settings(ROOT_URLCONF='BE.urls'):
+            wsgi = run_wsgi(bodies, concurrency, probe_path, probe_authorization)
+        with override_settings(ROOT_URLCONF='BE.asgi_urls'):
+            asgi = asyncio.run(run_asgi(bodies, concurrency, probe_path, probe_authorization))
+
+        return {
+            'meta': {
+                'logins': logins,
+                'concurrency': concurrency,
+                'users': users,
+                'hash_iterations': settings.PASSWORD_HASH_ITERATIONS,
+                'hashing_workers': hashing.workers(),
+            },
+            'wsgi': wsgi,
+            'asgi': asgi,
+        }
@@ -0,0 +1,47 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from bench.runner import run_benchmark, throwaway_database
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway test database with bulk data and report p50/p95/p99 latency "
+        "and SQL query count for every endpoint as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=10000)
+        parser.add_argument('--teachers', type=int, default=50)
+        parser.add_argument('--courses', type=int, default=500)
+        parser.add_argument('--todos', type=int, default=50000)
+        parser.add_argument('--enrollments', type=int, default=5, help="Courses per student")
+        parser.add_argument('--completion-ratio', type=float, default=0.1)
+        parser.add_argument('--iterations', type=int, default=30, help="Requests per endpoint")
+        parser.add_argument('--endpoint', action='append', dest='endpoints', help="Only run these URL names")
+        parser.add_argument('--output', default='bench_output.json')
+
+    def handle(self, *args, **options):
+        with throwaway_database():
+            report = run_benchmark(
+                iterations=options['iterations'],
+                endpoints=options['endpoints'],
+                students=options['students'],
+                teachers=options['teachers'],
+                courses=options['courses'],
+                todos=options['todos'],
+                enrollments=options['enrollments'],
+                completion_ratio=options['completion_ratio'],
+            )
+
+        with open(options['output'], 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+        for name, result in report['endpoints'].items():
+            self.stdout.write(
+                f"{name:<22} p50 {result['p50_ms']:>9.2f}ms  p95 {result['p95_ms']:>9.2f}ms  "
+                f"p99 {result['p99_ms']:>9.2f}ms  queries {result['queries_median']}"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
@@ -0,0 +1,50 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from bench.concurrency import READ_ENDPOINTS, run_concurrency_benchmark
+from bench.runner import throwaway_database
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare WSGI (thread pool, sync views) and ASGI (event loop, async views) throughput "
+        "for the read endpoints with simulated slow clients."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=2000)
+        parser.add_argument('--teachers', type=int, default=20)
+        parser.add_argument('--courses', type=int, default=100)
+        parser.add_argument('--todos', type=int, default=10000)
+        parser.add_argument('--requests', type=int, default=500, help="Requests per endpoint and server")
+        parser.add_argument('--threads', type=int, default=4, help="WSGI worker threads")
+        parser.add_argument('--clients', type=int, default=100, help="Concurrent ASGI clients")
+        parser.add_argument('--client-delay-ms', type=float, default=50.0, help="Time each slow client holds a request")
+        parser.add_argument('--endpoint', action='append', dest='endpoints', choices=READ_ENDPOINTS)
+        parser.add_argument('--output', default='bench_asgi_output.json')
+
+    def handle(self, *args, **options):
+        with throwaway_database():
+            report = run_concurrency_benchmark(
+                requests=options['requests'],
+                threads=options['threads'],
+                clients=options['clients'],
+                client_delay=options['client_delay_ms'] / 1000,
+                endpoints=options['endpoints'],
+                students=options['students'],
+                teachers=options['teachers'],
+                courses=options['courses'],
+                todos=options['todos'],
+            )
+
+        with open(options['output'], 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+        for name, result in report['endpoints'].items():
+            self.stdout.write(
+                f"{name:<22} wsgi {result['wsgi']['requests_per_second']:>9.1f} req/s  "
+                f"asgi {result['asgi']['requests_per_second']:>9.1f} req/s"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
@@ -0,0 +1,43 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from bench.logins import run_login_benchmark
+from bench.runner import throwaway_database
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure logins per second at a given concurrency and PBKDF2 cost (WSGI threads vs ASGI "
+        "event loop), and the latency of another endpoint during the login storm."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--logins', type=int, default=200)
+        parser.add_argument('--concurrency', type=int, default=20, help="Logins in flight at once")
+        parser.add_argument('--users', type=int, default=50, help="Distinct accounts to log in with")
+        parser.add_argument('--iterations', type=int, help="PBKDF2 iterations (default: PASSWORD_HASH_ITERATIONS)")
+        parser.add_argument('--output', default='bench_login_output.json')
+
+    def handle(self, *args, **options):
+        # 로그인은 last_login/세션을 여러 스레드에서 동시에 쓰므로 파일 DB(WAL) 사용
+        with throwaway_database(on_disk=True):
+            report = run_login_benchmark(
+                logins=options['logins'],
+                concurrency=options['concurrency'],
+                users=options['users'],
+                iterations=options['iterations'],
+            )
+
+        with open(options['output'], 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+        for mode in ('wsgi', 'asgi'):
+            result = report[mode]
+            probe = result['probe']
+            self.stdout.write(
+                f"{mode}  {result['logins_per_second']:>8.1f} logins/s  p99 {result['p99_ms']:>9.1f} ms  "
+                f"probe p99 {probe['p99_ms'] if probe else float('nan'):>9.1f} ms"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
@@ -0,0 +1,33 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from bench.memory import run_memory_benchmark
+from bench.runner import throwaway_database
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare peak memory of get_course_progress and listup_todo on one large course, "
+        "buffered (JsonResponse) versus streamed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100000, help="Participants and to-dos in the course")
+        parser.add_argument('--output', default='bench_memory_output.json')
+
+    def handle(self, *args, **options):
+        with throwaway_database():
+            report = run_memory_benchmark(rows=options['rows'])
+
+        with open(options['output'], 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+        for name, result in report['endpoints'].items():
+            for mode in ('buffered', 'streamed'):
+                self.stdout.write(
+                    f"{name:<22} {mode:<9} peak {result[mode]['peak_mb']:>9.2f} MB  "
+                    f"{result[mode]['seconds']:>7.2f}s  {result[mode]['bytes']} bytes"
+                )
+        self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
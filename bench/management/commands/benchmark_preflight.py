@@ -0,0 +1,31 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from bench.preflight import run_preflight_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the server-side cost of a CORS preflight with the fast-path middleware "
+        "versus the full middleware chain."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=5000)
+        parser.add_argument('--output', default='bench_preflight_output.json')
+
+    def handle(self, *args, **options):
+        report = run_preflight_benchmark(requests=options['requests'])
+
+        with open(options['output'], 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+        for name in ('fast_path', 'full_chain'):
+            result = report[name]
+            self.stdout.write(
+                f"{name:<11} mean {result['mean_ms'] * 1000:>8.1f}us  p50 {result['p50_ms'] * 1000:>8.1f}us  "
+                f"p99 {result['p99_ms'] * 1000:>8.1f}us  max-age {result['max_age']}"
+            )
+        self.stdout.write(self.style.SUCCESS(f"{report['speedup']}x faster, wrote {options['output']}"))
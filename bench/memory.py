@@ -0,0 +1,77 @@
+"""
+Peak memory of the large listings, buffered (``JsonResponse``) versus streamed.
+
+One course gets ``rows`` participants and ``rows`` to-dos. Then
+``get_course_progress`` and ``listup_todo`` are requested once with
+streaming disabled and once with it forced on. ``tracemalloc`` records the
+peak Python allocation from the request until the last byte of the body is
+read. The streamed body is read chunk by chunk and then discarded, the way a
+server writes it to the socket.
+"""
+import time
+import tracemalloc
+
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from .runner import auth_headers
+from .seed import seed
+
+MODES = {
+    'buffered': {'STREAMING_JSON_MIN_ROWS': None},
+    'streamed': {'STREAMING_JSON_MIN_ROWS': 0},
+}
+
+
+def measure(client, path, headers):
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        response = client.get(path, **headers)
+        if response.streaming:
+            size = 0
+            for chunk in response.streaming_content:
+                size += len(chunk)
+        else:
+            size = len(response.content)
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        'status': response.status_code,
+        'streaming': response.streaming,
+        'bytes': size,
+        'peak_mb': round(peak / 2 ** 20, 2),
+        'seconds': round(seconds, 3),
+    }
+
+
+def run_memory_benchmark(rows=100000):
+    """
+    참여자/To-Do가 rows개인 수업 하나를 만들고 두 방식의 최대 메모리 사용량을 비교한 report를 반환.
+    호출하는 쪽에서 테스트용 DB를 준비해야 함 (benchmark_memory 명령 참고).
+    """
+    data = seed(students=rows, courses=1, todos=rows, teachers=1, enrollments=1, completion_ratio=0)
+    course = data['courses'][0]
+    headers = auth_headers(data['teachers'][0])
+    paths = {
+        'get_course_progress': reverse('get_course_progress', kwargs={'course_id': course.id}),
+        'listup_todo': reverse('listup_todo', kwargs={'course_id': course.id}),
+    }
+
+    client = Client()
+    results = {}
+    for name, path in paths.items():
+        results[name] = {}
+        for mode, overrides in MODES.items():
+            # 렌더링된 본문 캐시를 끄고 매번 조회/직렬화
+            with override_settings(RESPONSE_CACHE_TTL=0, **overrides):
+                results[name][mode] = measure(client, path, headers)
+        buffered, streamed = results[name]['buffered'], results[name]['streamed']
+        results[name]['peak_ratio'] = round(buffered['peak_mb'] / streamed['peak_mb'], 1) if streamed['peak_mb'] else None
+
+    return {
+        'meta': {'rows': rows, 'dataset': data['counts']},
+        'endpoints': results,
+    }
@@ -0,0 +1,100 @@
+"""
+Per-preflight server cost: fast path versus the full middleware chain.
+
+Browser preflights are sent straight to a ``WSGIHandler`` built from two
+middleware lists:
+
+* ``fast_path``: the project's ``MIDDLEWARE`` (``PreflightMiddleware`` first).
+* ``full_chain``: the previous layout, with no ``PreflightMiddleware`` and
+  ``CorsMiddleware`` last, so every preflight runs the security, session,
+  CSRF, auth and messages middleware first.
+
+Calling the handler directly, with no test client, measures only the time
+spent inside Django.
+"""
+import time
+from io import BytesIO
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.test import override_settings
+from django.urls import reverse
+
+from .runner import latency_summary
+
+# preflight fast path 이전의 MIDDLEWARE (CorsMiddleware가 마지막)
+FULL_CHAIN = [
+    'BE.metrics.MetricsMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'corsheaders.middleware.CorsMiddleware',
+]
+
+
+def preflight_environ(path):
+    return {
+        'REQUEST_METHOD': 'OPTIONS',
+        'PATH_INFO': path,
+        'SCRIPT_NAME': '',
+        'QUERY_STRING': '',
+        'SERVER_NAME': 'testserver',
+        'SERVER_PORT': '80',
+        'SERVER_PROTOCOL': 'HTTP/1.1',
+        'HTTP_HOST': 'testserver',
+        'HTTP_ORIGIN': 'http://localhost:3000',
+        'HTTP_ACCESS_CONTROL_REQUEST_METHOD': 'POST',
+        'HTTP_ACCESS_CONTROL_REQUEST_HEADERS': 'authorization, content-type',
+        'wsgi.input': BytesIO(),
+        'wsgi.url_scheme': 'http',
+        'wsgi.errors': BytesIO(),
+        'wsgi.multithread': False,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+        'wsgi.version': (1, 0),
+    }
+
+
+def measure(handler, path, requests):
+    latencies = []
+    statuses = set()
+    headers = {}
+
+    def start_response(status, response_headers):
+        statuses.add(int(status.split()[0]))
+        headers.update(response_headers)
+
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = handler(preflight_environ(path), start_response)
+        response.close()
+        latencies.append(time.perf_counter() - start)
+
+    return {
+        **latency_summary(latencies),
+        'status_codes': sorted(statuses),
+        'max_age': headers.get('Access-Control-Max-Age'),
+    }
+
+
+def run_preflight_benchmark(requests=5000):
+    """두 middleware 구성에서 preflight requests개를 처리한 report(dict)를 반환."""
+    path = reverse('create_course')
+    results = {}
+    for name, middleware in [('fast_path', settings.MIDDLEWARE), ('full_chain', FULL_CHAIN)]:
+        with override_settings(MIDDLEWARE=middleware):
+            handler = WSGIHandler()
+            # 첫 요청의 지연 로딩은 제외
+            measure(handler, path, 10)
+            results[name] = measure(handler, path, requests)
+
+    fast, full = results['fast_path'], results['full_chain']
+    return {
+        'meta': {'requests': requests, 'path': path},
+        **results,
+        'speedup': round(full['mean_ms'] / fast['mean_ms'], 1),
+    }
@@ -0,0 +1,199 @@
+"""
+Drive every URL of the project through the Django test client against a
+seeded database and collect latency percentiles and SQL query counts.
+"""
+import itertools
+import json
+import math
+import os
+import platform
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+
+import django
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from django.urls import reverse
+
+from course.models import Course
+from user.authentication import get_tokens_for_user
+
+from .seed import PASSWORD, seed
+
+
+@contextmanager
+def throwaway_database(on_disk=False):
+    """
+    실제 db.sqlite3 대신 테스트용 DB를 만들어 쓰고 끝나면 삭제.
+    on_disk면 메모리 DB 대신 임시 파일을 써서 WAL/busy timeout 등 운영 설정이 그대로 적용됨
+    (여러 스레드가 동시에 쓰는 벤치마크용).
+    """
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    test_settings = connection.settings_dict['TEST']
+    old_test_name = test_settings.get('NAME')
+    directory = tempfile.TemporaryDirectory() if on_disk else None
+    if directory:
+        test_settings['NAME'] = os.path.join(directory.name, 'bench.sqlite3')
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        test_settings['NAME'] = old_test_name
+        if directory:
+            directory.cleanup()
+        teardown_test_environment()
+
+
+def percentile(samples, pct):
+    """nearest-rank 방식 백분위수."""
+    ordered = sorted(samples)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+
+def latency_summary(latencies):
+    return {
+        'count': len(latencies),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+        'mean_ms': round(statistics.fmean(latencies) * 1000, 3),
+    }
+
+
+def summarize(latencies, queries):
+    return {
+        **latency_summary(latencies),
+        'queries_median': statistics.median(queries),
+        'queries_max': max(queries),
+    }
+
+
+def auth_headers(user):
+    _, access_token = get_tokens_for_user(user)
+    return {'HTTP_AUTHORIZATION': f'Bearer {access_token}'}
+
+
+def build_cases(data):
+    """
+    엔드포인트 이름 -> 호출 i번째 요청을 만드는 함수.
+    요청 함수는 (method, path, body, headers)를 반환하며,
+    end_course처럼 데이터를 지우는 요청은 매번 새 대상을 준비함.
+    """
+    teacher = data['teachers'][0]
+    course = next(c for c in data['courses'] if c.teacher_id == teacher.id)
+    student = next(s for s in data['students'] if s.id in data['course_participants'][course.id])
+    teacher_headers = auth_headers(teacher)
+    student_headers = auth_headers(student)
+    register_target = Course.objects.create(name='Register target', teacher=teacher)
+    register_students = itertools.cycle(data['students'])
+    todo_ids = data['course_todos'][course.id]
+    # 매번 같은 학생들을 등록하므로 두 번째 호출부터는 already_enrolled
+    enroll_target = Course.objects.create(name='Enroll target', teacher=teacher)
+    enroll_user_ids = [s.user_id for s in data['students'][:50]]
+
+    def end_course(i):
+        target = Course.objects.create(name=f'Ended {i}', teacher=teacher)
+        return 'delete', reverse('end_course', kwargs={'course_id': target.id}), None, teacher_headers
+
+    def register_course(i):
+        return (
+            'post', reverse('register_course'), {'code': register_target.code},
+            auth_headers(next(register_students)),
+        )
+
+    return {
+        'signup': lambda i: ('post', reverse('signup'), {
+            'user_id': 900000000 + i, 'password': PASSWORD, 'first_name': f'New{i}', 'user_type': 's',
+        }, {}),
+        'login': lambda i: ('post', reverse('login'), {
+            'user_id': student.user_id, 'password': PASSWORD, 'user_type': 's',
+        }, {}),
+        # 로그아웃하면 토큰이 폐기되므로 매번 새 토큰 사용
+        'logout': lambda i: ('post', reverse('logout'), None, auth_headers(student)),
+        'create_course': lambda i: ('post', reverse('create_course'), {'name': f'Bench {i}'}, teacher_headers),
+        'list_up_courses': lambda i: ('get', reverse('list_up_courses'), None, teacher_headers),
+        'end_course': end_course,
+        'register_course': register_course,
+        'enter_course': lambda i: (
+            'get', reverse('enter_course', kwargs={'course_id': course.id}), None, student_headers,
+        ),
+        'get_course_progress': lambda i: (
+            'get', reverse('get_course_progress', kwargs={'course_id': course.id}), None, teacher_headers,
+        ),
+        'add_todo': lambda i: (
+            'post', reverse('add_todo', kwargs={'course_id': course.id}),
+            {'todos': [f'Bench step {i}-{n}' for n in range(10)]}, teacher_headers,
+        ),
+        'listup_todo': lambda i: (
+            'get', reverse('listup_todo', kwargs={'course_id': course.id}), None, student_headers,
+        ),
+        'complete_todo': lambda i: (
+            'post', reverse('complete_todo', kwargs={'course_id': course.id}),
+            {'todo_ids': todo_ids[:20], 'completed': i % 2 == 0}, student_headers,
+        ),
+        'enroll_students': lambda i: (
+            'post', reverse('enroll_students', kwargs={'course_id': enroll_target.id}),
+            {'user_ids': enroll_user_ids}, teacher_headers,
+        ),
+        'get_course_workspace': lambda i: (
+            'get', reverse('get_course_workspace', kwargs={'course_id': course.id}), None, teacher_headers,
+        ),
+        # 수업 화면을 여는 세 요청을 한 번에
+        'batch': lambda i: ('post', reverse('batch'), {'requests': [
+            {'method': 'GET', 'path': reverse(name, kwargs={'course_id': course.id})}
+            for name in ('enter_course', 'listup_todo', 'get_course_progress')
+        ]}, teacher_headers),
+        'metrics': lambda i: ('get', reverse('metrics'), None, {}),
+    }
+
+
+def run_benchmark(iterations=30, endpoints=None, **seed_options):
+    """
+    DB를 seed한 뒤 각 엔드포인트를 iterations번 호출한 결과 report(dict)를 반환.
+    호출하는 쪽에서 테스트용 DB를 준비해야 함 (benchmark 명령 참고).
+    """
+    seed_start = time.perf_counter()
+    data = seed(**seed_options)
+    seed_seconds = time.perf_counter() - seed_start
+
+    client = Client()
+    cases = build_cases(data)
+    results = {}
+    for name, make_request in cases.items():
+        if endpoints and name not in endpoints:
+            continue
+        latencies, queries, statuses = [], [], set()
+        for i in range(iterations):
+            method, path, body, headers = make_request(i)
+            kwargs = dict(headers)
+            if body is not None:
+                kwargs.update(data=json.dumps(body), content_type='application/json')
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                response = getattr(client, method)(path, **kwargs)
+                # 스트리밍 응답은 본문을 읽는 동안 쿼리가 실행되므로 끝까지 읽은 시점까지 측정
+                if response.streaming:
+                    for _ in response.streaming_content:
+                        pass
+                latencies.append(time.perf_counter() - start)
+            queries.append(len(captured))
+            statuses.add(response.status_code)
+        results[name] = {**summarize(latencies, queries), 'status_codes': sorted(statuses)}
+
+    return {
+        'meta': {
+            'django': django.get_version(),
+            'python': platform.python_version(),
+            'database': connection.vendor,
+            'iterations': iterations,
+            'seed_seconds': round(seed_seconds, 3),
+            'dataset': data['counts'],
+        },
+        'endpoints': results,
+    }
@@ -0,0 +1,91 @@
+"""
+Bulk-insert fixtures for the endpoint benchmarks.
+
+Every table is filled with ``bulk_create`` so seeding 10k students and 50k
+to-dos takes seconds instead of the minutes that ``create_user`` (one PBKDF2
+hash per row) would need.
+"""
+from django.contrib.auth.hashers import make_password
+
+from course.models import Course, generate_code
+from todo.models import ToDo
+from user.models import User
+
+PASSWORD = 'password'
+TEACHER_USER_ID_START = 1
+STUDENT_USER_ID_START = 100000
+BATCH_SIZE = 5000
+
+
+def seed(students=10000, courses=500, todos=50000, teachers=50, enrollments=5, completion_ratio=0.1):
+    """
+    users/courses/enrollments/to-dos/completions를 bulk insert로 생성.
+    학생 s는 (s * enrollments + j) % courses 번째 수업들에 등록되고,
+    각 수업의 To-Do 중 앞에서 completion_ratio 만큼을 완료한 것으로 만듦.
+    """
+    # 모든 계정이 같은 비밀번호를 쓰므로 해시는 한 번만 계산
+    password = make_password(PASSWORD)
+    teacher_rows = User.objects.bulk_create([
+        User(user_id=TEACHER_USER_ID_START + i, first_name=f'Teacher{i}', user_type='t', password=password)
+        for i in range(teachers)
+    ], batch_size=BATCH_SIZE)
+    student_rows = User.objects.bulk_create([
+        User(user_id=STUDENT_USER_ID_START + i, first_name=f'Student{i}', user_type='s', password=password)
+        for i in range(students)
+    ], batch_size=BATCH_SIZE)
+
+    codes = set()
+    while len(codes) < courses:
+        codes.add(generate_code())
+    course_rows = Course.objects.bulk_create([
+        Course(name=f'Course {i}', code=code, teacher=teacher_rows[i % teachers])
+        for i, code in enumerate(codes)
+    ], batch_size=BATCH_SIZE)
+
+    course_participants = {course.id: [] for course in course_rows}
+    Participant = Course.participants.through
+    participant_rows = []
+    for s, student in enumerate(student_rows):
+        for j in range(min(enrollments, courses)):
+            course = course_rows[(s * enrollments + j) % courses]
+            participant_rows.append(Participant(course_id=course.id, user_id=student.id))
+            course_participants[course.id].append(student.id)
+    Participant.objects.bulk_create(participant_rows, batch_size=BATCH_SIZE)
+
+    todo_rows = ToDo.objects.bulk_create([
+        ToDo(course=course_rows[i % courses], content=f'Step {i}') for i in range(todos)
+    ], batch_size=BATCH_SIZE)
+
+    course_todos = {course.id: [] for course in course_rows}
+    for todo in todo_rows:
+        course_todos[todo.course_id].append(todo.id)
+    # 완료 기록은 수백만 건이 될 수 있어 BATCH_SIZE 단위로 나눠 INSERT
+    Completion = ToDo.completed_by.through
+    completion_count = 0
+    chunk = []
+    for course_id, todo_ids in course_todos.items():
+        done = todo_ids[:int(len(todo_ids) * completion_ratio)]
+        for user_id in course_participants[course_id]:
+            chunk.extend(Completion(todo_id=todo_id, user_id=user_id) for todo_id in done)
+            if len(chunk) >= BATCH_SIZE:
+                Completion.objects.bulk_create(chunk)
+                completion_count += len(chunk)
+                chunk = []
+    Completion.objects.bulk_create(chunk)
+    completion_count += len(chunk)
+
+    return {
+        'teachers': teacher_rows,
+        'students': student_rows,
+        'courses': course_rows,
+        'course_participants': course_participants,
+        'course_todos': course_todos,
+        'counts': {
+            'teachers': len(teacher_rows),
+            'students': len(student_rows),
+            'courses': len(course_rows),
+            'enrollments': len(participant_rows),
+            'todos': len(todo_rows),
+            'completions': completion_count,
+        },
+    }
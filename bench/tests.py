@@ -0,0 +1,98 @@
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import get_resolver
+
+from bench.concurrency import run_concurrency_benchmark
+from bench.logins import run_login_benchmark
+from bench.memory import run_memory_benchmark
+from bench.preflight import run_preflight_benchmark
+from bench.runner import build_cases, percentile, run_benchmark
+from bench.seed import seed
+from course.models import Course
+from user.models import User
+
+
+class PercentileTest(TestCase):
+    def test_nearest_rank(self):
+        samples = list(range(1, 101))
+        self.assertEqual(percentile(samples, 50), 50)
+        self.assertEqual(percentile(samples, 95), 95)
+        self.assertEqual(percentile(samples, 99), 99)
+        self.assertEqual(percentile([7], 99), 7)
+
+
+def url_names():
+    # BE/urls.py(include 포함)의 이름 있는 route
+    return {key for key in get_resolver('BE.urls').reverse_dict if isinstance(key, str)}
+
+
+class BenchmarkCoverageTest(TestCase):
+    def test_every_route_has_a_case(self):
+        data = seed(students=5, teachers=1, courses=1, todos=5, enrollments=1)
+        missing = url_names() - set(build_cases(data))
+        self.assertFalse(missing, f"No benchmark case for {sorted(missing)}")
+
+
+# logout 요청이 폐기한 토큰은 프로세스 메모리에만 기록
+@override_settings(JWT_DENYLIST_PATH=None)
+class RunBenchmarkTest(TestCase):
+    def test_small_dataset(self):
+        report = run_benchmark(iterations=2, students=20, teachers=2, courses=4, todos=40, enrollments=2)
+
+        self.assertEqual(report['meta']['dataset']['students'], 20)
+        self.assertEqual(User.objects.filter(user_type='s').count(), 20 + 2)  # signup으로 생성된 2명 포함
+        self.assertGreaterEqual(Course.objects.count(), 4)
+        self.assertEqual(set(report['endpoints']), url_names())
+        for name, result in report['endpoints'].items():
+            self.assertEqual(result['count'], 2)
+            self.assertTrue(all(code < 400 for code in result['status_codes']), (name, result))
+            self.assertLessEqual(result['p50_ms'], result['p99_ms'])
+
+
+class ConcurrencyBenchmarkTest(TestCase):
+    def test_small_dataset(self):
+        report = run_concurrency_benchmark(
+            requests=4, threads=1, clients=4, client_delay=0, endpoints=['listup_todo'],
+            students=10, teachers=1, courses=2, todos=10, enrollments=1,
+        )
+        result = report['endpoints']['listup_todo']
+        self.assertEqual(result['wsgi']['count'], 4)
+        self.assertEqual(result['asgi']['count'], 4)
+        self.assertGreater(result['asgi']['requests_per_second'], 0)
+
+
+
+# 로그인 스레드가 last_login/세션을 쓰므로 테스트 트랜잭션 밖에서 실행
+class LoginBenchmarkTest(TransactionTestCase):
+    def test_small_dataset(self):
+        report = run_login_benchmark(logins=4, concurrency=1, users=2, iterations=1000)
+        self.assertEqual(report['meta']['hash_iterations'], 1000)
+        for mode in ('wsgi', 'asgi'):
+            self.assertEqual(report[mode]['count'], 4)
+            self.assertEqual(report[mode]['failures'], 0)
+            self.assertGreater(report[mode]['logins_per_second'], 0)
+
+
+class MemoryBenchmarkTest(TestCase):
+    def test_small_dataset(self):
+        report = run_memory_benchmark(rows=50)
+
+        self.assertEqual(report['meta']['dataset']['enrollments'], 50)
+        for name in ['get_course_progress', 'listup_todo']:
+            result = report['endpoints'][name]
+            self.assertFalse(result['buffered']['streaming'])
+            self.assertTrue(result['streamed']['streaming'])
+            for mode in ('buffered', 'streamed'):
+                self.assertEqual(result[mode]['status'], 200)
+                self.assertGreater(result[mode]['peak_mb'], 0)
+            # 같은 본문
+            self.assertEqual(result['buffered']['bytes'], result['streamed']['bytes'])
+
+
+class PreflightBenchmarkTest(TestCase):
+    def test_both_chains(self):
+        report = run_preflight_benchmark(requests=20)
+
+        for name in ['fast_path', 'full_chain']:
+            self.assertEqual(report[name]['count'], 20)
+            self.assertEqual(report[name]['status_codes'], [200])
+            self.assertIsNotNone(report[name]['max_age'])
@@ -0,0 +1,95 @@
+"""
+In-process publish/subscribe for course change events.
+
+The progress stream (``course_progress_stream``) subscribes per course and
+the write views publish enrollment/completion deltas. Each subscription owns
+a bounded queue: when a slow client lets it fill up, the pending deltas are
+dropped and the subscriber receives ``RESYNC`` instead, so memory per
+connection stays bounded and the client is brought back with one snapshot.
+
+Write views publish through ``publish_on_commit``, so subscribers never see
+a change that was rolled back. Events are only delivered inside the worker process that produced them; the
+stream's periodic resync covers changes made by other workers.
+"""
+import asyncio
+import threading
+
+from django.conf import settings
+from django.db import transaction
+
+DEFAULT_QUEUE_SIZE = 100
+
+# 쌓인 delta를 버리고 snapshot을 다시 보내야 함을 나타내는 이벤트
+RESYNC = {'type': 'resync'}
+
+_lock = threading.Lock()
+# course_id -> set(Subscription)
+_subscribers = {}
+
+
+class Subscription:
+    def __init__(self, course_id):
+        self.course_id = course_id
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(getattr(settings, 'SSE_QUEUE_SIZE', DEFAULT_QUEUE_SIZE))
+        self.overflowed = False
+
+    def deliver(self, event):
+        # event loop 스레드에서만 호출됨
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+
+    async def get(self):
+        if self.overflowed:
+            self.overflowed = False
+            return RESYNC
+        return await self.queue.get()
+
+    def close(self):
+        with _lock:
+            subscribers = _subscribers.get(self.course_id)
+            if subscribers is not None:
+                subscribers.discard(self)
+                if not subscribers:
+                    del _subscribers[self.course_id]
+
+
+def subscribe(course_id):
+    """현재 event loop에서 course_id 이벤트를 받는 Subscription 생성."""
+    subscription = Subscription(course_id)
+    with _lock:
+        _subscribers.setdefault(course_id, set()).add(subscription)
+    return subscription
+
+
+def has_subscribers(course_id):
+    """구독자가 없으면 delta 계산 자체를 생략할 수 있도록 확인용."""
+    return course_id in _subscribers
+
+
+def publish(course_id, event):
+    """어느 스레드에서든 호출 가능. 각 구독자의 event loop로 이벤트 전달."""
+    with _lock:
+        subscribers = list(_subscribers.get(course_id, ()))
+    for subscription in subscribers:
+        try:
+            subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+        except RuntimeError:
+            # 이미 닫힌 event loop
+            subscription.close()
+
+
+def publish_on_commit(course_id, event):
+    """
+    현재 트랜잭션이 commit된 뒤 publish (rollback되면 보내지 않음).
+    event가 callable이면 commit 후 호출해 만든 이벤트를 보냄 (commit된 상태로 delta 계산).
+    """
+    def send():
+        publish(course_id, event() if callable(event) else event)
+    transaction.on_commit(send)
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from course.purge import purge_ended_courses
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete ended courses and their to-dos, completions and participants in small batches. "
+        "The web process does this in the background; use this to drain the queue by hand."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help="Default: COURSE_PURGE_BATCH_SIZE")
+        parser.add_argument('--pause', type=float, default=0.05, help="Seconds to wait between batches")
+
+    def handle(self, *args, **options):
+        totals = purge_ended_courses(batch_size=options['batch_size'], pause=options['pause'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Deleted {totals['courses']} courses, {totals['todos']} to-dos, "
+            f"{totals['completions']} completions and {totals['participants']} participants"
+        ))
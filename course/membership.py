@@ -0,0 +1,106 @@
+"""
+Course membership checks backed by a per-process cache.
+
+Only positive results are cached: a student who registers through another
+worker process is never locked out by a stale "not a member" entry, and
+membership is only ever revoked by ending the course.
+
+A positive result read inside a transaction that is later rolled back, for
+example an atomic ``/batch/``, must not outlive the rollback. ``tracking()``
+collects the entries added inside it so the caller can invalidate them.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+from course.models import Course
+
+DEFAULT_TTL = 300
+DEFAULT_MAX_ENTRIES = 100_000
+
+_lock = threading.Lock()
+# course_id -> {user_id: 만료 시각(monotonic)}
+_members = {}
+_size = 0
+# tracking() 블록 안에서 캐시에 추가된 (course_id, user_id)
+_added = ContextVar('membership_added', default=None)
+
+
+def _cached(course_id, user_id):
+    expires_at = _members.get(course_id, {}).get(user_id)
+    return expires_at is not None and expires_at > time.monotonic()
+
+
+def _remember(course_id, user_id):
+    global _size
+    ttl = getattr(settings, 'MEMBERSHIP_CACHE_TTL', DEFAULT_TTL)
+    with _lock:
+        if _size >= getattr(settings, 'MEMBERSHIP_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES):
+            _members.clear()
+            _size = 0
+        users = _members.setdefault(course_id, {})
+        if user_id not in users:
+            _size += 1
+        users[user_id] = time.monotonic() + ttl
+    added = _added.get()
+    if added is not None:
+        added.append((course_id, user_id))
+
+
+def _membership_queryset(course_id, user_id):
+    return Course.participants.through.objects.filter(course_id=course_id, user_id=user_id)
+
+
+def is_participant(course_id, user_id):
+    """(course_id, user_id) 참여 여부를 인덱스를 타는 EXISTS 쿼리 1번으로 확인."""
+    if _cached(course_id, user_id):
+        return True
+    exists = _membership_queryset(course_id, user_id).exists()
+    if exists:
+        _remember(course_id, user_id)
+    return exists
+
+
+async def ais_participant(course_id, user_id):
+    """is_participant()의 async 버전."""
+    if _cached(course_id, user_id):
+        return True
+    exists = await _membership_queryset(course_id, user_id).aexists()
+    if exists:
+        _remember(course_id, user_id)
+    return exists
+
+
+def invalidate(course_id, user_id=None):
+    """수강 등록/수업 종료 시 호출. user_id가 없으면 해당 수업 전체를 비움."""
+    global _size
+    with _lock:
+        users = _members.get(course_id)
+        if not users:
+            return
+        if user_id is None:
+            _size -= len(users)
+            del _members[course_id]
+        elif users.pop(user_id, None) is not None:
+            _size -= 1
+
+
+def clear():
+    global _size
+    with _lock:
+        _members.clear()
+        _size = 0
+
+
+@contextmanager
+def tracking():
+    """블록 안에서 캐시에 추가된 (course_id, user_id) 목록을 반환 (rollback 시 invalidate용)."""
+    added = []
+    token = _added.set(added)
+    try:
+        yield added
+    finally:
+        _added.reset(token)
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.11 on 2026-10-18 20:49
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('course', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='course',
+            name='teacher',
+            field=models.ForeignKey(db_index=False, limit_choices_to={'user_type': 't'}, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['teacher', 'created_at', 'id'], name='course_teacher_created_idx'),
+        ),
+        # 자동 생성된 M2M 테이블에는 Meta.indexes를 줄 수 없으므로 직접 생성
+        # 학생별 수업 조회를 테이블 접근 없이 인덱스만으로 처리 (covering index)
+        migrations.RunSQL(
+            'CREATE INDEX course_participants_user_course_idx ON course_course_participants (user_id, course_id)',
+            reverse_sql='DROP INDEX course_participants_user_course_idx',
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.11 on 2026-10-18 21:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0002_course_teacher_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='ended_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(condition=models.Q(('ended_at__isnull', False)), fields=['ended_at'], name='course_ended_idx'),
+        ),
+    ]
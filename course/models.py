@@ -1,24 +1,123 @@
 import shortuuid
 from django.conf import settings
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+CODE_LENGTH = 6
+MAX_CODE_ATTEMPTS = 10
+
+
+def generate_code():
+    return shortuuid.ShortUUID().random(length=CODE_LENGTH)
+
+
+class ActiveCourseManager(models.Manager):
+    """종료된 수업은 삭제(course/purge.py)될 때까지 남아 있지만 조회에서는 제외."""
+    def get_queryset(self):
+        return super().get_queryset().filter(ended_at__isnull=True)
 
 
 # Create your models here.
 class Course(models.Model):
     name = models.CharField(max_length=100, null=False, blank=False)
     code = models.CharField(unique=True, editable=False, max_length=6)
-    teacher = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, limit_choices_to={'user_type': 't'})
+    # teacher 단독 인덱스는 아래 (teacher, created_at, id) 인덱스가 대신함
+    teacher = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, limit_choices_to={'user_type': 't'}, db_index=False)
     created_at = models.DateTimeField(auto_now_add=True)
     participants = models.ManyToManyField(settings.AUTH_USER_MODEL, related_name='courses', blank=True)
+    # 수업 종료 시각. 종료된 수업과 딸린 데이터는 백그라운드에서 조금씩 삭제됨
+    ended_at = models.DateTimeField(null=True, blank=True)
+
+    objects = ActiveCourseManager()
+    # 종료된 수업 포함 (삭제 작업, 코드 중복 확인용)
+    all_objects = models.Manager()
+
+    class Meta:
+        indexes = [
+            # 교수별 수업 목록 (created_at, id) 순 cursor 페이지네이션
+            models.Index(fields=['teacher', 'created_at', 'id'], name='course_teacher_created_idx'),
+            # 삭제 대기 중인 수업만 담는 부분 인덱스
+            models.Index(fields=['ended_at'], condition=models.Q(ended_at__isnull=False), name='course_ended_idx'),
+        ]
 
     def save(self, *args, **kwargs):
-        if not self.code: # PUT, PATCH 시 미적용
-            while True:
-                new_code = shortuuid.ShortUUID().random(length=6)
-                if not Course.objects.filter(code=new_code).exists():
-                    self.code = new_code
-                    break
-        super().save(*args, **kwargs)
+        if self.code: # PUT, PATCH 시 미적용
+            return super().save(*args, **kwargs)
+
+        # 사전 SELECT 없이 바로 INSERT하고, 코드가 겹치면 savepoint만 롤백 후 재시도
+        using = kwargs.get('using')
+        for _ in range(MAX_CODE_ATTEMPTS):
+            self.code = generate_code()
+            try:
+                with transaction.atomic(using=using):
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                # 실패한 경우에만 원인이 코드 중복인지 확인
+                if not Course.all_objects.using(using).filter(code=self.code).exists():
+                    self.code = ''
+                    raise
+        self.code = ''
+        raise IntegrityError(f"Could not allocate a unique course code in {MAX_CODE_ATTEMPTS} attempts")
+
+    def end(self):
+        """수업 종료 표시만 하고 바로 반환 (UPDATE 1번). 실제 삭제는 course/purge.py."""
+        self.ended_at = timezone.now()
+        Course.all_objects.filter(id=self.id).update(ended_at=self.ended_at)
+
+    def _progress_queryset(self):
+        # 학생별 완료 수는 correlated subquery로 계산해 GROUP BY 없이
+        # 참여자 (course_id, user_id) 인덱스 순서대로 읽음 (정렬용 임시 B-tree 없음)
+        completions = self.todo_items.model.completed_by.through.objects.filter(
+            user_id=models.OuterRef('user_id'), todo__course=self
+        ).values('user_id').annotate(count=models.Count('*')).values('count')
+        return Course.participants.through.objects.filter(course=self).annotate(
+            completed=Coalesce(models.Subquery(completions), 0)
+        ).order_by('user_id').values('user__first_name', 'user__user_id', 'completed')
+
+    @staticmethod
+    def _progress_row(student, total):
+        return {
+            'name': student['user__first_name'],
+            'id': student['user__user_id'],
+            'progress': round(student['completed'] * 100 / total) if total else 0,
+        }
+
+    def participants_progress(self, total=None):
+        """
+        참여 학생별 진행률(완료한 To-Do 수 / 전체 To-Do 수, 0~100 정수)을 반환.
+        학생 수와 관계없이 전체 To-Do COUNT 1번 + 학생별 완료 수 집계 1번으로 계산.
+        전체 To-Do 수(total)를 이미 알고 있으면 COUNT는 생략.
+        """
+        if total is None:
+            total = self.todo_items.count()
+        return [self._progress_row(student, total) for student in self._progress_queryset()]
+
+    def iter_participants_progress(self, chunk_size=2000, total=None):
+        """participants_progress()와 같은 행을 chunk_size개씩 읽으며 반환 (스트리밍 응답용)."""
+        if total is None:
+            total = self.todo_items.count()
+        for student in self._progress_queryset().iterator(chunk_size=chunk_size):
+            yield self._progress_row(student, total)
+
+    async def aiter_participants_progress(self, chunk_size=2000, total=None):
+        """iter_participants_progress()의 async 버전."""
+        if total is None:
+            total = await self.todo_items.acount()
+        async for student in self._progress_queryset().aiterator(chunk_size=chunk_size):
+            yield self._progress_row(student, total)
+
+    def participant_progress(self, user_id):
+        """학생 한 명의 진행률. 참여자가 아니면 None."""
+        total = self.todo_items.count()
+        student = self._progress_queryset().filter(user_id=user_id).first()
+        return self._progress_row(student, total) if student else None
+
+    async def aparticipants_progress(self, total=None):
+        """participants_progress()의 async 버전."""
+        if total is None:
+            total = await self.todo_items.acount()
+        return [self._progress_row(student, total) async for student in self._progress_queryset()]
 
     def __str__(self):
-        return f"{self.name} (Code: {self.code})"
\ No newline at end of file
+        return f"{self.name} (Code: {self.code})"
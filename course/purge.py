@@ -0,0 +1,100 @@
+"""
+Background purge of ended courses.
+
+``end_course`` only sets ``Course.ended_at``; the ended courses themselves are
+the queue, so it survives restarts. A worker thread deletes each ended
+course's completions, to-dos and participant rows ``COURSE_PURGE_BATCH_SIZE``
+rows at a time, every batch in its own short transaction, and the course row
+last. No single statement holds the SQLite write lock for long, and other
+writers get the lock between batches.
+
+``enqueue`` wakes the worker (starting it on first use) and is called after
+``end_course`` commits. ``manage.py purge_ended_courses`` runs the same
+purge in the foreground.
+"""
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection
+
+from course.models import Course
+from todo.models import ToDo
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_PAUSE = 0.05
+
+_lock = threading.Lock()
+_wakeup = threading.Event()
+_thread = None
+
+
+def _delete_in_batches(queryset, batch_size, pause):
+    """queryset의 행을 pk 기준 batch_size개씩 삭제하고 삭제한 행 수를 반환."""
+    model = queryset.model
+    deleted = 0
+    while True:
+        ids = list(queryset.values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return deleted
+        model._base_manager.filter(pk__in=ids).delete()
+        deleted += len(ids)
+        if len(ids) < batch_size:
+            return deleted
+        time.sleep(pause)
+
+
+def purge_course(course_id, batch_size=None, pause=DEFAULT_PAUSE):
+    """종료된 수업 하나의 딸린 데이터를 배치 단위로 지운 뒤 수업을 삭제. 삭제한 행 수를 반환."""
+    batch_size = batch_size or getattr(settings, 'COURSE_PURGE_BATCH_SIZE', DEFAULT_BATCH_SIZE)
+    counts = {
+        # 의존 관계의 바깥쪽부터: 완료 기록 -> To-Do -> 참여자 -> 수업
+        'completions': _delete_in_batches(
+            ToDo.completed_by.through.objects.filter(todo__course_id=course_id), batch_size, pause
+        ),
+        'todos': _delete_in_batches(ToDo.objects.filter(course_id=course_id), batch_size, pause),
+        'participants': _delete_in_batches(
+            Course.participants.through.objects.filter(course_id=course_id), batch_size, pause
+        ),
+    }
+    # 딸린 행이 없으므로 cascade 없이 한 행만 삭제
+    counts['courses'] = Course.all_objects.filter(id=course_id, ended_at__isnull=False).delete()[0]
+    return counts
+
+
+def purge_ended_courses(batch_size=None, pause=DEFAULT_PAUSE):
+    """종료된 수업이 없어질 때까지 오래된 순으로 삭제하고 전체 삭제 행 수를 반환."""
+    totals = {'completions': 0, 'todos': 0, 'participants': 0, 'courses': 0}
+    ended = Course.all_objects.filter(ended_at__isnull=False).order_by('ended_at')
+    while course_ids := list(ended.values_list('id', flat=True)[:100]):
+        for course_id in course_ids:
+            for key, count in purge_course(course_id, batch_size, pause).items():
+                totals[key] += count
+    return totals
+
+
+def _work():
+    while True:
+        _wakeup.wait()
+        _wakeup.clear()
+        try:
+            totals = purge_ended_courses()
+            logger.info("Purged ended courses: %s", totals)
+        except Exception:
+            # 남은 수업은 다음 enqueue 때 다시 시도
+            logger.exception("Course purge failed")
+        finally:
+            connection.close()
+
+
+def enqueue():
+    """삭제 worker를 깨움 (프로세스당 스레드 1개, 처음 호출할 때 시작)."""
+    global _thread
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_work, name='course-purge', daemon=True)
+            _thread.start()
+    _wakeup.set()
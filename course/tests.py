@@ -1,6 +1,23 @@
-from django.test import TestCase
-from django.urls import reverse
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock, skipUnless
+
+from django.db import IntegrityError, OperationalError, connection, transaction
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from course import events, membership, purge
 from course.models import Course
+from todo.models import ToDo
+from user.authentication import get_tokens_for_user
 from user.models import User
 
 
@@ -87,6 +104,100 @@ class CourseListUpTest(TestCase):
         response = self.client.get(self.list_up_course_url)
         self.assertEqual(response.status_code, 403)
 
+class CourseListUpQueryCountTest(TestCase):
+    # 수업 수가 늘어나도 쿼리 수는 일정해야 함 (JWT 사용자 조회 1 + 버전 집계 1 + 수업 조회 1)
+    def setUp(self):
+        cache.clear()
+        self.teacher = User.objects.create_user(
+            user_id=1001, first_name='Professor', password='password', user_type='t'
+        )
+        self.student = User.objects.create_user(
+            user_id=9001, first_name='Student', password='password', user_type='s'
+        )
+        self.student2 = User.objects.create_user(
+            user_id=9002, first_name='Stud2', password='password', user_type='s'
+        )
+        self.list_up_course_url = reverse('list_up_courses')
+        self.teacher_headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(self.teacher)}"}
+        self.student_headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(self.student)}"}
+
+    def create_courses(self, count):
+        for i in range(count):
+            course = Course.objects.create(name=f'Course {i}', teacher=self.teacher)
+            course.participants.add(self.student, self.student2)
+
+    def test_teacher_query_count_is_constant(self):
+        self.create_courses(1)
+        with self.assertNumQueries(3):
+            response = self.client.get(self.list_up_course_url, **self.teacher_headers)
+        self.assertEqual(len(response.json()['courses']), 1)
+
+        self.create_courses(20)
+        with self.assertNumQueries(3):
+            response = self.client.get(self.list_up_course_url, **self.teacher_headers)
+        courses = response.json()['courses']
+        self.assertEqual(len(courses), 21)
+        self.assertTrue(all(c['participant_count'] == 2 for c in courses))
+
+    def test_student_query_count_is_constant(self):
+        self.create_courses(1)
+        with self.assertNumQueries(3):
+            response = self.client.get(self.list_up_course_url, **self.student_headers)
+        self.assertEqual(len(response.json()['courses']), 1)
+
+        self.create_courses(20)
+        with self.assertNumQueries(3):
+            response = self.client.get(self.list_up_course_url, **self.student_headers)
+        courses = response.json()['courses']
+        self.assertEqual(len(courses), 21)
+        self.assertTrue(all(c['teacher_name'] == 'Professor' for c in courses))
+
+    def test_paginated_listing(self):
+        self.create_courses(7)
+        response = self.client.get(self.list_up_course_url, {'limit': 5}, **self.teacher_headers)
+        first_page = response.json()
+        self.assertEqual(len(first_page['courses']), 5)
+        self.assertIsNotNone(first_page['next_cursor'])
+
+        with self.assertNumQueries(3):
+            response = self.client.get(
+                self.list_up_course_url, {'limit': 5, 'cursor': first_page['next_cursor']}, **self.student_headers
+            )
+        second_page = response.json()
+        self.assertEqual(len(second_page['courses']), 2)
+        self.assertIsNone(second_page['next_cursor'])
+        ids = [c['id'] for c in first_page['courses'] + second_page['courses']]
+        self.assertEqual(ids, list(Course.objects.order_by('created_at', 'id').values_list('id', flat=True)))
+
+    def test_not_modified_until_list_changes(self):
+        self.create_courses(2)
+        response = self.client.get(self.list_up_course_url, **self.teacher_headers)
+        etag = response['ETag']
+
+        # 수업 목록 조회 없이 304 (JWT 사용자 조회 + 버전 집계)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.list_up_course_url, HTTP_IF_NONE_MATCH=etag, **self.teacher_headers)
+        self.assertEqual(response.status_code, 304)
+
+        # 수강 등록은 참여자 수를 바꾸므로 새 버전
+        student3 = User.objects.create_user(user_id=9003, first_name='Stud3', password='password', user_type='s')
+        Course.objects.first().participants.add(student3)
+        response = self.client.get(self.list_up_course_url, HTTP_IF_NONE_MATCH=etag, **self.teacher_headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(sorted(c['participant_count'] for c in response.json()['courses']), [2, 3])
+
+        # 다른 사용자의 ETag는 일치하지 않음
+        response = self.client.get(self.list_up_course_url, HTTP_IF_NONE_MATCH=etag, **self.student_headers)
+        self.assertEqual(response.status_code, 200)
+
+        # 수업 종료(삭제)도 새 버전
+        etag = self.client.get(self.list_up_course_url, **self.student_headers)['ETag']
+        Course.objects.first().delete()
+        response = self.client.get(self.list_up_course_url, HTTP_IF_NONE_MATCH=etag, **self.student_headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['courses']), 1)
+
+
 class CourseEndTest(TestCase):
     def setUp(self):
         self.teacher = User.objects.create_user(
@@ -130,6 +241,94 @@ class CourseEndTest(TestCase):
         self.assertEqual(response.status_code, 401)
         self.assertEqual(response.json()['error'], 'Authentication required')
     """
+class CourseSoftDeleteTest(TestCase):
+    def setUp(self):
+        membership.clear()
+        self.teacher = User.objects.create_user(
+            user_id=1001, first_name='Professor', password='password', user_type='t'
+        )
+        self.students = User.objects.bulk_create([
+            User(user_id=9000 + i, first_name=f'Student{i}', user_type='s') for i in range(1, 6)
+        ])
+        self.course = Course.objects.create(name='Cloud', teacher=self.teacher)
+        self.course.participants.add(*self.students)
+        todos = ToDo.objects.bulk_create([ToDo(course=self.course, content=f'Task {i}') for i in range(3)])
+        for todo in todos:
+            todo.completed_by.add(*self.students)
+        self.teacher_headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(self.teacher)}"}
+        self.student_headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(self.students[0])}"}
+
+    def end_course(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.delete(
+                reverse('end_course', kwargs={'course_id': self.course.id}), **self.teacher_headers
+            )
+        self.assertEqual(response.status_code, 200)
+        return callbacks
+
+    def test_end_only_marks_course(self):
+        with mock.patch('course.purge.enqueue') as enqueue:
+            callbacks = self.end_course()
+            for callback in callbacks:
+                callback()
+        enqueue.assert_called_once()
+
+        # 딸린 데이터는 그대로 두고 종료 시각만 기록
+        course = Course.all_objects.get(id=self.course.id)
+        self.assertIsNotNone(course.ended_at)
+        self.assertEqual(ToDo.objects.filter(course_id=course.id).count(), 3)
+        self.assertEqual(Course.participants.through.objects.filter(course_id=course.id).count(), 5)
+
+    def test_ended_course_is_hidden(self):
+        self.end_course()
+
+        response = self.client.get(reverse('list_up_courses'), **self.student_headers)
+        self.assertEqual(response.json()['courses'], [])
+        response = self.client.get(reverse('list_up_courses'), **self.teacher_headers)
+        self.assertEqual(response.json()['courses'], [])
+
+        for name in ('enter_course', 'get_course_progress', 'listup_todo'):
+            headers = self.teacher_headers if name == 'get_course_progress' else self.student_headers
+            response = self.client.get(reverse(name, kwargs={'course_id': self.course.id}), **headers)
+            self.assertEqual(response.status_code, 404, name)
+
+        response = self.client.post(
+            reverse('register_course'), {'code': self.course.code}, content_type='application/json',
+            **self.student_headers
+        )
+        self.assertEqual(response.status_code, 404)
+        response = self.client.delete(
+            reverse('end_course', kwargs={'course_id': self.course.id}), **self.teacher_headers
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_purge_deletes_in_batches(self):
+        other = Course.objects.create(name='Python', teacher=self.teacher)
+        other.participants.add(self.students[0])
+        self.end_course()
+
+        with mock.patch('course.purge.time.sleep') as sleep, CaptureQueriesContext(connection) as queries:
+            totals = purge.purge_ended_courses(batch_size=2, pause=0)
+
+        self.assertEqual(totals, {'completions': 15, 'todos': 3, 'participants': 5, 'courses': 1})
+        self.assertFalse(Course.all_objects.filter(id=self.course.id).exists())
+        self.assertEqual(ToDo.completed_by.through.objects.count(), 0)
+        # 다른 수업은 그대로
+        self.assertEqual(list(other.participants.all()), [self.students[0]])
+        # 꽉 찬 배치 뒤에만 쉼: 완료 기록 7번, To-Do 1번, 참여자 2번
+        self.assertEqual(sleep.call_count, 10)
+        deletes = [q['sql'] for q in queries.captured_queries if q['sql'].startswith('DELETE')]
+        self.assertGreaterEqual(len(deletes), 8 + 2 + 3 + 1)
+
+        # 삭제할 수업이 없으면 아무것도 지우지 않음
+        self.assertEqual(purge.purge_ended_courses()['courses'], 0)
+
+    def test_ended_course_code_is_not_reused(self):
+        self.end_course()
+        with mock.patch('course.models.generate_code', side_effect=[self.course.code, 'FRESH1']):
+            course = Course.objects.create(name='Python', teacher=self.teacher)
+        self.assertEqual(course.code, 'FRESH1')
+
 
 class RegisterCourseTest(TestCase):
     def setUp(self):
@@ -176,4 +375,679 @@ class RegisterCourseTest(TestCase):
         response = self.client.post(self.register_course_url, {'code': self.course.code})
 
         self.assertEqual(response.status_code, 401)
-        self.assertEqual(response.json()['error'], 'Unauthorized')
\ No newline at end of file
+        self.assertEqual(response.json()['error'], 'Unauthorized')
+
+
+class EnterCourseMembershipTest(TestCase):
+    def setUp(self):
+        membership.clear()
+        self.teacher = User.objects.create_user(
+            user_id=1001, first_name='Professor', password='password', user_type='t'
+        )
+        self.student = User.objects.create_user(
+            user_id=9001, first_name='Student', password='password', user_type='s'
+        )
+        self.course = Course.objects.create(name='Cloud', teacher=self.teacher)
+        self.enter_course_url = reverse('enter_course', kwargs={'course_id': self.course.id})
+        self.teacher_headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(self.teacher)}"}
+        self.student_headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(self.student)}"}
+
+    def test_register_then_enter(self):
+        response = self.client.get(self.enter_course_url, **self.student_headers)
+        self.assertEqual(response.status_code, 403)
+
+        response = self.client.post(
+            reverse('register_course'), {'code': self.course.code}, content_type='application/json',
+            **self.student_headers
+        )
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(self.enter_course_url, **self.student_headers)
+        self.assertEqual(response.status_code, 200)
+        # 캐시 적중 시 JWT 사용자 조회 + 수업 조회만 수행
+        with self.assertNumQueries(2):
+            response = self.client.get(self.enter_course_url, **self.student_headers)
+        self.assertEqual(response.status_code, 200)
+
+    def test_end_course_invalidates_membership(self):
+        self.course.participants.add(self.student)
+        self.assertTrue(membership.is_participant(self.course.id, self.student.id))
+
+        response = self.client.delete(
+            reverse('end_course', kwargs={'course_id': self.course.id}), **self.teacher_headers
+        )
+        self.assertEqual(response.status_code, 200)
+        # 참여자 행은 백그라운드 삭제 전까지 남아 있으므로 캐시 항목만 확인하고, 입장은 수업 조회에서 막힘
+        self.assertFalse(membership._cached(self.course.id, self.student.id))
+        response = self.client.get(self.enter_course_url, **self.student_headers)
+        self.assertEqual(response.status_code, 404)
+
+
+
+class EnrollStudentsTest(TestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(
+            user_id=1001, first_name='Professor', password='password', user_type='t'
+        )
+        self.other_teacher = User.objects.create_user(
+            user_id=1002, first_name='Other', password='password', user_type='t'
+        )
+        self.students = User.objects.bulk_create([
+            User(user_id=9000 + i, first_name=f'Student{i}', user_type='s') for i in range(1, 4)
+        ])
+        self.course = Course.objects.create(name='Cloud', teacher=self.teacher)
+        self.course.participants.add(self.students[0])
+        self.url = reverse('enroll_students', kwargs={'course_id': self.course.id})
+
+    def headers(self, user):
+        return {'HTTP_AUTHORIZATION': f'Bearer {get_tokens_for_user(user)[1]}'}
+
+    def enroll(self, user_ids, user=None):
+        return self.client.post(
+            self.url, data=json.dumps({'user_ids': user_ids}), content_type='application/json',
+            **self.headers(user or self.teacher),
+        )
+
+    def test_row_outcomes(self):
+        response = self.enroll([9001, 9002, 9002, 1002, 12345, 'abc', 9003, '²'])
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual([(r['row'], r['status']) for r in body['results']], [
+            (1, 'already_enrolled'), (2, 'enrolled'), (3, 'duplicate'), (4, 'not_student'),
+            (5, 'not_found'), (6, 'invalid'), (7, 'enrolled'), (8, 'invalid'),
+        ])
+        self.assertEqual(body['summary']['enrolled'], 2)
+        self.assertEqual(set(self.course.participants.all()), set(self.students))
+
+    def test_csv_upload(self):
+        roster = SimpleUploadedFile('roster.csv', '\ufeffuser_id,name\n9002,Student2\n\n9003,Student3\n'.encode())
+        response = self.client.post(self.url, {'roster': roster}, **self.headers(self.teacher))
+
+        self.assertEqual(response.status_code, 200)
+        # 행 번호는 CSV 파일의 줄 번호
+        self.assertEqual(response.json()['results'], [
+            {'row': 2, 'user_id': '9002', 'status': 'enrolled'},
+            {'row': 4, 'user_id': '9003', 'status': 'enrolled'},
+        ])
+        self.assertEqual(self.course.participants.count(), 3)
+
+    def test_large_roster_query_count(self):
+        students = User.objects.bulk_create([
+            User(user_id=100000 + i, first_name=f'Bulk{i}', user_type='s') for i in range(3000)
+        ])
+        with CaptureQueriesContext(connection) as queries:
+            response = self.enroll([student.user_id for student in students])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['summary'], {'enrolled': 3000})
+        self.assertEqual(self.course.participants.count(), 3001)
+        # 학생 수와 무관: 학번 조회 1번, 기존 등록 조회 1번, INSERT는 SQLite 변수 한도 단위 배치
+        self.assertLessEqual(len(queries), 15)
+
+    def test_only_course_teacher(self):
+        self.assertEqual(self.enroll([9002], user=self.other_teacher).status_code, 403)
+        self.assertEqual(self.enroll([9002], user=self.students[1]).status_code, 403)
+        self.assertFalse(self.course.participants.filter(id=self.students[1].id).exists())
+
+    @override_settings(ROSTER_MAX_SIZE=2)
+    def test_invalid_roster(self):
+        self.assertEqual(self.enroll([9001, 9002, 9003]).status_code, 400)
+        self.assertEqual(self.enroll([]).status_code, 400)
+        self.assertEqual(self.enroll('9001').status_code, 400)
+        # 객체가 아닌 JSON 본문
+        for body in ([9001], '9001'):
+            response = self.client.post(
+                self.url, data=json.dumps(body), content_type='application/json', **self.headers(self.teacher)
+            )
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json()['error'], 'Request body must be a JSON object')
+
+
+class CourseCodeAllocationTest(TestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(
+            user_id=1001, first_name='Professor', password='password', user_type='t'
+        )
+
+    def test_no_select_before_insert(self):
+        # SAVEPOINT + INSERT + RELEASE
+        with self.assertNumQueries(3):
+            course = Course.objects.create(name='Cloud', teacher=self.teacher)
+        self.assertEqual(len(course.code), 6)
+
+    def test_retry_on_duplicate_code(self):
+        Course.objects.create(name='Cloud', teacher=self.teacher)
+        taken = Course.objects.get().code
+        with mock.patch('course.models.generate_code', side_effect=[taken, taken, 'FRESH1']):
+            course = Course.objects.create(name='Python', teacher=self.teacher)
+        self.assertEqual(course.code, 'FRESH1')
+        self.assertEqual(Course.objects.count(), 2)
+
+    def test_other_integrity_errors_are_not_retried(self):
+        generate = mock.Mock(side_effect=['CODE01', 'CODE02'])
+        with mock.patch('course.models.generate_code', generate), self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                Course.objects.create(name=None, teacher=self.teacher)
+        self.assertEqual(generate.call_count, 1)
+
+
+class CourseCodeStressTest(TransactionTestCase):
+    # 기본은 작은 규모, 대규모 확인은 COURSE_STRESS_COUNT=20000 처럼 지정
+    course_count = int(os.environ.get('COURSE_STRESS_COUNT', 500))
+    workers = 8
+    # 테이블 잠금으로 실패한 INSERT 재시도 한도 (넘으면 테스트 실패)
+    max_lock_retries = 50
+
+    def test_concurrent_course_creation(self):
+        teacher = User.objects.create_user(
+            user_id=1001, first_name='Professor', password='password', user_type='t'
+        )
+        per_worker = self.course_count // self.workers
+        errors = []
+
+        def create_course(name):
+            for attempt in range(self.max_lock_retries):
+                try:
+                    return Course.objects.create(name=name, teacher=teacher)
+                except OperationalError:
+                    # 테스트용 SQLite 메모리 DB의 테이블 잠금은 코드 할당과 무관하므로 잠시 후 재시도
+                    time.sleep(0.001 * (attempt + 1))
+            raise AssertionError(f"{name}: table still locked after {self.max_lock_retries} attempts")
+
+        def create_courses(worker):
+            try:
+                for i in range(per_worker):
+                    create_course(f'Course {worker}-{i}')
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        # 코드 공간을 줄여 충돌이 실제로 자주 일어나도록 함
+        with mock.patch('course.models.CODE_LENGTH', 3), ThreadPoolExecutor(self.workers) as executor:
+            list(executor.map(create_courses, range(self.workers)))
+
+        self.assertEqual(errors, [])
+        self.assertEqual(Course.objects.count(), per_worker * self.workers)
+        self.assertEqual(Course.objects.values('code').distinct().count(), per_worker * self.workers)
+
+
+class CourseProgressTest(TestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(
+            user_id=1001, first_name='Professor', password='password', user_type='t'
+        )
+        self.student = User.objects.create_user(
+            user_id=9001, first_name='Student1', password='password', user_type='s'
+        )
+        self.student2 = User.objects.create_user(
+            user_id=9002, first_name='Student2', password='password', user_type='s'
+        )
+        self.course = Course.objects.create(name='Cloud', teacher=self.teacher)
+        self.other_course = Course.objects.create(name='Python', teacher=self.teacher)
+        self.course.participants.add(self.student, self.student2)
+        self.todos = [ToDo.objects.create(course=self.course, content=f'Step {i}') for i in range(4)]
+        other_todo = ToDo.objects.create(course=self.other_course, content='Other')
+
+        # student1: 4개 중 3개 완료, 다른 수업 To-Do 완료는 제외되어야 함
+        for todo in self.todos[:3]:
+            todo.completed_by.add(self.student)
+        other_todo.completed_by.add(self.student, self.student2)
+
+        self.progress_url = reverse('get_course_progress', kwargs={'course_id': self.course.id})
+        self.teacher_headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(self.teacher)}"}
+
+    def test_progress(self):
+        response = self.client.get(self.progress_url, **self.teacher_headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['participants'], [
+            {'name': 'Student1', 'id': 9001, 'progress': 75},
+            {'name': 'Student2', 'id': 9002, 'progress': 0},
+        ])
+
+    def test_large_progress_is_streamed(self):
+        expected = self.client.get(self.progress_url, **self.teacher_headers)
+        with override_settings(STREAMING_JSON_MIN_ROWS=2):
+            response = self.client.get(self.progress_url, **self.teacher_headers)
+        self.assertTrue(response.streaming)
+        self.assertEqual(b''.join(response.streaming_content), expected.content)
+
+    def test_progress_query_count(self):
+        _, access_token = get_tokens_for_user(self.teacher)
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {access_token}"}
+        # 학생/To-Do 수와 무관: 수업(+참여자 수) 조회 + 전체 To-Do COUNT + 학생별 완료 수 집계
+        with self.assertNumQueries(3):
+            response = self.client.get(self.progress_url, **headers)
+        self.assertEqual(len(response.json()['participants']), 2)
+
+        # 스트리밍이면 뒤의 두 쿼리는 본문을 읽는 동안 실행됨
+        with override_settings(STREAMING_JSON_MIN_ROWS=1), self.assertNumQueries(3):
+            response = self.client.get(self.progress_url, **headers)
+            body = b''.join(response.streaming_content)
+        self.assertEqual(len(json.loads(body)['participants']), 2)
+
+    def test_progress_without_todos(self):
+        response = self.client.get(
+            reverse('get_course_progress', kwargs={'course_id': self.other_course.id}), **self.teacher_headers
+        )
+        self.assertEqual(response.json()['participants'], [])
+
+    def test_fail_student_progress(self):
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(self.student)}"}
+        response = self.client.get(self.progress_url, **headers)
+        self.assertEqual(response.status_code, 403)
+
+
+class CourseWorkspaceTest(TestCase):
+    def setUp(self):
+        membership.clear()
+        self.teacher = User.objects.create_user(
+            user_id=1001, first_name='Professor', password='password', user_type='t'
+        )
+        self.other_teacher = User.objects.create_user(
+            user_id=1002, first_name='Other', password='password', user_type='t'
+        )
+        self.student = User.objects.create_user(
+            user_id=9001, first_name='Student', password='password', user_type='s'
+        )
+        self.outsider = User.objects.create_user(
+            user_id=9002, first_name='Outsider', password='password', user_type='s'
+        )
+        self.course = Course.objects.create(name='Cloud', teacher=self.teacher)
+        self.course.participants.add(self.student)
+        todos = ToDo.objects.bulk_create([ToDo(course=self.course, content=f'Step {i}') for i in range(4)])
+        todos[0].completed_by.add(self.student)
+
+        self.url = reverse('get_course_workspace', kwargs={'course_id': self.course.id})
+        self.headers = {
+            user.user_id: {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(user)}"}
+            for user in (self.teacher, self.other_teacher, self.student, self.outsider)
+        }
+
+    def get(self, user, sections=None, course_id=None):
+        url = reverse('get_course_workspace', kwargs={'course_id': course_id}) if course_id else self.url
+        data = {} if sections is None else {'sections': sections}
+        return self.client.get(url, data, **self.headers[user.user_id])
+
+    def test_teacher_gets_all_sections(self):
+        # JWT 사용자 + 수업(To-Do/참여자 수 포함) + To-Do 목록 + 진행률 (세 API를 따로 부르면 10번)
+        with self.assertNumQueries(4):
+            response = self.get(self.teacher)
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+
+        # 기존 세 응답의 필드를 합친 형태
+        enter = self.client.get(
+            reverse('enter_course', kwargs={'course_id': self.course.id}), **self.headers[1001]
+        ).json()
+        todos = self.client.get(reverse('listup_todo', kwargs={'course_id': self.course.id}), **self.headers[1001])
+        progress = self.client.get(
+            reverse('get_course_progress', kwargs={'course_id': self.course.id}), **self.headers[1001]
+        ).json()
+        self.assertEqual(body, {**enter, **todos.json(), **progress})
+        self.assertEqual(body['participants'], [{'name': 'Student', 'id': 9001, 'progress': 25}])
+
+    def test_student_sections(self):
+        # JWT 사용자 + 수업 + 참여 여부 + To-Do 목록
+        with self.assertNumQueries(4):
+            response = self.get(self.student)
+        self.assertEqual(sorted(response.json()), ['course_code', 'course_name', 'todo_list', 'user_name'])
+
+        response = self.get(self.student, 'todos')
+        self.assertEqual(len(response.json()['todo_list']), 4)
+        self.assertNotIn('course_code', response.json())
+
+        response = self.get(self.student, 'course,participants')
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json()['error'], 'Only the teacher can view participants')
+
+    def test_only_requested_sections_are_queried(self):
+        # JWT 사용자 + 수업만
+        with self.assertNumQueries(2):
+            response = self.get(self.teacher, 'course')
+        self.assertEqual(response.json(), {
+            'course_name': 'Cloud', 'user_name': 'Professor', 'course_code': self.course.code,
+        })
+
+        # 전체 To-Do 수는 수업 조회에서 함께 가져오므로 진행률 계산에 COUNT를 다시 하지 않음
+        with self.assertNumQueries(3):
+            response = self.get(self.teacher, ' participants, ')
+        self.assertEqual(sorted(response.json()), ['course_name', 'participants', 'user_name'])
+
+    def test_invalid_sections(self):
+        for sections in ['', ',', 'todos,grades']:
+            response = self.get(self.teacher, sections)
+            self.assertEqual(response.status_code, 400, sections)
+        self.assertEqual(response.json()['unknown'], ['grades'])
+
+    def test_permissions(self):
+        self.assertEqual(self.get(self.other_teacher).status_code, 403)
+        response = self.get(self.outsider, 'todos')
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json()['error'], 'You are not registered for this course')
+        self.assertEqual(self.get(self.teacher, course_id=9999).status_code, 404)
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+
+    def test_streamed_body_matches(self):
+        expected = self.get(self.teacher).content
+        with override_settings(STREAMING_JSON_MIN_ROWS=1):
+            response = self.get(self.teacher)
+        self.assertTrue(response.streaming)
+        self.assertEqual(b''.join(response.streaming_content), expected)
+
+
+# 대규모 데이터 + 시간 측정이라 기본 실행에서는 제외, PROGRESS_BENCH_MAX_SECONDS=2 처럼 허용 시간을 주면 실행
+@skipUnless(os.environ.get('PROGRESS_BENCH_MAX_SECONDS'), "set PROGRESS_BENCH_MAX_SECONDS to run")
+class CourseProgressBenchmarkTest(TestCase):
+    student_count = 1000
+    todo_count = 300
+    max_seconds = float(os.environ.get('PROGRESS_BENCH_MAX_SECONDS') or 0)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create_user(
+            user_id=1, first_name='Professor', password='password', user_type='t'
+        )
+        students = User.objects.bulk_create([
+            User(user_id=100000 + i, first_name=f'Student{i}', user_type='s', password='!')
+            for i in range(cls.student_count)
+        ])
+        cls.course = Course.objects.create(name='Cloud', teacher=cls.teacher)
+        Course.participants.through.objects.bulk_create([
+            Course.participants.through(course_id=cls.course.id, user_id=student.id) for student in students
+        ])
+        todos = ToDo.objects.bulk_create([
+            ToDo(course=cls.course, content=f'Step {i}') for i in range(cls.todo_count)
+        ])
+        # i번째 학생은 앞에서부터 (i % (todo_count + 1))개 완료
+        ToDo.completed_by.through.objects.bulk_create([
+            ToDo.completed_by.through(todo_id=todo.id, user_id=student.id)
+            for i, student in enumerate(students)
+            for todo in todos[:i % (cls.todo_count + 1)]
+        ], batch_size=5000)
+
+    def test_progress_query_count_and_latency(self):
+        _, access_token = get_tokens_for_user(self.teacher)
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {access_token}"}
+        url = reverse('get_course_progress', kwargs={'course_id': self.course.id})
+
+        # 수업(+참여자 수) 조회 + 전체 To-Do COUNT + 학생별 완료 수 집계
+        # 참여자가 STREAMING_JSON_MIN_ROWS 이상이라 스트리밍되므로 뒤의 두 쿼리는 본문을 읽는 동안 실행됨
+        start = time.perf_counter()
+        with self.assertNumQueries(3):
+            response = self.client.get(url, **headers)
+            body = b''.join(response.streaming_content)
+        elapsed = time.perf_counter() - start
+
+        self.assertTrue(response.streaming)
+        participants = json.loads(body)['participants']
+        self.assertEqual(len(participants), self.student_count)
+        self.assertEqual(participants[150]['progress'], 50)
+        self.assertEqual(participants[300]['progress'], 100)
+        self.assertLess(elapsed, self.max_seconds)
+
+
+@override_settings(ROOT_URLCONF='BE.asgi_urls')
+class AsyncCourseViewsTest(TestCase):
+    def setUp(self):
+        membership.clear()
+        self.teacher = User.objects.create_user(
+            user_id=1001, first_name='Professor', password='password', user_type='t'
+        )
+        self.student = User.objects.create_user(
+            user_id=9001, first_name='Student', password='password', user_type='s'
+        )
+        self.course = Course.objects.create(name='Cloud', teacher=self.teacher)
+        self.course2 = Course.objects.create(name='Python', teacher=self.teacher)
+        self.course.participants.add(self.student)
+        todo = ToDo.objects.create(course=self.course, content='Step 1')
+        ToDo.objects.create(course=self.course, content='Step 2')
+        todo.completed_by.add(self.student)
+
+        self.teacher_headers = {'Authorization': f'Bearer {get_tokens_for_user(self.teacher)[1]}'}
+        self.student_headers = {'Authorization': f'Bearer {get_tokens_for_user(self.student)[1]}'}
+
+    def sync_json(self, url, headers):
+        # BE.urls(WSGI)의 sync view 응답과 비교
+        with override_settings(ROOT_URLCONF='BE.urls'):
+            return self.client.get(url, HTTP_AUTHORIZATION=headers['Authorization']).json()
+
+    def test_read_views_are_async(self):
+        for name, kwargs in [('list_up_courses', {}), ('enter_course', {'course_id': 1}),
+                             ('get_course_progress', {'course_id': 1}), ('listup_todo', {'course_id': 1}),
+                             ('get_course_workspace', {'course_id': 1})]:
+            self.assertTrue(iscoroutinefunction(resolve(reverse(name, kwargs=kwargs)).func), name)
+
+    async def test_list_up_courses_matches_sync(self):
+        url = reverse('list_up_courses')
+        for headers in [self.teacher_headers, self.student_headers]:
+            response = await self.async_client.get(url, headers=headers)
+            self.assertEqual(response.status_code, 200)
+            expected = await sync_to_async(self.sync_json)(url, headers)
+            self.assertEqual(response.json(), expected)
+
+        response = await self.async_client.get(url, {'limit': 1}, headers=self.teacher_headers)
+        self.assertEqual(len(response.json()['courses']), 1)
+        self.assertIsNotNone(response.json()['next_cursor'])
+
+    async def test_enter_course(self):
+        url = reverse('enter_course', kwargs={'course_id': self.course.id})
+        response = await self.async_client.get(url, headers=self.student_headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['course_code'], self.course.code)
+
+        url = reverse('enter_course', kwargs={'course_id': self.course2.id})
+        response = await self.async_client.get(url, headers=self.student_headers)
+        self.assertEqual(response.status_code, 403)
+
+    async def test_course_progress_matches_sync(self):
+        url = reverse('get_course_progress', kwargs={'course_id': self.course.id})
+        response = await self.async_client.get(url, headers=self.teacher_headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['participants'], [{'name': 'Student', 'id': 9001, 'progress': 50}])
+        self.assertEqual(response.json(), await sync_to_async(self.sync_json)(url, self.teacher_headers))
+
+        response = await self.async_client.get(url, headers=self.student_headers)
+        self.assertEqual(response.status_code, 403)
+
+    async def test_course_workspace_matches_sync(self):
+        url = reverse('get_course_workspace', kwargs={'course_id': self.course.id})
+        for headers in [self.teacher_headers, self.student_headers]:
+            response = await self.async_client.get(url, headers=headers)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json(), await sync_to_async(self.sync_json)(url, headers))
+
+        with override_settings(STREAMING_JSON_MIN_ROWS=1):
+            response = await self.async_client.get(url, headers=self.teacher_headers)
+        self.assertTrue(response.streaming)
+        body = b''.join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(json.loads(body), await sync_to_async(self.sync_json)(url, self.teacher_headers))
+
+        response = await self.async_client.get(url, {'sections': 'participants'}, headers=self.student_headers)
+        self.assertEqual(response.status_code, 403)
+
+    @override_settings(STREAMING_JSON_MIN_ROWS=1)
+    async def test_course_progress_streamed(self):
+        url = reverse('get_course_progress', kwargs={'course_id': self.course.id})
+        response = await self.async_client.get(url, headers=self.teacher_headers)
+        self.assertTrue(response.streaming)
+        body = b''.join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(json.loads(body), {
+            'course_name': 'Cloud',
+            'user_name': 'Professor',
+            'participants': [{'name': 'Student', 'id': 9001, 'progress': 50}],
+        })
+
+    async def test_authentication_and_method(self):
+        url = reverse('list_up_courses')
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response['WWW-Authenticate'], 'Bearer realm="api"')
+
+        response = await self.async_client.get(url, headers={'Authorization': 'Bearer invalid'})
+        self.assertEqual(response.status_code, 401)
+
+        response = await self.async_client.post(url, headers=self.teacher_headers)
+        self.assertEqual(response.status_code, 405)
+
+    async def test_token_without_claims(self):
+        headers = {'Authorization': f'Bearer {AccessToken.for_user(self.teacher)}'}
+        response = await self.async_client.get(reverse('list_up_courses'), headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['name'], 'Professor')
+
+
+@override_settings(ROOT_URLCONF='BE.asgi_urls')
+class CourseProgressStreamTest(TestCase):
+    def setUp(self):
+        membership.clear()
+        self.teacher = User.objects.create_user(
+            user_id=1001, first_name='Professor', password='password', user_type='t'
+        )
+        self.student = User.objects.create_user(
+            user_id=9001, first_name='Student', password='password', user_type='s'
+        )
+        self.student2 = User.objects.create_user(
+            user_id=9002, first_name='Student2', password='password', user_type='s'
+        )
+        self.course = Course.objects.create(name='Cloud', teacher=self.teacher)
+        self.course.participants.add(self.student)
+        self.todos = ToDo.objects.bulk_create([ToDo(course=self.course, content=f'Step {i}') for i in range(4)])
+
+        self.stream_url = reverse('course_progress_stream', kwargs={'course_id': self.course.id})
+        self.teacher_headers = {'Authorization': f'Bearer {get_tokens_for_user(self.teacher)[1]}'}
+
+    @staticmethod
+    async def next_message(stream):
+        chunk = await asyncio.wait_for(anext(stream), timeout=5)
+        return chunk.decode()
+
+    @staticmethod
+    def parse(message):
+        event, data = message.strip().split('\n')
+        return event.removeprefix('event: '), json.loads(data.removeprefix('data: '))
+
+    def post(self, name, user, data):
+        # 이벤트는 commit 후에 전송되므로 테스트 트랜잭션 안에서는 on_commit callback을 직접 실행
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                reverse(name, kwargs={'course_id': self.course.id}) if name != 'register_course' else reverse(name),
+                data=json.dumps(data), content_type='application/json',
+                HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}',
+            )
+
+    def delete(self, name, user):
+        # 종료된 수업 삭제 worker는 시작하지 않음
+        with mock.patch('course.purge.enqueue'), self.captureOnCommitCallbacks(execute=True):
+            return self.client.delete(
+                reverse(name, kwargs={'course_id': self.course.id}),
+                HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}',
+            )
+
+    async def test_snapshot_then_deltas(self):
+        response = await self.async_client.get(self.stream_url, headers=self.teacher_headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = aiter(response.streaming_content)
+
+        self.assertEqual(await self.next_message(stream), 'retry: 3000\n\n')
+        event, data = self.parse(await self.next_message(stream))
+        self.assertEqual(event, 'snapshot')
+        self.assertEqual(data['participants'], [{'name': 'Student', 'id': 9001, 'progress': 0}])
+
+        # 수강 등록 delta
+        response = await sync_to_async(self.post)('register_course', self.student2, {'code': self.course.code})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.parse(await self.next_message(stream)),
+            ('enrolled', {'name': 'Student2', 'id': 9002, 'progress': 0}),
+        )
+
+        # To-Do 완료 delta
+        response = await sync_to_async(self.post)(
+            'complete_todo', self.student, {'todo_ids': [self.todos[0].id, self.todos[1].id]}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.parse(await self.next_message(stream)),
+            ('progress', {'name': 'Student', 'id': 9001, 'progress': 50}),
+        )
+
+        # To-Do 추가 시 전체 snapshot 재전송
+        response = await sync_to_async(self.post)('add_todo', self.teacher, {'todos': ['Step 4', 'Step 5', 'Step 6', 'Step 7']})
+        self.assertEqual(response.status_code, 201)
+        event, data = self.parse(await self.next_message(stream))
+        self.assertEqual(event, 'snapshot')
+        self.assertEqual([p['progress'] for p in data['participants']], [25, 0])
+
+        # 수업 종료 시 스트림 종료
+        await sync_to_async(self.delete)('end_course', self.teacher)
+        self.assertEqual(self.parse(await self.next_message(stream)), ('ended', {}))
+        with self.assertRaises(StopAsyncIteration):
+            await self.next_message(stream)
+        self.assertFalse(events.has_subscribers(self.course.id))
+
+    @override_settings(SSE_HEARTBEAT_SECONDS=0.01)
+    async def test_heartbeat(self):
+        response = await self.async_client.get(self.stream_url, headers=self.teacher_headers)
+        stream = aiter(response.streaming_content)
+        await self.next_message(stream)
+        await self.next_message(stream)
+        self.assertEqual(await self.next_message(stream), ': ping\n\n')
+        # 클라이언트 연결 종료 시 ASGI handler처럼 response를 닫음
+        await stream.aclose()
+        await sync_to_async(response.close)()
+        self.assertFalse(events.has_subscribers(self.course.id))
+
+    async def test_access_token_query_param(self):
+        # 브라우저 EventSource처럼 헤더 없이 쿼리 파라미터로 인증
+        token = get_tokens_for_user(self.teacher)[1]
+        response = await self.async_client.get(self.stream_url, {'access_token': token})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        await sync_to_async(response.close)()
+
+        response = await self.async_client.get(self.stream_url, {'access_token': 'invalid'})
+        self.assertEqual(response.status_code, 401)
+        response = await self.async_client.get(self.stream_url)
+        self.assertEqual(response.status_code, 401)
+
+    async def test_rolled_back_change_is_not_published(self):
+        subscription = events.subscribe(self.course.id)
+        try:
+            def register_then_roll_back():
+                with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                    with transaction.atomic():
+                        response = self.client.post(
+                            reverse('register_course'), data=json.dumps({'code': self.course.code}),
+                            content_type='application/json',
+                            HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.student2)}',
+                        )
+                        self.assertEqual(response.status_code, 200)
+                        transaction.set_rollback(True)
+                return callbacks
+            # rollback된 savepoint의 callback은 버려짐
+            self.assertEqual(await sync_to_async(register_then_roll_back)(), [])
+            await asyncio.sleep(0)
+            self.assertTrue(subscription.queue.empty())
+        finally:
+            subscription.close()
+
+    async def test_fail_student_stream(self):
+        headers = {'Authorization': f'Bearer {get_tokens_for_user(self.student)[1]}'}
+        response = await self.async_client.get(self.stream_url, headers=headers)
+        self.assertEqual(response.status_code, 403)
+
+    @override_settings(SSE_QUEUE_SIZE=2)
+    async def test_slow_subscriber_gets_resync(self):
+        subscription = events.subscribe(self.course.id)
+        try:
+            for i in range(5):
+                events.publish(self.course.id, {'type': 'progress', 'participant': {'id': i}})
+            await asyncio.sleep(0)
+            self.assertIs(await subscription.get(), events.RESYNC)
+            self.assertTrue(subscription.queue.empty())
+        finally:
+            subscription.close()
+
@@ -1,13 +1,30 @@
+import asyncio
+import csv
+import io
 import json
 from venv import logger
+from django.conf import settings
+from django.db import transaction
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, Max, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.views.decorators.csrf import csrf_exempt
+from BE.conditional import acached_response, cached_response, make_etag, not_modified
+from BE.streaming import (
+    CHUNK_SIZE, astream_json, astream_json_lists, should_stream, stream_json, stream_json_lists,
+)
+from BE.pagination import InvalidPageParams, apaginate, get_page_params, paginate
+from course import events, membership, purge
 from course.models import Course
+from todo.models import ToDo
+from todo.views import todo_list_queryset
 from django.views.decorators.http import require_POST, require_GET, require_http_methods
 from user.models import User
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from rest_framework.decorators import api_view, permission_classes, authentication_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from user.authentication import QueryParamJWTAuthentication, StatelessJWTAuthentication, async_api_view
 
 
 @csrf_exempt
@@ -52,46 +69,103 @@ def create_course(request):
         return JsonResponse({"error": "Internal server error"}, status=500)
 
 
+def participant_count():
+    """수업별 참여자 수. JOIN + GROUP BY 없이 (course_id, user_id) 인덱스에서 COUNT."""
+    participants = Course.participants.through.objects.filter(course_id=OuterRef('id'))
+    return Coalesce(Subquery(participants.values('course_id').annotate(count=Count('*')).values('count')), 0)
+
+
+def courses_for(user):
+    """
+    역할별 수업 목록 queryset과 수업을 응답용 dict로 바꾸는 함수를 반환.
+    교수/학생이 아니면 (None, None).
+    """
+    if user.user_type == 't': #교수인 경우
+        # 참여자 수는 수업마다 COUNT 쿼리를 날리지 않고 annotate로 한 번에 집계
+        courses = Course.objects.filter(teacher=user).annotate(
+            participant_count=participant_count()
+        )
+        return courses, lambda c: {
+            'id': c.id,
+            'name': c.name,
+            'participant_count': c.participant_count,
+            'created_at': c.created_at,
+        }
+
+    if user.user_type == 's': #학생인 경우
+        # 교수 정보는 JOIN으로 함께 조회
+        courses = Course.objects.filter(participants=user).select_related('teacher')
+        return courses, lambda c: {
+            'id': c.id,
+            'name': c.name,
+            'teacher_name': c.teacher.first_name,
+            'created_at': c.created_at,
+        }
+
+    return None, None
+
+
+def course_list_version(user):
+    """역할별 수업 목록의 버전을 집계 쿼리 1번으로 계산 (목록 조회 없이 ETag 생성용)."""
+    # 수업이 삭제/추가되면 개수나 id 합이 바뀜
+    aggregates = {'count': Count('id'), 'created_at': Max('created_at'), 'ids': Sum('id')}
+    if user.user_type == 't':
+        # 수강 등록은 타임스탬프를 남기지 않으므로 참여자 수로 반영
+        return Course.objects.filter(teacher=user), {**aggregates, 'participants': Sum(participant_count())}
+    return Course.objects.filter(participants=user), aggregates
+
+
+def course_list_etag(user, version, limit, cursor):
+    return make_etag(
+        'list_up_courses', user.id, user.user_type, user.first_name, tuple(version.values()), limit, cursor
+    )
+
+
+def course_list_response(user, course_data, limit, next_cursor):
+    response_data = {
+        "courses": course_data,
+        "name": user.first_name,
+        "role": user.user_type
+    }
+    if limit:
+        response_data["next_cursor"] = next_cursor
+
+    return JsonResponse(response_data, status=200)
+
+
 @csrf_exempt
 @api_view(['GET'])
-@authentication_classes([JWTAuthentication])
+@authentication_classes([StatelessJWTAuthentication])
 @permission_classes([IsAuthenticated])
 def list_up_courses(request):
     try:
-        #반환을 위한 request 사용자명, 사용자 타입 추출
-        user_name = request.user.first_name
-        user_role = request.user.user_type
+        # limit/cursor가 있으면 (created_at, id) 기준 cursor 페이지네이션
+        try:
+            limit, cursor = get_page_params(request)
+        except InvalidPageParams as e:
+            return JsonResponse({"error": str(e)}, status=400)
 
         # 역할에 따라서
-        if user_role == 't': #교수인 경우
-            courses = Course.objects.filter(teacher=request.user)
-            course_data = [{
-                'id': c.id,
-                'name': c.name,
-                'participant_count': c.participants.count(),
-                'created_at': c.created_at,
-            } for c in courses]
-
-        elif user_role == 's': #학생인 경우
-            courses = Course.objects.filter(participants=request.user)
-            course_data = [{
-                'id': c.id,
-                'name': c.name,
-                'teacher_name': c.teacher.first_name,
-                'created_at': c.created_at,
-            } for c in courses]
-
-        else: #그외 처리
+        courses, serialize = courses_for(request.user)
+        if courses is None: #그외 처리
             return JsonResponse(
                 {"error": "Invalid user role"}, 
                 status=400
             )
-        
-        return JsonResponse({
-            "courses": course_data,
-            "name": user_name,
-            "role": user_role
-        }, status=200)
+
+        # 목록이 바뀌지 않았으면 수업을 조회/직렬화하지 않고 304
+        versioned, aggregates = course_list_version(request.user)
+        etag = course_list_etag(request.user, versioned.aggregate(**aggregates), limit, cursor)
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+
+        def render_listing():
+            page, next_cursor = paginate(courses, limit, cursor) if limit else (courses, None)
+            course_data = [serialize(c) for c in page]
+            return course_list_response(request.user, course_data, limit, next_cursor)
+
+        return cached_response(etag, render_listing)
 
     except Exception as e:
         logger.error(f"Error in list_up_courses: {str(e)}")
@@ -101,6 +175,40 @@ def list_up_courses(request):
         )
 
 
+# ASGI(BE/asgi_urls.py)에서 쓰는 list_up_courses의 async 버전
+@async_api_view(['GET'])
+async def alist_up_courses(request):
+    try:
+        try:
+            limit, cursor = get_page_params(request)
+        except InvalidPageParams as e:
+            return JsonResponse({"error": str(e)}, status=400)
+
+        courses, serialize = courses_for(request.user)
+        if courses is None:
+            return JsonResponse({"error": "Invalid user role"}, status=400)
+
+        versioned, aggregates = course_list_version(request.user)
+        etag = course_list_etag(request.user, await versioned.aaggregate(**aggregates), limit, cursor)
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+
+        async def render_listing():
+            if limit:
+                page, next_cursor = await apaginate(courses, limit, cursor)
+            else:
+                page, next_cursor = [c async for c in courses], None
+            course_data = [serialize(c) for c in page]
+            return course_list_response(request.user, course_data, limit, next_cursor)
+
+        return await acached_response(etag, render_listing)
+
+    except Exception as e:
+        logger.error(f"Error in alist_up_courses: {str(e)}")
+        return JsonResponse({"error": str(e)}, status=500)
+
+
 @csrf_exempt
 @api_view(['DELETE'])
 @authentication_classes([JWTAuthentication])
@@ -111,10 +219,14 @@ def end_course(request, course_id):
     except Course.DoesNotExist:
         return JsonResponse({"error": "Course not found"}, status=404)
 
-    if course.teacher != request.user:
+    if course.teacher_id != request.user.id:
         return JsonResponse({"error": "Only the teacher can end this course"}, status=403)
 
-    course.delete()
+    # 종료 표시만 하고 바로 응답, 딸린 데이터는 commit 후 백그라운드에서 배치 삭제
+    course.end()
+    membership.invalidate(course_id)
+    events.publish_on_commit(course_id, {'type': 'ended'})
+    transaction.on_commit(purge.enqueue)
     return JsonResponse({"message": "Course ended successfully"}, status=200)
 
 
@@ -155,6 +267,14 @@ def register_course(request):
             }, status=400)
         
         course.participants.add(request.user)
+        membership.invalidate(course.id, request.user.id)
+        # 진행률 대시보드(SSE)가 열려 있을 때만 delta 계산
+        if events.has_subscribers(course.id):
+            user_id = request.user.id
+            events.publish_on_commit(course.id, lambda: {
+                'type': 'enrolled',
+                'participant': course.participant_progress(user_id),
+            })
         
         # 성공 응답(수업 id,name도 반환)
         return JsonResponse({
@@ -175,17 +295,159 @@ def register_course(request):
         }, status=500)
 
 
-@api_view(['GET'])
+# 명단 한 번에 등록할 수 있는 최대 학생 수 (학번 조회가 쿼리 1번의 IN 목록이므로 SQLite 변수 개수 한도 이하)
+DEFAULT_ROSTER_MAX_SIZE = 5000
+
+
+class InvalidRoster(Exception):
+    pass
+
+
+def read_roster(request):
+    """
+    JSON ``{"user_ids": [...]}`` 또는 multipart의 CSV 파일(``roster``, 첫 열이 학번)에서
+    (행 번호, 학번) 목록을 읽음. CSV는 첫 행이 숫자가 아니면 헤더로 보고 건너뜀.
+    """
+    if request.content_type.startswith('multipart/form-data'):
+        roster_file = request.FILES.get('roster')
+        if roster_file is None:
+            raise InvalidRoster("roster file is required")
+        try:
+            text = roster_file.read().decode('utf-8-sig')
+        except UnicodeDecodeError:
+            raise InvalidRoster("roster must be a UTF-8 CSV file")
+
+        rows = []
+        reader = csv.reader(io.StringIO(text))
+        for row in reader:
+            if not row or not row[0].strip():
+                continue
+            value = row[0].strip()
+            if reader.line_num == 1 and not value.isdecimal():
+                continue
+            rows.append((reader.line_num, value))
+        return rows
+
+    data = json.loads(request.body)
+    if not isinstance(data, dict):
+        raise InvalidRoster("Request body must be a JSON object")
+    user_ids = data.get('user_ids')
+    if not isinstance(user_ids, list):
+        raise InvalidRoster("user_ids must be a list")
+    return list(enumerate(user_ids, start=1))
+
+
+def parse_user_id(value):
+    """학번으로 쓸 수 없는 값이면 None."""
+    # isdigit()은 '²' 같은 문자도 참이라 int()가 실패하므로 isdecimal() 사용
+    if isinstance(value, str) and value.isdecimal():
+        value = int(value)
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        return None
+    return value
+
+
+@csrf_exempt
+@api_view(['POST'])
 @authentication_classes([JWTAuthentication])
 @permission_classes([IsAuthenticated])
+def enroll_students(request, course_id):
+    try:
+        # 교수님인 경우만
+        if request.user.user_type != 't':
+            return JsonResponse({"error": "Only teachers can enroll students"}, status=403)
+
+        try:
+            course = Course.objects.get(id=course_id)
+        except Course.DoesNotExist:
+            return JsonResponse({"error": "Course not found"}, status=404)
+        if course.teacher_id != request.user.id:
+            return JsonResponse({"error": "Only the teacher can enroll students in this course"}, status=403)
+
+        try:
+            rows = read_roster(request)
+        except InvalidRoster as e:
+            return JsonResponse({"error": str(e)}, status=400)
+        if not rows:
+            return JsonResponse({"error": "Roster is empty"}, status=400)
+        max_size = getattr(settings, "ROSTER_MAX_SIZE", DEFAULT_ROSTER_MAX_SIZE)
+        if len(rows) > max_size:
+            return JsonResponse({"error": f"Too many students (max {max_size})"}, status=400)
+
+        user_ids = {parse_user_id(value) for _, value in rows} - {None}
+        # 학번 -> (pk, user_type)을 쿼리 1번으로 조회
+        users = {
+            user_id: (pk, user_type)
+            for user_id, pk, user_type in User.objects.filter(user_id__in=user_ids).values_list(
+                'user_id', 'id', 'user_type'
+            )
+        }
+        student_pks = [pk for pk, user_type in users.values() if user_type == 's']
+
+        # .add() 대신 through 테이블에 한 번에 INSERT, 이미 등록된 학생은 건너뜀
+        through = Course.participants.through
+        with transaction.atomic():
+            enrolled_before = set(
+                through.objects.filter(course_id=course.id, user_id__in=student_pks).values_list('user_id', flat=True)
+            )
+            through.objects.bulk_create(
+                [through(course_id=course.id, user_id=pk) for pk in student_pks if pk not in enrolled_before],
+                ignore_conflicts=True,
+            )
+
+        # 행별 결과
+        results = []
+        seen = set()
+        for row, value in rows:
+            user_id = parse_user_id(value)
+            if user_id is None:
+                status = 'invalid'
+            elif user_id in seen:
+                status = 'duplicate'
+            elif user_id not in users:
+                status = 'not_found'
+            elif users[user_id][1] != 's':
+                status = 'not_student'
+            elif users[user_id][0] in enrolled_before:
+                status = 'already_enrolled'
+            else:
+                status = 'enrolled'
+            if user_id is not None:
+                seen.add(user_id)
+            results.append({"row": row, "user_id": value, "status": status})
+
+        summary = {}
+        for result in results:
+            summary[result['status']] = summary.get(result['status'], 0) + 1
+        # 학생마다 delta를 보내지 않고 진행률 대시보드(SSE)에 snapshot 재전송
+        if summary.get('enrolled'):
+            events.publish_on_commit(course.id, events.RESYNC)
+
+        return JsonResponse({
+            "message": "Roster processed",
+            "course_id": course.id,
+            "summary": summary,
+            "results": results,
+        }, status=200)
+
+    except json.JSONDecodeError:
+        return JsonResponse({"error": "Invalid JSON format"}, status=400)
+    except Exception as e:
+        logger.error(f"Error in enroll_students: {str(e)}")
+        return JsonResponse({"error": "Failed to enroll students"}, status=500)
+
+
+@api_view(['GET'])
+@authentication_classes([StatelessJWTAuthentication])
+@permission_classes([IsAuthenticated])
 def enter_course(request, course_id):
     try:
         user = request.user
         course = Course.objects.get(id=course_id)
 
-        if user.user_type == 't' and course.teacher != user:
+        if user.user_type == 't' and course.teacher_id != user.id:
             return JsonResponse({"error": "Unauthorized access"}, status=403)
-        if user.user_type == 's' and user not in course.participants.all():
+        if user.user_type == 's' and not membership.is_participant(course.id, user.id):
             return JsonResponse({"error": "You are not registered for this course"}, status=403)
         return JsonResponse({
             "course_name": course.name,
@@ -198,32 +460,318 @@ def enter_course(request, course_id):
     except Exception as e:
         return JsonResponse({"error": "Internal server error", "details": str(e)}, status=500)
 
+
+@async_api_view(['GET'])
+async def aenter_course(request, course_id):
+    try:
+        user = request.user
+        course = await Course.objects.aget(id=course_id)
+
+        if user.user_type == 't' and course.teacher_id != user.id:
+            return JsonResponse({"error": "Unauthorized access"}, status=403)
+        if user.user_type == 's' and not await membership.ais_participant(course.id, user.id):
+            return JsonResponse({"error": "You are not registered for this course"}, status=403)
+        return JsonResponse({
+            "course_name": course.name,
+            "user_name": user.first_name,
+            "course_code" : course.code,
+        }, status=200)
+
+    except Course.DoesNotExist:
+        return JsonResponse({"error": "Course not found"}, status=404)
+    except Exception as e:
+        return JsonResponse({"error": "Internal server error", "details": str(e)}, status=500)
+
 @api_view(['GET'])
-@authentication_classes([JWTAuthentication])
+@authentication_classes([StatelessJWTAuthentication])
 @permission_classes([IsAuthenticated])
 def get_course_progress(request, course_id):
     try:
-        course = Course.objects.get(id=course_id)
+        # 참여자 수는 같은 쿼리에서 함께 조회 (스트리밍 여부 판단용)
+        course = Course.objects.annotate(participant_count=participant_count()).get(id=course_id)
         
         # 교수자 권한 확인
-        if request.user != course.teacher:
+        if request.user.id != course.teacher_id:
             return JsonResponse({"error": "Unauthorized access"}, status=403)
+
+        # 참여자가 많으면 목록을 메모리에 만들지 않고 chunk 단위로 스트리밍
+        if should_stream(course.participant_count):
+            return stream_json(
+                {'course_name': course.name, 'user_name': request.user.first_name},
+                'participants', course.iter_participants_progress(CHUNK_SIZE),
+            )
             
-        # 학생 목록과 진행률 데이터
-        participants_data = [{
-            'name': student.first_name,
-            'id': student.user_id,
-            'progress': 0  # 추후 실제 진행률 로직 추가
-        } for student in course.participants.all()]
+        # 학생 목록과 진행률 데이터 (완료한 To-Do / 전체 To-Do)
+        participants_data = course.participants_progress()
         
         response_data = {
             'course_name': course.name,
             'user_name': request.user.first_name,
             'participants': participants_data
         }
-        print(response_data)
         
         return JsonResponse(response_data, status=200)
         
     except Course.DoesNotExist:
-        return JsonResponse({"error": "Course not found"}, status=404)
\ No newline at end of file
+        return JsonResponse({"error": "Course not found"}, status=404)
+
+
+@async_api_view(['GET'])
+async def aget_course_progress(request, course_id):
+    try:
+        course = await Course.objects.annotate(participant_count=participant_count()).aget(id=course_id)
+
+        if request.user.id != course.teacher_id:
+            return JsonResponse({"error": "Unauthorized access"}, status=403)
+
+        if should_stream(course.participant_count):
+            return astream_json(
+                {'course_name': course.name, 'user_name': request.user.first_name},
+                'participants', course.aiter_participants_progress(CHUNK_SIZE),
+            )
+
+        return JsonResponse({
+            'course_name': course.name,
+            'user_name': request.user.first_name,
+            'participants': await course.aparticipants_progress()
+        }, status=200)
+
+    except Course.DoesNotExist:
+        return JsonResponse({"error": "Course not found"}, status=404)
+
+
+# 수업 화면 한 번에 조회: enter_course + listup_todo + get_course_progress
+WORKSPACE_SECTIONS = ('course', 'todos', 'participants')
+# 교수자만 볼 수 있는 section
+TEACHER_SECTIONS = {'participants'}
+
+
+def todo_count():
+    """수업별 To-Do 수. (course, created_at, id) 인덱스에서 COUNT."""
+    todos = ToDo.objects.filter(course_id=OuterRef('id'))
+    return Coalesce(Subquery(todos.values('course_id').annotate(count=Count('*')).values('count')), 0)
+
+
+def workspace_sections(request):
+    """
+    ?sections=course,todos,participants 를 검사해 (sections, None) 또는 (None, 오류 응답)을 반환.
+    sections가 없으면 사용자가 볼 수 있는 section 전체.
+    """
+    user = request.user
+    if user.user_type not in ('t', 's'):
+        return None, JsonResponse({"error": "Unauthorized access"}, status=403)
+    param = request.GET.get('sections')
+    if param is None:
+        return [name for name in WORKSPACE_SECTIONS if user.user_type == 't' or name not in TEACHER_SECTIONS], None
+
+    requested = {name.strip() for name in param.split(',') if name.strip()}
+    unknown = sorted(requested - set(WORKSPACE_SECTIONS))
+    if not requested or unknown:
+        return None, JsonResponse({
+            "error": f"sections must be a comma-separated subset of {', '.join(WORKSPACE_SECTIONS)}",
+            "unknown": unknown,
+        }, status=400)
+    if user.user_type != 't' and requested & TEACHER_SECTIONS:
+        return None, JsonResponse({"error": "Only the teacher can view participants"}, status=403)
+    return [name for name in WORKSPACE_SECTIONS if name in requested], None
+
+
+def workspace_course(sections):
+    """권한 확인과 목록 크기(스트리밍 여부) 판단에 필요한 값을 수업 조회 1번으로 가져오는 queryset."""
+    counts = {}
+    if 'todos' in sections or 'participants' in sections:
+        # 진행률 계산의 전체 To-Do 수로도 사용
+        counts['todo_count'] = todo_count()
+    if 'participants' in sections:
+        counts['participant_count'] = participant_count()
+    return Course.objects.annotate(**counts)
+
+
+def workspace_forbidden(user, course, is_participant):
+    if user.user_type == 't' and course.teacher_id != user.id:
+        return JsonResponse({"error": "Unauthorized access"}, status=403)
+    if user.user_type == 's' and not is_participant:
+        return JsonResponse({"error": "You are not registered for this course"}, status=403)
+    return None
+
+
+def workspace_fields(user, course, sections):
+    fields = {'course_name': course.name, 'user_name': user.first_name}
+    if 'course' in sections:
+        fields['course_code'] = course.code
+    return fields
+
+
+def workspace_should_stream(course, sections):
+    counts = [course.todo_count] if 'todos' in sections else []
+    if 'participants' in sections:
+        counts.append(course.participant_count)
+    return bool(counts) and should_stream(max(counts))
+
+
+@api_view(['GET'])
+@authentication_classes([StatelessJWTAuthentication])
+@permission_classes([IsAuthenticated])
+def get_course_workspace(request, course_id):
+    """
+    수업 정보, To-Do 목록, (교수자) 학생별 진행률을 권한 확인 1번으로 한 응답에 반환.
+    응답은 enter_course/listup_todo/get_course_progress 응답의 필드를 합친 형태이고
+    section마다 쿼리 1번 (수업 조회에 To-Do/참여자 수 포함).
+    """
+    try:
+        user = request.user
+        sections, error = workspace_sections(request)
+        if error is not None:
+            return error
+
+        course = workspace_course(sections).get(id=course_id)
+        error = workspace_forbidden(
+            user, course, user.user_type == 's' and membership.is_participant(course.id, user.id)
+        )
+        if error is not None:
+            return error
+
+        fields = workspace_fields(user, course, sections)
+        todos = todo_list_queryset(course) if 'todos' in sections else None
+        if workspace_should_stream(course, sections):
+            lists = {}
+            if todos is not None:
+                lists['todo_list'] = todos.iterator(chunk_size=CHUNK_SIZE)
+            if 'participants' in sections:
+                lists['participants'] = course.iter_participants_progress(CHUNK_SIZE, total=course.todo_count)
+            return stream_json_lists(fields, lists)
+
+        if todos is not None:
+            fields['todo_list'] = list(todos)
+        if 'participants' in sections:
+            fields['participants'] = course.participants_progress(total=course.todo_count)
+        return JsonResponse(fields, status=200)
+
+    except Course.DoesNotExist:
+        return JsonResponse({"error": "Course not found"}, status=404)
+    except Exception as e:
+        logger.error(f"Error in get_course_workspace: {str(e)}")
+        return JsonResponse({"error": "Internal server error"}, status=500)
+
+
+@async_api_view(['GET'])
+async def aget_course_workspace(request, course_id):
+    try:
+        user = request.user
+        sections, error = workspace_sections(request)
+        if error is not None:
+            return error
+
+        course = await workspace_course(sections).aget(id=course_id)
+        error = workspace_forbidden(
+            user, course, user.user_type == 's' and await membership.ais_participant(course.id, user.id)
+        )
+        if error is not None:
+            return error
+
+        fields = workspace_fields(user, course, sections)
+        todos = todo_list_queryset(course) if 'todos' in sections else None
+        if workspace_should_stream(course, sections):
+            lists = {}
+            if todos is not None:
+                lists['todo_list'] = todos.aiterator(chunk_size=CHUNK_SIZE)
+            if 'participants' in sections:
+                lists['participants'] = course.aiter_participants_progress(CHUNK_SIZE, total=course.todo_count)
+            return astream_json_lists(fields, lists)
+
+        if todos is not None:
+            fields['todo_list'] = [todo async for todo in todos]
+        if 'participants' in sections:
+            fields['participants'] = await course.aparticipants_progress(total=course.todo_count)
+        return JsonResponse(fields, status=200)
+
+    except Course.DoesNotExist:
+        return JsonResponse({"error": "Course not found"}, status=404)
+    except Exception as e:
+        logger.error(f"Error in aget_course_workspace: {str(e)}")
+        return JsonResponse({"error": "Internal server error"}, status=500)
+
+class EventStreamResponse(StreamingHttpResponse):
+    """
+    연결이 중간에 끊겨 generator가 끝까지 돌지 않아도
+    handler가 호출하는 close()에서 구독을 해제함.
+    """
+    def __init__(self, subscription, streaming_content):
+        super().__init__(streaming_content, content_type='text/event-stream')
+        self.subscription = subscription
+        self['Cache-Control'] = 'no-cache'
+        self['X-Accel-Buffering'] = 'no'
+
+    def close(self):
+        self.subscription.close()
+        super().close()
+
+
+def sse_message(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n".encode()
+
+
+async def progress_snapshot(course):
+    return {
+        'course_name': course.name,
+        'participants': await course.aparticipants_progress(),
+    }
+
+
+async def progress_events(course, subscription):
+    """
+    처음에 전체 snapshot을 보내고 이후에는 수강 등록/To-Do 완료 delta만 전송.
+    delta가 없으면 heartbeat를 보내고, 다른 worker 프로세스의 변경을 반영하기 위해
+    SSE_RESYNC_SECONDS마다 snapshot을 다시 보냄. SSE_MAX_SECONDS가 지나면 연결을
+    끊고 브라우저 EventSource가 재연결하도록 함.
+    """
+    heartbeat = getattr(settings, 'SSE_HEARTBEAT_SECONDS', 15)
+    resync = getattr(settings, 'SSE_RESYNC_SECONDS', 60)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + getattr(settings, 'SSE_MAX_SECONDS', 300)
+
+    try:
+        yield b"retry: 3000\n\n"
+        yield sse_message('snapshot', await progress_snapshot(course))
+        next_resync = loop.time() + resync
+
+        while (now := loop.time()) < deadline:
+            try:
+                event = await asyncio.wait_for(
+                    subscription.get(), timeout=min(heartbeat, next_resync - now, deadline - now)
+                )
+            except asyncio.TimeoutError:
+                if loop.time() < next_resync:
+                    yield b": ping\n\n"
+                    continue
+                event = events.RESYNC
+
+            if event['type'] == 'resync':
+                yield sse_message('snapshot', await progress_snapshot(course))
+                next_resync = loop.time() + resync
+            elif event['type'] == 'ended':
+                yield sse_message('ended', {})
+                return
+            elif event['participant'] is not None:
+                yield sse_message(event['type'], event['participant'])
+    finally:
+        subscription.close()
+
+
+# 진행률 대시보드용 SSE. ASGI(BE/asgi_urls.py)에서만 라우팅됨
+# EventSource는 헤더를 보낼 수 없으므로 new EventSource(`${url}?access_token=${token}`)로 연결.
+# 토큰이 만료되면 재연결이 401로 끝나므로 클라이언트는 onerror에서 토큰을 갱신해 다시 연결
+@async_api_view(['GET'], authentication_class=QueryParamJWTAuthentication)
+async def course_progress_stream(request, course_id):
+    try:
+        course = await Course.objects.aget(id=course_id)
+    except Course.DoesNotExist:
+        return JsonResponse({"error": "Course not found"}, status=404)
+
+    if request.user.id != course.teacher_id:
+        return JsonResponse({"error": "Unauthorized access"}, status=403)
+
+    # snapshot 조회 중 발생한 변경을 놓치지 않도록 스트림 시작 전에 구독
+    subscription = events.subscribe(course.id)
+    return EventStreamResponse(subscription, progress_events(course, subscription))
+
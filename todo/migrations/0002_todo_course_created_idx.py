@@ -0,0 +1,24 @@
+# Generated by Django 4.2.11 on 2026-10-18 20:49
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0002_course_teacher_created_idx'),
+        ('todo', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='todo',
+            name='course',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='todo_items', to='course.course'),
+        ),
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(fields=['course', 'created_at', 'id'], name='todo_course_created_idx'),
+        ),
+    ]
@@ -6,13 +6,20 @@ from user.models import User
 
 # Create your models here.
 class ToDo(models.Model):
-    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="todo_items")
+    # course 단독 인덱스는 아래 (course, created_at, id) 인덱스가 대신함
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="todo_items", db_index=False)
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     # deadline = models.DateTimeField()
     completed_by = models.ManyToManyField(User, related_name="completed_todos", blank=True)
 
+    class Meta:
+        indexes = [
+            # 수업별 To-Do 목록을 (created_at, id) 순으로 정렬 없이 읽음
+            models.Index(fields=["course", "created_at", "id"], name="todo_course_created_idx"),
+        ]
+
     def __str__(self):
         return self.content
         # return f"{self.content[:50]} (Course: {self.course.name})" 라고 해야 하나?
\ No newline at end of file
@@ -1,9 +1,12 @@
 import json
 
-from django.test import TestCase
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework_simplejwt.tokens import AccessToken
 
+from course import membership
 from course.models import Course
 from todo.models import ToDo
 from user.models import User
@@ -34,6 +37,44 @@ class CreateToDoListTest(TestCase):
         self.assertEqual(response.status_code, 201)
         self.assertEqual(ToDo.objects.count(), 1)
 
+    def test_t_add_todo_bulk(self):
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {self.teacher_token}"}
+        todos = [f"Step {i}" for i in range(50)] + ["   "]
+        # JWT 사용자 조회 + 수업 조회 + INSERT 1번 (+ savepoint)
+        with self.assertNumQueries(5):
+            response = self.client.post(
+                self.add_todo_url,
+                data=json.dumps({"todos": todos}),
+                content_type="application/json",
+                **headers)
+        self.assertEqual(response.status_code, 201)
+        created = response.json()["todos"]
+        self.assertEqual(len(created), 50)
+        self.assertEqual(ToDo.objects.count(), 50)
+        for item in created:
+            self.assertEqual(ToDo.objects.get(id=item["id"]).content, item["content"])
+
+    @override_settings(TODO_MAX_BATCH_SIZE=3)
+    def test_fail_add_todo_over_batch_size(self):
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {self.teacher_token}"}
+        response = self.client.post(
+            self.add_todo_url,
+            data=json.dumps({"todos": ["a", "b", "c", "d"]}),
+            content_type="application/json",
+            **headers)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(ToDo.objects.count(), 0)
+
+    def test_fail_add_todo_invalid_item(self):
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {self.teacher_token}"}
+        response = self.client.post(
+            self.add_todo_url,
+            data=json.dumps({"todos": ["valid", 3]}),
+            content_type="application/json",
+            **headers)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(ToDo.objects.count(), 0)
+
     # 학생이 강의에 포함되어 있지 않음: 401
     # def test_fail_s_add_todo(self):
     #     headers = {"HTTP_AUTHORIZATION": f"Bearer {self.student_token}"}
@@ -83,4 +124,282 @@ class ViewToDoListTest(TestCase):
 
     def test_unauthorized_access(self):
         response = self.client.get(self.listup_todo_url)
-        self.assertEqual(response.status_code, 401)
\ No newline at end of file
+        self.assertEqual(response.status_code, 401)
+
+
+class ToDoPaginationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.teacher = User.objects.create_user(user_id=1001, first_name="Professor", password="password", user_type="t")
+        self.course = Course.objects.create(name="Cloud", teacher=self.teacher)
+        ToDo.objects.bulk_create([ToDo(course=self.course, content=f"Assignment {i}") for i in range(25)])
+
+        self.listup_todo_url = reverse("listup_todo", kwargs={"course_id": self.course.id})
+        self.headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(self.teacher)}"}
+
+    def test_walk_all_pages(self):
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 10}
+            if cursor:
+                params["cursor"] = cursor
+            response = self.client.get(self.listup_todo_url, params, **self.headers)
+            self.assertEqual(response.status_code, 200)
+            seen.extend(todo["id"] for todo in response.json()["todo_list"])
+            cursor = response.json()["next_cursor"]
+            if cursor is None:
+                break
+
+        expected = list(ToDo.objects.order_by("created_at", "id").values_list("id", flat=True))
+        self.assertEqual(seen, expected)
+
+    def test_deep_page_query_count(self):
+        # 첫 페이지와 깊은 페이지의 쿼리 수가 같아야 함 (OFFSET 미사용)
+        with self.assertNumQueries(4):
+            first = self.client.get(self.listup_todo_url, {"limit": 5}, **self.headers)
+        cursor = first.json()["next_cursor"]
+        for _ in range(3):
+            cursor = self.client.get(self.listup_todo_url, {"limit": 5, "cursor": cursor}, **self.headers).json()["next_cursor"]
+        with self.assertNumQueries(4):
+            response = self.client.get(self.listup_todo_url, {"limit": 5, "cursor": cursor}, **self.headers)
+        self.assertEqual(len(response.json()["todo_list"]), 5)
+        self.assertIsNone(response.json()["next_cursor"])
+
+    def test_without_limit_returns_everything(self):
+        response = self.client.get(self.listup_todo_url, **self.headers)
+        self.assertEqual(len(response.json()["todo_list"]), 25)
+        self.assertNotIn("next_cursor", response.json())
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.listup_todo_url, {"limit": 5, "cursor": "garbage"}, **self.headers)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error"], "Invalid cursor")
+
+
+class ToDoMembershipTest(TestCase):
+    def setUp(self):
+        membership.clear()
+        cache.clear()
+        self.teacher = User.objects.create_user(user_id=1001, first_name="Professor", password="password", user_type="t")
+        self.student = User.objects.create_user(user_id=1002, first_name="Student", password="password", user_type="s")
+        self.outsider = User.objects.create_user(user_id=1003, first_name="Outsider", password="password", user_type="s")
+        self.course = Course.objects.create(name="Cloud", teacher=self.teacher)
+        self.course.participants.add(self.student)
+
+        self.listup_todo_url = reverse("listup_todo", kwargs={"course_id": self.course.id})
+
+    def test_membership_is_cached(self):
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(self.student)}"}
+        # JWT 사용자 조회 + 수업 조회 + EXISTS + 버전 집계 + ToDo 조회
+        with self.assertNumQueries(5):
+            response = self.client.get(self.listup_todo_url, **headers)
+        self.assertEqual(response.status_code, 200)
+        # 수강 여부와 응답 본문은 캐시 사용
+        with self.assertNumQueries(3):
+            response = self.client.get(self.listup_todo_url, **headers)
+        self.assertEqual(response.status_code, 200)
+
+    def test_fail_not_registered(self):
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(self.outsider)}"}
+        response = self.client.get(self.listup_todo_url, **headers)
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json()["error"], "You are not registered for this course")
+
+
+class CompleteToDoTest(TestCase):
+    def setUp(self):
+        membership.clear()
+        self.teacher = User.objects.create_user(user_id=1001, first_name="Professor", password="password", user_type="t")
+        self.student = User.objects.create_user(user_id=1002, first_name="Student", password="password", user_type="s")
+        self.course = Course.objects.create(name="Cloud", teacher=self.teacher)
+        self.other_course = Course.objects.create(name="Python", teacher=self.teacher)
+        self.course.participants.add(self.student)
+        self.todos = ToDo.objects.bulk_create([ToDo(course=self.course, content=f"Step {i}") for i in range(5)])
+        self.other_todo = ToDo.objects.create(course=self.other_course, content="Other")
+
+        self.complete_todo_url = reverse("complete_todo", kwargs={"course_id": self.course.id})
+        self.headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(self.student)}"}
+
+    def post(self, data, headers=None):
+        return self.client.post(
+            self.complete_todo_url,
+            data=json.dumps(data),
+            content_type="application/json",
+            **(headers or self.headers))
+
+    def test_complete_is_idempotent(self):
+        ids = [todo.id for todo in self.todos]
+        response = self.post({"todo_ids": ids[:3]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["todo_ids"], ids[:3])
+
+        # 이미 완료한 항목이 섞여 있어도 INSERT 한 번으로 처리
+        # JWT 사용자 조회 + 수업 조회 + To-Do 확인 + INSERT (수강 여부는 캐시 사용)
+        with self.assertNumQueries(4):
+            response = self.post({"todo_ids": ids})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.student.completed_todos.count(), 5)
+
+    def test_uncomplete(self):
+        for todo in self.todos:
+            todo.completed_by.add(self.student)
+        response = self.post({"todo_ids": [self.todos[0].id, self.todos[1].id], "completed": False})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.student.completed_todos.count(), 3)
+
+    def test_ignore_todo_from_other_course(self):
+        response = self.post({"todo_ids": [self.todos[0].id, self.other_todo.id]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["not_found"], [self.other_todo.id])
+        self.assertFalse(self.other_todo.completed_by.exists())
+
+    def test_fail_not_registered(self):
+        outsider = User.objects.create_user(user_id=1003, first_name="Outsider", password="password", user_type="s")
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(outsider)}"}
+        response = self.post({"todo_ids": [self.todos[0].id]}, headers)
+        self.assertEqual(response.status_code, 403)
+
+    def test_fail_invalid_ids(self):
+        response = self.post({"todo_ids": "1,2"})
+        self.assertEqual(response.status_code, 400)
+        # JSON true는 id 1로 취급하지 않음
+        response = self.post({"todo_ids": [True]})
+        self.assertEqual(response.status_code, 400)
+        # 객체가 아닌 JSON 본문
+        response = self.post([self.todos[0].id, self.todos[1].id])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error"], "Request body must be a JSON object")
+        self.assertFalse(self.student.completed_todos.exists())
+
+
+class ToDoConditionalGetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.teacher = User.objects.create_user(user_id=1001, first_name="Professor", password="password", user_type="t")
+        self.course = Course.objects.create(name="Cloud", teacher=self.teacher)
+        self.todos = ToDo.objects.bulk_create([ToDo(course=self.course, content=f"Assignment {i}") for i in range(3)])
+
+        self.listup_todo_url = reverse("listup_todo", kwargs={"course_id": self.course.id})
+        self.headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(self.teacher)}"}
+
+    def test_not_modified_skips_rows(self):
+        response = self.client.get(self.listup_todo_url, **self.headers)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+        self.assertEqual(response["Cache-Control"], "private, no-cache")
+
+        # JWT 사용자 조회 + 수업 조회 + 버전 집계만 수행
+        with self.assertNumQueries(3):
+            response = self.client.get(self.listup_todo_url, HTTP_IF_NONE_MATCH=etag, **self.headers)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_etag_changes_with_list(self):
+        etag = self.client.get(self.listup_todo_url, **self.headers)["ETag"]
+
+        todo = self.todos[0]
+        todo.content = "Updated"
+        todo.save()
+        response = self.client.get(self.listup_todo_url, HTTP_IF_NONE_MATCH=etag, **self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["todo_list"][0]["content"], "Updated")
+        self.assertNotEqual(response["ETag"], etag)
+
+        etag = response["ETag"]
+        self.todos[1].delete()
+        response = self.client.get(self.listup_todo_url, HTTP_IF_NONE_MATCH=etag, **self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["todo_list"]), 2)
+
+    def test_pages_have_distinct_etags(self):
+        first = self.client.get(self.listup_todo_url, {"limit": 2}, **self.headers)
+        second = self.client.get(
+            self.listup_todo_url, {"limit": 2, "cursor": first.json()["next_cursor"]}, **self.headers
+        )
+        self.assertNotEqual(first["ETag"], second["ETag"])
+        response = self.client.get(self.listup_todo_url, HTTP_IF_NONE_MATCH=first["ETag"], **self.headers)
+        self.assertEqual(response.status_code, 200)
+
+    def test_rendered_body_is_cached(self):
+        expected = self.client.get(self.listup_todo_url, **self.headers)
+        # If-None-Match가 없는 클라이언트도 To-Do 조회 없이 캐시된 본문을 받음
+        with self.assertNumQueries(3):
+            response = self.client.get(self.listup_todo_url, **self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, expected.content)
+        self.assertEqual(response["ETag"], expected["ETag"])
+
+    @override_settings(RESPONSE_CACHE_TTL=0)
+    def test_body_cache_disabled(self):
+        self.client.get(self.listup_todo_url, **self.headers)
+        with self.assertNumQueries(4):
+            response = self.client.get(self.listup_todo_url, **self.headers)
+        self.assertEqual(len(response.json()["todo_list"]), 3)
+
+
+    def test_large_list_is_streamed(self):
+        expected = self.client.get(self.listup_todo_url, **self.headers)
+        cache.clear()
+        with override_settings(STREAMING_JSON_MIN_ROWS=3):
+            response = self.client.get(self.listup_todo_url, **self.headers)
+            self.assertTrue(response.streaming)
+            # 스트리밍 응답도 같은 ETag를 받지만 본문은 캐시하지 않음
+            self.assertEqual(response["ETag"], expected["ETag"])
+            self.assertEqual(b"".join(response.streaming_content), expected.content)
+            with self.assertNumQueries(4):
+                response = self.client.get(self.listup_todo_url, **self.headers)
+                b"".join(response.streaming_content)
+
+            response = self.client.get(self.listup_todo_url, HTTP_IF_NONE_MATCH=expected["ETag"], **self.headers)
+            self.assertEqual(response.status_code, 304)
+
+
+@override_settings(ROOT_URLCONF="BE.asgi_urls")
+class AsyncListUpToDoTest(TestCase):
+    def setUp(self):
+        membership.clear()
+        self.teacher = User.objects.create_user(user_id=1001, first_name="Professor", password="password", user_type="t")
+        self.student = User.objects.create_user(user_id=1002, first_name="Student", password="password", user_type="s")
+        self.outsider = User.objects.create_user(user_id=1003, first_name="Outsider", password="password", user_type="s")
+        self.course = Course.objects.create(name="Cloud", teacher=self.teacher)
+        self.course.participants.add(self.student)
+        ToDo.objects.bulk_create([ToDo(course=self.course, content=f"Assignment {i}") for i in range(7)])
+
+        self.listup_todo_url = reverse("listup_todo", kwargs={"course_id": self.course.id})
+        self.student_token = str(AccessToken.for_user(self.student))
+
+    def sync_json(self, params):
+        with override_settings(ROOT_URLCONF="BE.urls"):
+            return self.client.get(
+                self.listup_todo_url, params, HTTP_AUTHORIZATION=f"Bearer {self.student_token}"
+            ).json()
+
+    async def test_matches_sync_view(self):
+        headers = {"Authorization": f"Bearer {self.student_token}"}
+        for params in [{}, {"limit": 3}]:
+            response = await self.async_client.get(self.listup_todo_url, params, headers=headers)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json(), await sync_to_async(self.sync_json)(params))
+
+    async def test_large_list_is_streamed(self):
+        expected = await sync_to_async(self.sync_json)({})
+        headers = {"Authorization": f"Bearer {self.student_token}"}
+        with override_settings(STREAMING_JSON_MIN_ROWS=1, RESPONSE_CACHE_TTL=0):
+            response = await self.async_client.get(self.listup_todo_url, headers=headers)
+        self.assertTrue(response.streaming)
+        body = b"".join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(json.loads(body), expected)
+
+    async def test_fail_not_registered(self):
+        headers = {"Authorization": f"Bearer {AccessToken.for_user(self.outsider)}"}
+        response = await self.async_client.get(self.listup_todo_url, headers=headers)
+        self.assertEqual(response.status_code, 403)
+
+    async def test_not_modified(self):
+        headers = {"Authorization": f"Bearer {self.student_token}"}
+        etag = (await self.async_client.get(self.listup_todo_url, headers=headers))["ETag"]
+        response = await self.async_client.get(self.listup_todo_url, headers={**headers, "If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+
@@ -1,7 +1,8 @@
 from django.urls import path
-from .views import add_todo, listup_todo
+from .views import add_todo, listup_todo, complete_todo
 
 urlpatterns = [
     path("course/<int:course_id>/add", add_todo, name="add_todo"),
-    path("course/<int:course_id>/list", listup_todo, name="listup_todo")
+    path("course/<int:course_id>/list", listup_todo, name="listup_todo"),
+    path("course/<int:course_id>/complete", complete_todo, name="complete_todo"),
 ]
\ No newline at end of file
@@ -1,13 +1,22 @@
 import json
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max
 from django.http import JsonResponse
-from django.shortcuts import render
 from django.views.decorators.csrf import csrf_exempt
 from rest_framework.decorators import api_view, permission_classes, authentication_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from user.authentication import StatelessJWTAuthentication, async_api_view
+from BE.conditional import acached_response, cached_response, make_etag, not_modified
+from BE.pagination import InvalidPageParams, apaginate, get_page_params, paginate
+from BE.streaming import CHUNK_SIZE, astream_json, should_stream, stream_json
+from course import events, membership
 from course.models import Course
 from todo.models import ToDo
 
+DEFAULT_TODO_MAX_BATCH_SIZE = 500
+
 
 # Create your views here.
 @csrf_exempt
@@ -27,11 +36,21 @@ def add_todo(request, course_id):
         if not todos:
             return JsonResponse({"error": "No content"}, status=400)
 
-        created_todos = []
-        for content in todos:
-            if content.strip():  # 빈 값은 제외
-                todo = ToDo.objects.create(course=course, content=content)
-                created_todos.append({"id": todo.id, "content": todo.content})
+        # 저장 전에 배열 전체를 먼저 검증
+        if not isinstance(todos, list) or not all(isinstance(content, str) for content in todos):
+            return JsonResponse({"error": "todos must be a list of strings"}, status=400)
+        max_batch_size = getattr(settings, "TODO_MAX_BATCH_SIZE", DEFAULT_TODO_MAX_BATCH_SIZE)
+        if len(todos) > max_batch_size:
+            return JsonResponse({"error": f"Too many to-dos (max {max_batch_size})"}, status=400)
+
+        # 빈 값은 제외하고 한 트랜잭션 안에서 한 번의 INSERT로 저장
+        new_todos = [ToDo(course=course, content=content) for content in todos if content.strip()]
+        with transaction.atomic():
+            new_todos = ToDo.objects.bulk_create(new_todos)
+        # 전체 To-Do 수가 바뀌면 모든 학생의 진행률이 바뀌므로 snapshot 재전송
+        if new_todos:
+            events.publish_on_commit(course.id, events.RESYNC)
+        created_todos = [{"id": todo.id, "content": todo.content} for todo in new_todos]
 
         return JsonResponse({
             "message": "To-Do(s) added successfully",
@@ -47,25 +66,163 @@ def add_todo(request, course_id):
 
 
 
+# To-Do 목록의 버전: 추가/수정 시 updated_at이 갱신되고 삭제 시 개수가 바뀜
+TODO_LIST_VERSION = {"count": Count("id"), "updated_at": Max("updated_at")}
+
+
+def todo_list_etag(course, version, limit, cursor):
+    return make_etag("listup_todo", course.id, version["count"], version["updated_at"], limit, cursor)
+
+
+def todo_list_queryset(course):
+    return ToDo.objects.filter(course=course).order_by("created_at").values(
+        "id", "content", "created_at", "updated_at"
+    )
+
+
 @csrf_exempt
 @api_view(['GET'])
-@authentication_classes([JWTAuthentication])
+@authentication_classes([StatelessJWTAuthentication])
 @permission_classes([IsAuthenticated])
 def listup_todo(request, course_id):
     try:
         user = request.user
         course = Course.objects.get(id=course_id)
 
-        if user.user_type == 't' and course.teacher != user:
+        if user.user_type == 't' and course.teacher_id != user.id:
+            return JsonResponse({"error": "Unauthorized access"}, status=403)
+        if user.user_type == 's' and not membership.is_participant(course.id, user.id):
+            return JsonResponse({"error": "You are not registered for this course"}, status=403)
+
+        try:
+            limit, cursor = get_page_params(request)
+        except InvalidPageParams as e:
+            return JsonResponse({"error": str(e)}, status=400)
+
+        # 목록이 바뀌지 않았으면 To-Do를 조회/직렬화하지 않고 304
+        version = ToDo.objects.filter(course=course).aggregate(**TODO_LIST_VERSION)
+        etag = todo_list_etag(course, version, limit, cursor)
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+
+        def render_listing():
+            todos = todo_list_queryset(course)
+            if limit:
+                todos, next_cursor = paginate(todos, limit, cursor)
+                return JsonResponse({"todo_list": todos, "next_cursor": next_cursor}, status=200)
+            # To-Do가 많으면 목록을 메모리에 만들지 않고 chunk 단위로 스트리밍
+            if should_stream(version["count"]):
+                return stream_json({}, "todo_list", todos.iterator(chunk_size=CHUNK_SIZE))
+            return JsonResponse({"todo_list": list(todos)}, status=200)
+
+        return cached_response(etag, render_listing)
+    except Course.DoesNotExist:
+        return JsonResponse({"error": "Course not found"}, status=404)
+    except Exception as e:
+        return JsonResponse({"error": "Internal server error", "details": str(e)}, status=500)
+
+
+# ASGI(BE/asgi_urls.py)에서 쓰는 listup_todo의 async 버전
+@async_api_view(['GET'])
+async def alistup_todo(request, course_id):
+    try:
+        user = request.user
+        course = await Course.objects.aget(id=course_id)
+
+        if user.user_type == 't' and course.teacher_id != user.id:
             return JsonResponse({"error": "Unauthorized access"}, status=403)
-        if user.user_type == 's' and user not in course.participants.all():
+        if user.user_type == 's' and not await membership.ais_participant(course.id, user.id):
             return JsonResponse({"error": "You are not registered for this course"}, status=403)
 
-        todos = ToDo.objects.filter(course=course).order_by("created_at").values(
-            "id", "content", "created_at", "updated_at"
-        )
+        try:
+            limit, cursor = get_page_params(request)
+        except InvalidPageParams as e:
+            return JsonResponse({"error": str(e)}, status=400)
+
+        version = await ToDo.objects.filter(course=course).aaggregate(**TODO_LIST_VERSION)
+        etag = todo_list_etag(course, version, limit, cursor)
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+
+        async def render_listing():
+            todos = todo_list_queryset(course)
+            if limit:
+                todos, next_cursor = await apaginate(todos, limit, cursor)
+                return JsonResponse({"todo_list": todos, "next_cursor": next_cursor}, status=200)
+            if should_stream(version["count"]):
+                return astream_json({}, "todo_list", todos.aiterator(chunk_size=CHUNK_SIZE))
+            return JsonResponse({"todo_list": [todo async for todo in todos]}, status=200)
 
-        return JsonResponse({"todo_list": list(todos)}, status=200)
+        return await acached_response(etag, render_listing)
+    except Course.DoesNotExist:
+        return JsonResponse({"error": "Course not found"}, status=404)
+    except Exception as e:
+        return JsonResponse({"error": "Internal server error", "details": str(e)}, status=500)
+
+
+@csrf_exempt
+@api_view(['POST'])
+@authentication_classes([JWTAuthentication])
+@permission_classes([IsAuthenticated])
+def complete_todo(request, course_id):
+    try:
+        user = request.user
+        # 수강 중인 학생만
+        if user.user_type != 's':
+            return JsonResponse({"error": "Only students can complete to-do"}, status=403)
+
+        course = Course.objects.get(id=course_id)
+        if not membership.is_participant(course.id, user.id):
+            return JsonResponse({"error": "You are not registered for this course"}, status=403)
+
+        data = json.loads(request.body)
+        if not isinstance(data, dict):
+            return JsonResponse({"error": "Request body must be a JSON object"}, status=400)
+        todo_ids = data.get("todo_ids", [])
+        completed = data.get("completed", True)  # false면 완료 취소
+        if not todo_ids:
+            return JsonResponse({"error": "No to-do ids"}, status=400)
+        if not isinstance(todo_ids, list) or not all(
+            isinstance(todo_id, int) and not isinstance(todo_id, bool) for todo_id in todo_ids
+        ):
+            return JsonResponse({"error": "todo_ids must be a list of integers"}, status=400)
+        if not isinstance(completed, bool):
+            return JsonResponse({"error": "completed must be a boolean"}, status=400)
+        max_batch_size = getattr(settings, "TODO_MAX_BATCH_SIZE", DEFAULT_TODO_MAX_BATCH_SIZE)
+        if len(todo_ids) > max_batch_size:
+            return JsonResponse({"error": f"Too many to-dos (max {max_batch_size})"}, status=400)
+
+        # 해당 수업의 To-Do만 처리
+        valid_ids = set(ToDo.objects.filter(course=course, id__in=todo_ids).values_list("id", flat=True))
+        not_found = [todo_id for todo_id in todo_ids if todo_id not in valid_ids]
+
+        # .add()/.remove() 대신 through 테이블에 한 번에 INSERT(중복 무시)/DELETE
+        through = ToDo.completed_by.through
+        if completed:
+            through.objects.bulk_create(
+                [through(todo_id=todo_id, user_id=user.id) for todo_id in valid_ids],
+                ignore_conflicts=True,
+            )
+        else:
+            through.objects.filter(user_id=user.id, todo_id__in=valid_ids).delete()
+
+        # 진행률 대시보드(SSE)가 열려 있을 때만 delta 계산
+        if valid_ids and events.has_subscribers(course.id):
+            events.publish_on_commit(course.id, lambda: {
+                "type": "progress",
+                "participant": course.participant_progress(user.id),
+            })
+
+        return JsonResponse({
+            "message": "To-Do(s) completed successfully" if completed else "To-Do(s) uncompleted successfully",
+            "todo_ids": sorted(valid_ids),
+            "not_found": not_found,
+        }, status=200)
+
+    except json.JSONDecodeError:
+        return JsonResponse({"error": "Invalid JSON format"}, status=400)
     except Course.DoesNotExist:
         return JsonResponse({"error": "Course not found"}, status=404)
     except Exception as e:
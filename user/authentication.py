@@ -0,0 +1,159 @@
+import functools
+
+from django.conf import settings
+from django.contrib.auth import login, user_logged_in
+from django.db import router
+from django.http import JsonResponse
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from . import hashing
+from .models import TokenClaimsUser, User
+
+# access token에 함께 넣는 사용자 정보(view에서 읽는 값들)
+USER_CLAIM_FIELDS = ('user_type', 'first_name')
+
+
+def get_tokens_for_user(user):
+    """(refresh_token, access_token) 발급. JWT_EMBED_USER_CLAIMS면 사용자 정보를 claim으로 포함."""
+    refresh = RefreshToken.for_user(user)
+    access = refresh.access_token
+    if getattr(settings, 'JWT_EMBED_USER_CLAIMS', True):
+        for field in USER_CLAIM_FIELDS:
+            access[field] = getattr(user, field)
+    return str(refresh), str(access)
+
+
+def login_user(request, user):
+    """
+    로그인/회원가입 성공 처리. JWT_STATELESS_AUTH면 세션을 만들지 않고
+    user_logged_in signal만 보냄 (last_login 갱신), 아니면 세션 로그인.
+    """
+    if getattr(settings, 'JWT_STATELESS_AUTH', False):
+        user_logged_in.send(sender=user.__class__, request=request, user=user)
+    else:
+        login(request, user)
+
+
+async def aauthenticate_credentials(user_id, password):
+    """
+    user_id/password 로그인용 ModelBackend.authenticate()의 async 버전 (Django 4.2에는 없음).
+    없는 user_id여도 해시를 한 번 계산해 응답 시간으로 계정 존재 여부가 드러나지 않게 함.
+    """
+    if user_id is None or password is None:
+        return None
+    try:
+        user = await User._default_manager.aget(user_id=user_id)
+    except (User.DoesNotExist, ValueError, TypeError):
+        await hashing.ahash_password(password)
+        return None
+    if await user.acheck_password(password) and user.is_active:
+        return user
+    return None
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    claim이 포함된 토큰이면 DB 조회 없이 TokenClaimsUser를 만들어 반환.
+    claim이 없는 예전 토큰은 기존 JWTAuthentication처럼 DB에서 조회.
+    """
+    def get_user(self, validated_token):
+        user = self.get_claims_user(validated_token)
+        if user is None:
+            return super().get_user(validated_token)
+        return user
+
+    async def aauthenticate(self, request):
+        """authenticate()의 async 버전. claim이 없는 토큰일 때만 DB를 조회."""
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+
+        user = self.get_claims_user(validated_token)
+        if user is None:
+            try:
+                user_id = validated_token[api_settings.USER_ID_CLAIM]
+            except KeyError:
+                raise InvalidToken("Token contained no recognizable user identification")
+            try:
+                user = await User.objects.aget(**{api_settings.USER_ID_FIELD: user_id})
+            except User.DoesNotExist:
+                raise AuthenticationFailed("User not found", code="user_not_found")
+            if not user.is_active:
+                raise AuthenticationFailed("User is inactive", code="user_inactive")
+        return user, validated_token
+
+    def get_claims_user(self, validated_token):
+        try:
+            loaded = {api_settings.USER_ID_FIELD: validated_token[api_settings.USER_ID_CLAIM]}
+            for field in USER_CLAIM_FIELDS:
+                loaded[field] = validated_token[field]
+        except KeyError:
+            return None
+
+        # from_db는 값을 모델 필드 순서대로 받음
+        field_names = [f.attname for f in TokenClaimsUser._meta.concrete_fields if f.attname in loaded]
+        return TokenClaimsUser.from_db(
+            router.db_for_read(TokenClaimsUser),
+            field_names,
+            [loaded[name] for name in field_names],
+        )
+
+
+class QueryParamJWTAuthentication(StatelessJWTAuthentication):
+    """
+    브라우저 EventSource는 Authorization 헤더를 보낼 수 없으므로 ?access_token= 도 허용.
+    헤더가 있으면 헤더가 우선이고, 토큰 검증(만료/폐기 포함)은 헤더와 동일.
+    """
+    query_param = 'access_token'
+
+    def get_header(self, request):
+        header = super().get_header(request)
+        token = request.GET.get(self.query_param)
+        if header is None and token:
+            return f"{api_settings.AUTH_HEADER_TYPES[0]} {token}".encode()
+        return header
+
+
+def async_api_view(http_method_names, authentication_class=StatelessJWTAuthentication):
+    """
+    async view용 @api_view 대체 데코레이터.
+    DRF @api_view는 async view를 지원하지 않으므로 허용 메서드 확인과 JWT 인증을
+    event loop 안에서 직접 처리하고, 실패 시 DRF와 같은 형식(401/405)으로 응답.
+    """
+    authentication = authentication_class()
+
+    def decorator(view):
+        @functools.wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            if request.method not in http_method_names:
+                return JsonResponse({"detail": f'Method "{request.method}" not allowed.'}, status=405)
+            try:
+                result = await authentication.aauthenticate(request)
+            except (InvalidToken, AuthenticationFailed) as e:
+                detail = e.detail if isinstance(e.detail, dict) else {"detail": e.detail}
+                return _unauthorized(authentication, request, detail)
+            if result is None:
+                return _unauthorized(
+                    authentication, request, {"detail": "Authentication credentials were not provided."}
+                )
+
+            request.user, request.auth = result
+            return await view(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _unauthorized(authentication, request, detail):
+    response = JsonResponse(detail, status=401)
+    response['WWW-Authenticate'] = authentication.authenticate_header(request)
+    return response
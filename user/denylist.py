@@ -0,0 +1,133 @@
+"""
+Denylist of revoked JWT ids (``jti``) shared by all worker processes.
+
+Each process keeps the ids in a dict (``jti -> exp``), so a lookup costs a
+hash probe plus one ``os.stat`` of the denylist file. Revocations are
+appended to the file as ``"<exp> <jti>"`` lines, and every process reads
+only the bytes appended since its last check. An entry only matters until
+its token would have expired anyway. Once most of the file is expired
+lines, it is rewritten without them (under a fresh ``#<generation>`` header
+line) and swapped in atomically; the other processes notice the new header
+and reload it.
+"""
+import fcntl
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+from django.conf import settings
+
+# 파일이 이 크기를 넘고 직전 compaction 때의 2배가 되면 만료된 항목 정리
+COMPACT_MIN_BYTES = 64 * 1024
+
+
+class Denylist:
+    def __init__(self, path=None):
+        self.path = os.fspath(path) if path else None
+        self._lock = threading.Lock()
+        self._entries = {}  # jti -> exp(unix time)
+        self._stat = None  # 마지막으로 읽은 파일의 (inode, 크기, 수정 시각)
+        self._generation = None  # 파일 첫 줄: compaction마다 바뀜
+        self._offset = 0
+        self._compacted_size = 0
+
+    def __contains__(self, jti):
+        with self._lock:
+            self._sync()
+            exp = self._entries.get(jti)
+        return exp is not None and exp > time.time()
+
+    def __len__(self):
+        now = time.time()
+        with self._lock:
+            self._sync()
+            return sum(exp > now for exp in self._entries.values())
+
+    def add(self, jti, exp):
+        """토큰 만료 시각(exp)까지 jti를 거부."""
+        exp = int(exp)
+        with self._lock:
+            self._entries[jti] = exp
+        if self.path is None:
+            return
+        with self._file_lock():
+            # 한 줄씩 O_APPEND로 쓰므로 다른 프로세스의 줄과 섞이지 않음
+            with open(self.path, 'ab') as f:
+                f.write(f'{exp} {jti}\n'.encode())
+                size = f.tell()
+            if size >= max(COMPACT_MIN_BYTES, 2 * self._compacted_size):
+                self._compact()
+
+    def _sync(self):
+        """다른 프로세스가 추가한 항목을 반영. 파일이 그대로면 stat 한 번으로 끝남."""
+        if self.path is None:
+            return
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        if (stat.st_ino, stat.st_size, stat.st_mtime_ns) == self._stat:
+            return
+
+        with open(self.path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            # inode는 재사용될 수 있으므로 첫 줄로 compaction 여부 확인, 바뀌었으면 처음부터 다시 읽음
+            generation = f.readline()
+            if not generation.endswith(b'\n'):
+                return
+            if generation != self._generation or stat.st_size < self._offset:
+                self._entries = {}
+                self._generation = generation
+                self._offset = 0
+            f.seek(self._offset)
+            data = f.read()
+        self._stat = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        # 아직 쓰는 중인 마지막 줄은 다음에 읽음
+        end = data.rfind(b'\n') + 1
+        for line in data[:end].splitlines():
+            if line.startswith(b'#'):
+                continue
+            exp, _, jti = line.partition(b' ')
+            self._entries[jti.decode()] = int(exp)
+        self._offset += end
+
+    def _compact(self):
+        now = time.time()
+        with open(self.path, 'rb') as f:
+            lines = [
+                line for line in f.read().splitlines(keepends=True)
+                if not line.startswith(b'#') and int(line.split(b' ', 1)[0]) > now
+            ]
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(f'#{uuid.uuid4().hex}\n'.encode())
+            f.writelines(lines)
+        os.replace(tmp_path, self.path)
+        self._compacted_size = sum(len(line) for line in lines)
+
+    @contextmanager
+    def _file_lock(self):
+        # 추가와 compaction이 겹치면 교체 전 파일에 쓴 줄이 사라지므로 프로세스 간 잠금
+        with open(f'{self.path}.lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+_lock = threading.Lock()
+_denylists = {}
+
+
+def get_denylist():
+    """JWT_DENYLIST_PATH 파일을 쓰는 프로세스 공용 Denylist (None이면 프로세스 메모리만 사용)."""
+    path = getattr(settings, 'JWT_DENYLIST_PATH', None)
+    key = os.fspath(path) if path else None
+    with _lock:
+        denylist = _denylists.get(key)
+        if denylist is None:
+            denylist = _denylists[key] = Denylist(key)
+        return denylist
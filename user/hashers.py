@@ -0,0 +1,13 @@
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """
+    반복 횟수를 PASSWORD_HASH_ITERATIONS로 조절하는 PBKDF2.
+    algorithm 이름이 같으므로 기존 해시도 그대로 검증되고, 비용이 바뀌면
+    다음 로그인 때 must_update()에 의해 새 비용으로 다시 해시됨.
+    """
+    @property
+    def iterations(self):
+        return getattr(settings, 'PASSWORD_HASH_ITERATIONS', hashers.PBKDF2PasswordHasher.iterations)
@@ -0,0 +1,72 @@
+"""
+Password hashing on a bounded worker pool.
+
+PBKDF2 keeps a CPU core busy for the whole hash but releases the GIL, so
+hashes run on ``PASSWORD_HASHING_WORKERS`` threads. Async views await the
+pool without blocking the event loop, and no matter how many logins arrive
+at once, at most that many hashes run concurrently, which leaves the other
+cores to the rest of the endpoints.
+"""
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+
+THREAD_NAME_PREFIX = 'password-hashing'
+
+_lock = threading.Lock()
+_executor = None
+
+
+def workers():
+    # 기본값은 코어 수의 절반: 나머지 코어는 다른 요청 처리용으로 남김
+    return getattr(settings, 'PASSWORD_HASHING_WORKERS', None) or max(1, (os.cpu_count() or 2) // 2)
+
+
+def get_executor():
+    """처음 사용할 때 workers()개 스레드로 pool 생성 (이후 설정 변경은 재시작 시 반영)."""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(workers(), thread_name_prefix=THREAD_NAME_PREFIX)
+        return _executor
+
+
+def _verify(raw_password, encoded):
+    rehashed = []
+    # 알고리즘이나 비용(PASSWORD_HASH_ITERATIONS)이 바뀐 해시는 Django 규칙대로 다시 해시
+    correct = check_password(raw_password, encoded, setter=lambda raw: rehashed.append(make_password(raw)))
+    return correct, rehashed[0] if rehashed else None
+
+
+def _run(func, *args):
+    # pool 안에서 다시 호출된 경우 그대로 실행 (pool이 가득 찼을 때 교착 방지)
+    if threading.current_thread().name.startswith(THREAD_NAME_PREFIX):
+        return func(*args)
+    return get_executor().submit(func, *args).result()
+
+
+async def _arun(func, *args):
+    return await asyncio.get_running_loop().run_in_executor(get_executor(), func, *args)
+
+
+def hash_password(raw_password):
+    return _run(make_password, raw_password)
+
+
+async def ahash_password(raw_password):
+    """hash_password()의 async 버전. 해시하는 동안 event loop를 막지 않음."""
+    return await _arun(make_password, raw_password)
+
+
+def verify_password(raw_password, encoded):
+    """(비밀번호 일치 여부, 다시 해시해야 하면 새 해시 아니면 None)을 반환."""
+    return _run(_verify, raw_password, encoded)
+
+
+async def averify_password(raw_password, encoded):
+    """verify_password()의 async 버전."""
+    return await _arun(_verify, raw_password, encoded)
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from user.provisioning import DEFAULT_BATCH_SIZE, FORMATS, provision_users
+
+
+class Command(BaseCommand):
+    help = (
+        "Create accounts in bulk from a CSV or NDJSON file (user_id, first_name, password, user_type), "
+        "hashing passwords on a process pool. Existing accounts are skipped, so an interrupted run "
+        "is resumed by running it again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=FORMATS, help="Default: from the file extension")
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help="Users per INSERT transaction")
+        parser.add_argument('--workers', type=int, help="Hashing processes (default: CPU count)")
+
+    def handle(self, *args, **options):
+        def progress(report):
+            if options['verbosity'] > 1:
+                self.stdout.write(
+                    f"created {report['created']}  skipped {report['skipped']}  "
+                    f"{report['users_per_second']:.1f} users/s"
+                )
+
+        try:
+            report = provision_users(
+                options['path'],
+                format=options['format'],
+                batch_size=options['batch_size'],
+                workers=options['workers'],
+                on_batch=progress,
+            )
+        except (OSError, ValueError) as e:
+            raise CommandError(e)
+        except IntegrityError as e:
+            # 실행 중 같은 user_id로 가입한 경우. 이미 커밋된 chunk는 다시 실행할 때 건너뜀
+            raise CommandError(f"{e}; run the command again to resume")
+
+        for row in report['invalid']:
+            self.stderr.write(f"line {row['line']}: {row['error']}")
+        self.stdout.write(
+            f"{report['rows']} rows  {report['created']} created  {report['skipped']} already existed  "
+            f"{len(report['invalid'])} invalid  {report['seconds']:.1f}s  {report['users_per_second']:.1f} users/s"
+        )
+        if report['invalid']:
+            self.stdout.write(self.style.WARNING("Fix the invalid rows and run the command again"))
+        else:
+            self.stdout.write(self.style.SUCCESS("Done"))
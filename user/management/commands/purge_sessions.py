@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from user.sessions import purge_expired_sessions
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired sessions in small batches (unlike clearsessions, the write lock is released "
+        "between batches). Use from cron when the background purge is disabled."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help="Default: SESSION_PURGE_BATCH_SIZE")
+        parser.add_argument('--pause', type=float, default=0.05, help="Seconds to wait between batches")
+
+    def handle(self, *args, **options):
+        deleted = purge_expired_sessions(batch_size=options['batch_size'], pause=options['pause'])
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired sessions"))
@@ -1,13 +1,21 @@
 from django.contrib.auth.models import BaseUserManager
 from django.contrib.auth.models import AbstractUser
+from django.conf import settings
+from django.core.cache import cache
 from django.db import models
 
+from user import hashing
+
 # Create your models here.
 class UserManager(BaseUserManager):
-    def create_user(self, user_id, first_name, password=None, **extra_fields):
+    def build_user(self, user_id, first_name, **extra_fields):
+        """저장하지 않은 User 생성 (create_user/acreate_user/대량 생성 공용)."""
         if not user_id:
             raise ValueError("The User must have a user_id")
-        user = self.model(user_id=user_id, first_name=first_name, **extra_fields)
+        return self.model(user_id=user_id, first_name=first_name, **extra_fields)
+
+    def create_user(self, user_id, first_name, password=None, **extra_fields):
+        user = self.build_user(user_id, first_name, **extra_fields)
         user.set_password(password)
         user.save(using=self._db)
         return user
@@ -18,6 +26,14 @@ class UserManager(BaseUserManager):
 
         return self.create_user(user_id, first_name, password, **extra_fields)
 
+    async def acreate_user(self, user_id, first_name, password=None, **extra_fields):
+        """create_user()의 async 버전. 비밀번호 해시는 event loop 밖(hashing pool)에서 계산."""
+        user = self.build_user(user_id, first_name, **extra_fields)
+        user.password = await hashing.ahash_password(password)
+        user._password = password
+        await user.asave(using=self._db)
+        return user
+
 class User(AbstractUser):
     USER_TYPE_CHOICES = (('s', 'Student'), ('t', 'Teacher'))
 
@@ -32,4 +48,53 @@ class User(AbstractUser):
     objects = UserManager()
 
     def __str__(self):
-        return f"{self.first_name} ({self.get_user_type_display()})"
\ No newline at end of file
+        return f"{self.first_name} ({self.get_user_type_display()})"
+
+    # 비밀번호 해시/검증은 요청 스레드가 아닌 hashing pool에서 실행 (user/hashing.py)
+    def set_password(self, raw_password):
+        self.password = hashing.hash_password(raw_password)
+        self._password = raw_password
+
+    def check_password(self, raw_password):
+        correct, rehashed = hashing.verify_password(raw_password, self.password)
+        if rehashed:
+            self.password = rehashed
+            self._password = None
+            self.save(update_fields=['password'])
+        return correct
+
+    async def acheck_password(self, raw_password):
+        """check_password()의 async 버전."""
+        correct, rehashed = await hashing.averify_password(raw_password, self.password)
+        if rehashed:
+            self.password = rehashed
+            self._password = None
+            await self.asave(update_fields=['password'])
+        return correct
+
+
+class TokenClaimsUser(User):
+    """
+    JWT claim(id, user_type, first_name)만으로 만든 사용자.
+    나머지 필드는 deferred 상태로, 접근할 때 한 번에 조회하며
+    JWT_USER_CACHE_TTL이 설정된 경우 캐시를 먼저 확인함.
+    """
+    class Meta:
+        proxy = True
+
+    def refresh_from_db(self, using=None, fields=None):
+        ttl = getattr(settings, 'JWT_USER_CACHE_TTL', 0)
+        deferred = self.get_deferred_fields()
+        # 비밀번호 해시는 캐시에 두지 않음
+        if not ttl or not fields or 'password' in fields or not deferred.issuperset(fields):
+            return super().refresh_from_db(using=using, fields=fields)
+
+        cache_key = f'user:{self.pk}'
+        values = cache.get(cache_key)
+        if values is None:
+            attnames = [f.attname for f in self._meta.concrete_fields if f.attname != 'password']
+            values = User._base_manager.db_manager(using).filter(pk=self.pk).values(*attnames).get()
+            cache.set(cache_key, values, ttl)
+        for attname in deferred:
+            if attname in values:
+                setattr(self, attname, values[attname])
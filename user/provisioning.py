@@ -0,0 +1,160 @@
+"""
+Bulk account provisioning from a CSV or NDJSON file.
+
+Rows are validated like ``sign_up_view`` and built with
+``UserManager.build_user``, so a provisioned account is the same row sign-up
+would have created. Passwords are hashed on a process pool, because PBKDF2
+dominates the cost and the hashing thread pool is sized for request traffic.
+While one chunk is inserted with ``bulk_create``, the next chunk is already
+being hashed. Each chunk is committed on its own and accounts that already
+exist are skipped before they are hashed, so a run that failed part-way is
+resumed by running it again on the same file.
+"""
+import csv
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.apps import apps
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from user.models import User
+
+DEFAULT_BATCH_SIZE = 500
+FORMATS = ('csv', 'ndjson')
+
+
+class InvalidRow(Exception):
+    pass
+
+
+def detect_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    if extension in ('.ndjson', '.jsonl'):
+        return 'ndjson'
+    raise ValueError(f"Cannot tell the format of {path}, pass csv or ndjson explicitly")
+
+
+def read_rows(f, format):
+    """(줄 번호, dict 또는 읽을 수 없는 줄이면 InvalidRow) 순서대로 반환."""
+    if format == 'csv':
+        reader = csv.DictReader(f)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_number, line in enumerate(f, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            yield line_number, InvalidRow("Invalid JSON")
+            continue
+        yield line_number, row if isinstance(row, dict) else InvalidRow("Expected a JSON object")
+
+
+def clean_row(row):
+    """sign_up_view와 같은 규칙으로 검증하고 (user_id, first_name, password, user_type) 반환."""
+    if isinstance(row, InvalidRow):
+        raise row
+    user_type = row.get('user_type') or 's'
+    user_id = row.get('user_id')
+    password = row.get('password')
+    first_name = row.get('first_name')
+
+    if not first_name or not user_id or not password:
+        raise InvalidRow("Please fill out the required fields")
+    # NDJSON은 숫자/배열 등도 들어올 수 있음 (worker의 make_password에서 실패하지 않도록 여기서 거름)
+    if not isinstance(first_name, str) or not isinstance(password, str):
+        raise InvalidRow("first_name and password must be strings")
+    if user_type not in ['s', 't']:
+        raise InvalidRow("Invalid user type. Must be 's' (Student) or 't' (Teacher).")
+    # isdigit()은 '²' 같은 문자도 참이라 int()가 실패하므로 isdecimal() 사용
+    if isinstance(user_id, str) and user_id.strip().isdecimal():
+        user_id = int(user_id)
+    if isinstance(user_id, bool) or not isinstance(user_id, int) or user_id <= 0:
+        raise InvalidRow("user_id must be a positive integer")
+    if len(first_name) > User._meta.get_field('first_name').max_length:
+        raise InvalidRow("first_name is too long")
+    return user_id, first_name, password, user_type
+
+
+def _setup_worker():
+    # spawn으로 시작된 프로세스는 설정이 로드되지 않은 상태 (PASSWORD_HASHERS 등)
+    if not apps.ready:
+        django.setup()
+
+
+def provision_users(path, format=None, batch_size=DEFAULT_BATCH_SIZE, workers=None, on_batch=None):
+    """
+    파일의 사용자를 batch_size개씩 생성하고 결과 report를 반환.
+    on_batch(report)는 chunk를 커밋할 때마다 호출됨 (진행 상황 출력용).
+    """
+    format = format or detect_format(path)
+    workers = workers or os.cpu_count() or 1
+    report = {'rows': 0, 'created': 0, 'skipped': 0, 'invalid': [], 'seconds': 0.0, 'users_per_second': 0.0}
+    seen = set()
+    started = time.perf_counter()
+
+    def valid_rows(rows):
+        for line_number, row in rows:
+            report['rows'] += 1
+            try:
+                user_id, first_name, password, user_type = clean_row(row)
+            except InvalidRow as e:
+                report['invalid'].append({'line': line_number, 'error': str(e)})
+                continue
+            if user_id in seen:
+                report['invalid'].append({'line': line_number, 'error': "Duplicate user_id in file"})
+                continue
+            seen.add(user_id)
+            yield user_id, first_name, password, user_type
+
+    def new_users(chunk):
+        # 이전 실행에서 이미 만든 계정은 해시하기 전에 건너뜀 (재실행으로 이어서 진행)
+        existing = set(User.objects.filter(user_id__in=[row[0] for row in chunk]).values_list('user_id', flat=True))
+        report['skipped'] += len(existing)
+        return [row for row in chunk if row[0] not in existing]
+
+    def insert(chunk, hashes):
+        users = []
+        for (user_id, first_name, _, user_type), encoded in zip(chunk, hashes):
+            user = User.objects.build_user(user_id, first_name, user_type=user_type)
+            user.password = encoded
+            users.append(user)
+        with transaction.atomic():
+            User.objects.bulk_create(users)
+        report['created'] += len(users)
+        elapsed = time.perf_counter() - started
+        report['seconds'] = round(elapsed, 3)
+        report['users_per_second'] = round(report['created'] / elapsed, 1) if elapsed else 0.0
+        if on_batch:
+            on_batch(report)
+
+    with open(path, newline='', encoding='utf-8-sig') as f, \
+            ProcessPoolExecutor(workers, initializer=_setup_worker) as executor:
+        rows = valid_rows(read_rows(f, format))
+        pending = None
+        while chunk := list(itertools.islice(rows, batch_size)):
+            chunk = new_users(chunk)
+            # 이 chunk를 해시하는 동안 이전 chunk를 INSERT
+            hashes = executor.map(
+                make_password, [row[2] for row in chunk], chunksize=max(1, len(chunk) // (workers * 4))
+            )
+            if pending:
+                insert(*pending)
+            pending = chunk, hashes
+        if pending:
+            insert(*pending)
+
+    elapsed = time.perf_counter() - started
+    report['seconds'] = round(elapsed, 3)
+    report['users_per_second'] = round(report['created'] / elapsed, 1) if elapsed else 0.0
+    return report
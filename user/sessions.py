@@ -0,0 +1,75 @@
+"""
+Batched purge of expired sessions for deployments that keep session login.
+
+``clearsessions`` deletes every expired row in one statement, which holds
+the SQLite write lock for the whole delete. Here expired keys are deleted
+``SESSION_PURGE_BATCH_SIZE`` at a time through the ``expire_date`` index,
+each batch in its own short transaction, with a pause between batches so
+logins can take the lock in between. ``start_background_purge`` runs the
+purge every ``SESSION_PURGE_INTERVAL`` seconds on a daemon thread. It is
+started by ``BE/wsgi.py`` and ``BE/asgi.py``, not by management commands.
+"""
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.db import connection
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+DB_ENGINES = ('django.contrib.sessions.backends.db', 'django.contrib.sessions.backends.cached_db')
+
+_lock = threading.Lock()
+_thread = None
+
+
+def purge_expired_sessions(batch_size=None, pause=0.05):
+    """만료된 세션을 batch_size개씩 삭제하고 삭제한 수를 반환."""
+    batch_size = batch_size or getattr(settings, 'SESSION_PURGE_BATCH_SIZE', DEFAULT_BATCH_SIZE)
+    now = timezone.now()
+    deleted = 0
+    while True:
+        keys = list(
+            Session.objects.filter(expire_date__lt=now).values_list('session_key', flat=True)[:batch_size]
+        )
+        if not keys:
+            break
+        deleted += Session.objects.filter(session_key__in=keys).delete()[0]
+        if len(keys) < batch_size:
+            break
+        time.sleep(pause)
+    return deleted
+
+
+def _purge_forever(interval):
+    while True:
+        time.sleep(interval)
+        try:
+            deleted = purge_expired_sessions()
+            if deleted:
+                logger.info("Purged %d expired sessions", deleted)
+        except Exception:
+            logger.exception("Session purge failed")
+        finally:
+            # 이 스레드의 DB 연결은 다음 주기까지 쓰지 않으므로 닫음
+            connection.close()
+
+
+def start_background_purge():
+    """
+    DB 세션을 쓰고 SESSION_PURGE_INTERVAL이 설정된 경우에만 정리 스레드를 시작 (프로세스당 1개).
+    시작한 스레드를 반환, 시작하지 않으면 None.
+    """
+    global _thread
+    interval = getattr(settings, 'SESSION_PURGE_INTERVAL', None)
+    if not interval or getattr(settings, 'JWT_STATELESS_AUTH', False) or settings.SESSION_ENGINE not in DB_ENGINES:
+        return None
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_purge_forever, args=(interval,), name='session-purge', daemon=True)
+            _thread.start()
+        return _thread
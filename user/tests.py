@@ -1,6 +1,27 @@
-from django.test import TestCase
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from unittest import mock
+
+from django.contrib.auth.hashers import make_password
+from django.conf import settings
+from django.contrib.sessions.backends.db import SessionStore
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from django.urls import reverse
-from .models import User
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from . import denylist, hashing, provisioning, sessions
+from .authentication import StatelessJWTAuthentication, get_tokens_for_user
+from .models import TokenClaimsUser, User
 
 
 class SignupTest(TestCase):
@@ -33,3 +54,449 @@ class SignupTest(TestCase):
         # 실패 응답 검증
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response.json()['error'], 'Please fill out the required fields')
+
+
+class StatelessJWTAuthenticationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.teacher = User.objects.create_user(
+            user_id=1001, first_name='Professor', password='password', user_type='t'
+        )
+        self.authentication = StatelessJWTAuthentication()
+
+    def login(self):
+        response = self.client.post(reverse('login'), data=json.dumps({
+            'user_id': 1001,
+            'password': 'password',
+            'user_type': 't'
+        }), content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        return response.json()['access_token']
+
+    def test_login_token_contains_claims(self):
+        token = AccessToken(self.login())
+        self.assertEqual(token['user_type'], 't')
+        self.assertEqual(token['first_name'], 'Professor')
+
+    def test_claims_user_without_query(self):
+        token = AccessToken(self.login())
+        with self.assertNumQueries(0):
+            user = self.authentication.get_user(token)
+            self.assertIsInstance(user, TokenClaimsUser)
+            self.assertEqual(user, self.teacher)
+            self.assertEqual(user.user_type, 't')
+            self.assertEqual(user.first_name, 'Professor')
+
+    def test_list_up_courses_skips_user_query(self):
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {self.login()}"}
+        # 사용자 조회 없이 버전 집계 + 수업 조회만 수행
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('list_up_courses'), **headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['name'], 'Professor')
+
+    def test_token_without_claims_falls_back_to_db(self):
+        token = AccessToken.for_user(self.teacher)
+        with self.assertNumQueries(1):
+            user = self.authentication.get_user(token)
+        self.assertNotIsInstance(user, TokenClaimsUser)
+        self.assertEqual(user, self.teacher)
+
+    @override_settings(JWT_USER_CACHE_TTL=60)
+    def test_deferred_fields_are_cached(self):
+        _, access_token = get_tokens_for_user(self.teacher)
+        token = AccessToken(access_token)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.authentication.get_user(token).user_id, 1001)
+        with self.assertNumQueries(0):
+            user = self.authentication.get_user(token)
+            self.assertEqual(user.user_id, 1001)
+            self.assertTrue(user.is_active)
+
+
+
+@override_settings(PASSWORD_HASH_ITERATIONS=1000)
+class PasswordHashingTest(TestCase):
+    def setUp(self):
+        self.student = User.objects.create_user(
+            user_id=9001, first_name='Student', password='password', user_type='s'
+        )
+        self.login_body = json.dumps({'user_id': 9001, 'password': 'password', 'user_type': 's'})
+
+    def test_hash_runs_on_pool(self):
+        threads = []
+
+        def recording_make_password(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return make_password(*args, **kwargs)
+
+        with mock.patch('user.hashing.make_password', side_effect=recording_make_password):
+            self.student.set_password('new-password')
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith(hashing.THREAD_NAME_PREFIX))
+        self.assertTrue(self.student.check_password('new-password'))
+
+    def test_configured_cost(self):
+        self.assertTrue(self.student.password.startswith('pbkdf2_sha256$1000$'))
+
+    def test_rehash_on_login_when_cost_changes(self):
+        with override_settings(PASSWORD_HASH_ITERATIONS=1200):
+            response = self.client.post(reverse('login'), data=self.login_body, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.student.refresh_from_db()
+        self.assertTrue(self.student.password.startswith('pbkdf2_sha256$1200$'))
+        self.assertTrue(self.student.check_password('password'))
+
+    @override_settings(ROOT_URLCONF='BE.asgi_urls')
+    async def test_async_login_rehashes(self):
+        with override_settings(PASSWORD_HASH_ITERATIONS=1200):
+            response = await self.async_client.post(
+                reverse('login'), data=self.login_body, content_type='application/json'
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(AccessToken(response.json()['access_token'])['first_name'], 'Student')
+        student = await User.objects.aget(user_id=9001)
+        self.assertTrue(student.password.startswith('pbkdf2_sha256$1200$'))
+
+    @override_settings(ROOT_URLCONF='BE.asgi_urls')
+    async def test_async_login_invalid_credentials(self):
+        for body in [
+            {'user_id': 9001, 'password': 'wrong', 'user_type': 's'},
+            {'user_id': 1234, 'password': 'password', 'user_type': 's'},
+            {'user_id': 9001, 'user_type': 's'},
+        ]:
+            response = await self.async_client.post(reverse('login'), data=json.dumps(body), content_type='application/json')
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json()['error'], 'invalid credentials')
+
+        response = await self.async_client.post(
+            reverse('login'), data=json.dumps({'user_id': 9001, 'password': 'password', 'user_type': 't'}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.json()['error'], 'Invalid user type.')
+
+    @override_settings(ROOT_URLCONF='BE.asgi_urls')
+    async def test_async_signup(self):
+        body = {'user_id': 1234567, 'password': 'testpassword', 'first_name': 'TestUser', 'user_type': 't'}
+        response = await self.async_client.post(reverse('signup'), data=json.dumps(body), content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        user = await User.objects.aget(user_id=1234567)
+        self.assertEqual(user.user_type, 't')
+        self.assertTrue(await user.acheck_password('testpassword'))
+
+        response = await self.async_client.post(reverse('signup'), data=json.dumps(body), content_type='application/json')
+        self.assertEqual(response.json()['error'], 'User ID already exists')
+
+    @override_settings(ROOT_URLCONF='BE.asgi_urls')
+    async def test_async_views_require_post(self):
+        response = await self.async_client.get(reverse('login'))
+        self.assertEqual(response.status_code, 405)
+
+
+class LogoutTest(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(JWT_DENYLIST_PATH=os.path.join(directory.name, 'denylist'))
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.teacher = User.objects.create_user(
+            user_id=1001, first_name='Professor', password='password', user_type='t'
+        )
+
+    def login(self):
+        response = self.client.post(reverse('login'), data=json.dumps({
+            'user_id': 1001,
+            'password': 'password',
+            'user_type': 't'
+        }), content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def logout(self, access_token, **data):
+        return self.client.post(
+            reverse('logout'), data=json.dumps(data), content_type='application/json',
+            HTTP_AUTHORIZATION=f'Bearer {access_token}',
+        )
+
+    def test_token_rejected_after_logout(self):
+        tokens = self.login()
+        other = self.login()
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {tokens["access_token"]}'}
+        self.assertEqual(self.client.get(reverse('list_up_courses'), **headers).status_code, 200)
+
+        response = self.logout(tokens['access_token'], refresh_token=tokens['refresh_token'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['message'], 'Successfully logged out.')
+
+        # stateless/DB 조회 인증 모두 폐기된 토큰을 거부
+        self.assertEqual(self.client.get(reverse('list_up_courses'), **headers).status_code, 401)
+        response = self.client.post(
+            reverse('create_course'), data=json.dumps({'name': 'Cloud'}),
+            content_type='application/json', **headers,
+        )
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(self.logout(tokens['access_token']).status_code, 401)
+        self.assertIn(RefreshToken(tokens['refresh_token'])['jti'], denylist.get_denylist())
+
+        # 같은 사용자의 다른 토큰은 그대로 사용 가능
+        other_headers = {'HTTP_AUTHORIZATION': f'Bearer {other["access_token"]}'}
+        self.assertEqual(self.client.get(reverse('list_up_courses'), **other_headers).status_code, 200)
+
+    @override_settings(ROOT_URLCONF='BE.asgi_urls')
+    async def test_async_views_reject_revoked_token(self):
+        _, access_token = get_tokens_for_user(self.teacher)
+        token = AccessToken(access_token)
+        denylist.get_denylist().add(token['jti'], token['exp'])
+        response = await self.async_client.get(
+            reverse('list_up_courses'), headers={'Authorization': f'Bearer {access_token}'}
+        )
+        self.assertEqual(response.status_code, 401)
+
+    def test_invalid_refresh_token(self):
+        access_token = self.login()['access_token']
+        response = self.logout(access_token, refresh_token='not-a-token')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', response.json())
+
+    def test_logout_requires_token(self):
+        self.assertEqual(self.client.post(reverse('logout')).status_code, 401)
+
+
+class DenylistTest(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'denylist')
+
+    def test_shared_between_processes(self):
+        # 같은 파일을 쓰는 다른 worker 프로세스의 Denylist
+        first, second = denylist.Denylist(self.path), denylist.Denylist(self.path)
+        self.assertNotIn('a', second)
+        first.add('a', time.time() + 60)
+        second.add('b', time.time() + 60)
+        self.assertIn('a', second)
+        self.assertIn('b', first)
+        self.assertIn('a', denylist.Denylist(self.path))
+
+    def test_partial_line_not_read(self):
+        entries = denylist.Denylist(self.path)
+        with open(self.path, 'ab') as f:
+            f.write(f'{int(time.time()) + 60} abc'.encode())
+        self.assertNotIn('ab', entries)
+        self.assertNotIn('abc', entries)
+        with open(self.path, 'ab') as f:
+            f.write(b'def\n')
+        self.assertIn('abcdef', entries)
+
+    def test_expired_entries_ignored_and_compacted(self):
+        first, second = denylist.Denylist(self.path), denylist.Denylist(self.path)
+        first.add('expired', time.time() - 1)
+        self.assertNotIn('expired', second)
+
+        with mock.patch.object(denylist, 'COMPACT_MIN_BYTES', 200):
+            for i in range(20):
+                first.add(f'old-{i}', time.time() - 1)
+            first.add('live', time.time() + 60)
+            # 직전 compaction 크기의 2배가 되어야 다시 정리
+            for i in range(20):
+                first.add(f'old-more-{i}', time.time() - 1)
+
+        with open(self.path, 'rb') as f:
+            lines = f.read().splitlines()
+        self.assertLess(len(lines), 20)
+        self.assertIn('live', second)
+        self.assertIn('live', denylist.Denylist(self.path))
+        self.assertEqual(len(second), 1)
+
+    def test_lookup_cost(self):
+        entries = denylist.Denylist(self.path)
+        for i in range(10000):
+            entries.add(f'jti-{i}', time.time() + 60)
+        self.assertIn('jti-5000', entries)
+
+        lookups = 10000
+        start = time.perf_counter()
+        for i in range(lookups):
+            f'jti-{i}' in entries
+        # 파일 stat 한 번 + dict 조회
+        self.assertLess((time.perf_counter() - start) / lookups, 50e-6)
+
+
+@override_settings(PASSWORD_HASH_ITERATIONS=1000)
+class ProvisionUsersTest(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def write(self, name, content):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_rows_match_sign_up(self):
+        path = self.write('users.csv', 'user_id,first_name,password,user_type\n2001,Kim,pw-2001,s\n2002,Lee,pw-2002,t\n')
+        report = provisioning.provision_users(path, workers=2)
+
+        self.assertEqual((report['rows'], report['created'], report['invalid']), (2, 2, []))
+        expected = User.objects.create_user(user_id=2003, first_name='Park', password='pw-2003', user_type='s')
+        provisioned = User.objects.get(user_id=2001)
+        fields = [f.attname for f in User._meta.concrete_fields if f.attname not in (
+            'id', 'user_id', 'first_name', 'password', 'date_joined'
+        )]
+        self.assertEqual(
+            {f: getattr(provisioned, f) for f in fields}, {f: getattr(expected, f) for f in fields}
+        )
+        self.assertTrue(provisioned.password.startswith('pbkdf2_sha256$1000$'))
+        self.assertTrue(provisioned.check_password('pw-2001'))
+        self.assertEqual(User.objects.get(user_id=2002).user_type, 't')
+
+    def test_invalid_rows_reported(self):
+        path = self.write('users.ndjson', '\n'.join([
+            '{"user_id": 2001, "first_name": "Kim", "password": "pw"}',
+            '{"user_id": 2001, "first_name": "Kim again", "password": "pw"}',
+            '{"user_id": "x", "first_name": "Bad", "password": "pw"}',
+            '{"user_id": 2002, "first_name": "Lee"}',
+            '{"user_id": 2003, "first_name": "Park", "password": "pw", "user_type": "a"}',
+            'not json',
+            '',
+            '{"user_id": "2004", "first_name": "Choi", "password": "pw"}',
+            '{"user_id": 2005, "first_name": 5, "password": "pw"}',
+            '{"user_id": 2006, "first_name": "Jung", "password": ["pw"]}',
+            '{"user_id": "\u00b2", "first_name": "Kang", "password": "pw"}',
+        ]) + '\n')
+        report = provisioning.provision_users(path, workers=1)
+
+        self.assertEqual(report['created'], 2)
+        self.assertEqual([row['line'] for row in report['invalid']], [2, 3, 4, 5, 6, 9, 10, 11])
+        self.assertEqual(set(User.objects.values_list('user_id', flat=True)), {2001, 2004})
+
+    def test_resume_after_failure(self):
+        existing = User.objects.create_user(user_id=2001, first_name='Existing', password='old', user_type='s')
+        path = self.write('users.csv', 'user_id,first_name,password\n' + ''.join(
+            f'{2000 + i},User{i},pw-{i}\n' for i in range(1, 11)
+        ))
+        bulk_create = User.objects.bulk_create
+        calls = []
+
+        def failing_bulk_create(users, *args, **kwargs):
+            calls.append(len(users))
+            if len(calls) == 2:
+                raise IntegrityError('UNIQUE constraint failed: user_user.user_id')
+            return bulk_create(users, *args, **kwargs)
+
+        with mock.patch.object(User.objects, 'bulk_create', failing_bulk_create):
+            with self.assertRaises(CommandError):
+                call_command('provision_users', path, '--batch-size', '4', '--workers', '2', stdout=io.StringIO())
+        # 첫 chunk는 커밋됨
+        self.assertEqual(User.objects.count(), 4)
+
+        stdout = io.StringIO()
+        call_command('provision_users', path, '--batch-size', '4', '--workers', '2', stdout=stdout)
+        self.assertIn('10 rows  6 created  4 already existed  0 invalid', stdout.getvalue())
+        self.assertEqual(User.objects.filter(user_id__range=(2001, 2010)).count(), 10)
+        # 이미 있던 계정은 덮어쓰지 않음
+        existing.refresh_from_db()
+        self.assertEqual(existing.first_name, 'Existing')
+
+
+# JWT_STATELESS_AUTH=0 배포의 middleware 구성
+SESSION_MIDDLEWARE = [
+    'BE.cors.PreflightMiddleware',
+    'BE.metrics.MetricsMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'corsheaders.middleware.CorsMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+
+class StatelessLoginTest(TestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(
+            user_id=1001, first_name='Professor', password='password', user_type='t'
+        )
+
+    def login(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse('login'), data=json.dumps({
+                'user_id': 1001, 'password': 'password', 'user_type': 't'
+            }), content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        writes = [q['sql'] for q in queries if not q['sql'].startswith(('SELECT', 'SAVEPOINT', 'RELEASE'))]
+        return response, writes
+
+    def test_login_writes_no_session(self):
+        self.assertTrue(settings.JWT_STATELESS_AUTH)
+        self.assertNotIn('django.contrib.sessions.middleware.SessionMiddleware', settings.MIDDLEWARE)
+        response, writes = self.login()
+
+        self.assertNotIn(settings.SESSION_COOKIE_NAME, response.cookies)
+        self.assertEqual(Session.objects.count(), 0)
+        # last_login 갱신만
+        self.assertEqual(len(writes), 1, writes)
+        self.assertTrue(writes[0].startswith('UPDATE "user_user" SET "last_login"'))
+        self.teacher.refresh_from_db()
+        self.assertIsNotNone(self.teacher.last_login)
+
+    @override_settings(JWT_STATELESS_AUTH=False, MIDDLEWARE=SESSION_MIDDLEWARE)
+    def test_session_mode_still_logs_in(self):
+        response, writes = self.login()
+        self.assertIn(settings.SESSION_COOKIE_NAME, response.cookies)
+        self.assertEqual(Session.objects.count(), 1)
+        self.assertGreater(len(writes), 1)
+
+    def test_sign_up_writes_no_session(self):
+        response = self.client.post(reverse('signup'), data=json.dumps({
+            'user_id': 2001, 'password': 'password', 'first_name': 'New', 'user_type': 's'
+        }), content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Session.objects.count(), 0)
+
+    @override_settings(ROOT_URLCONF='BE.asgi_urls')
+    async def test_async_login_writes_no_session(self):
+        response = await self.async_client.post(reverse('login'), data=json.dumps({
+            'user_id': 1001, 'password': 'password', 'user_type': 't'
+        }), content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(await Session.objects.acount(), 0)
+
+
+class SessionPurgeTest(TestCase):
+    def create_sessions(self, count, expire_date):
+        for _ in range(count):
+            session = SessionStore()
+            session.create()
+            Session.objects.filter(session_key=session.session_key).update(expire_date=expire_date)
+
+    def test_purge_in_batches(self):
+        self.create_sessions(25, timezone.now() - timezone.timedelta(minutes=1))
+        self.create_sessions(3, timezone.now() + timezone.timedelta(hours=1))
+
+        with mock.patch('user.sessions.time.sleep') as sleep:
+            self.assertEqual(sessions.purge_expired_sessions(batch_size=10), 25)
+        # 10 + 10 + 5개, 배치 사이에만 대기
+        self.assertEqual(sleep.call_count, 2)
+        self.assertEqual(Session.objects.count(), 3)
+
+        stdout = io.StringIO()
+        call_command('purge_sessions', stdout=stdout)
+        self.assertIn('Deleted 0 expired sessions', stdout.getvalue())
+
+    def test_background_purge_only_with_sessions(self):
+        self.assertIsNone(sessions.start_background_purge())
+
+        self.addCleanup(setattr, sessions, '_thread', None)
+        with override_settings(JWT_STATELESS_AUTH=False, SESSION_PURGE_INTERVAL=600), \
+                mock.patch.object(sessions, '_purge_forever') as purge_forever:
+            thread = sessions.start_background_purge()
+            thread.join()
+            self.assertIs(sessions.start_background_purge(), thread)
+        purge_forever.assert_called_once_with(600)
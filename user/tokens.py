@@ -0,0 +1,22 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import tokens
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+from .denylist import get_denylist
+
+
+class AccessToken(tokens.AccessToken):
+    """
+    로그아웃으로 폐기된 토큰을 거부하는 AccessToken.
+    SIMPLE_JWT['AUTH_TOKEN_CLASSES']에 등록되어 모든 JWT 인증 클래스가 검증에 사용함.
+    """
+    def verify(self):
+        super().verify()
+        if self.get(api_settings.JTI_CLAIM) in get_denylist():
+            raise TokenError(_("Token is revoked"))
+
+
+def revoke(token):
+    """토큰이 만료될 때까지 denylist에 등록."""
+    get_denylist().add(token[api_settings.JTI_CLAIM], token['exp'])
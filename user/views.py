@@ -1,11 +1,17 @@
-from django.contrib.auth import login, authenticate
+import functools
+from asgiref.sync import sync_to_async
+from django.contrib.auth import authenticate
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 from .models import User
-from django.http import JsonResponse
+from django.http import HttpResponseNotAllowed, JsonResponse
 import json
+from .authentication import StatelessJWTAuthentication, aauthenticate_credentials, get_tokens_for_user, login_user
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework.decorators import api_view
+from .tokens import revoke
 
 # Create your views here.
 @csrf_exempt
@@ -29,7 +35,7 @@ def sign_up_view(request):
 
     user = User.objects.create_user(user_type=user_type, user_id=user_id, first_name=first_name, password=password)
 
-    login(request, user)
+    login_user(request, user)
     return JsonResponse({'message':'User registered successfully'}, status = 201)
 
 @csrf_exempt
@@ -48,14 +54,12 @@ def login_view(request):
             return JsonResponse({'error': 'Invalid user type.'}, status=400)
         
         #로그인
-        login(request, user)
+        login_user(request, user)
 
-        # JWT 토큰 생성
-        refresh = RefreshToken.for_user(user)
+        # JWT 토큰 생성 (access_token에 user_type, first_name claim 포함)
         #access_token: API 접근시 인증용
-        access_token = str(refresh.access_token)
         #refresh_token: access_token 만료 시 재 발급용(아마 안쓸듯)
-        refresh_token = str(refresh)
+        refresh_token, access_token = get_tokens_for_user(user)
 
 
         # 토큰을 포함하여 성공 응답 
@@ -68,14 +72,86 @@ def login_view(request):
     else:
         return JsonResponse({'error':'invalid credentials'}, status = 400)
 
-#로그아웃(프론트에서 토큰만 삭제하면 되기에 그냥 반환값만 존재)
+def async_post_view(view):
+    """async view용 @csrf_exempt + @require_POST (Django 4.2의 두 데코레이터는 sync view 전용)."""
+    @functools.wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method != 'POST':
+            return HttpResponseNotAllowed(['POST'])
+        return await view(request, *args, **kwargs)
+
+    wrapper.csrf_exempt = True
+    return wrapper
+
+
+# ASGI(BE/asgi_urls.py)에서 쓰는 sign_up_view의 async 버전
+# 비밀번호 해시는 hashing pool에서 계산하므로 그동안 event loop는 다른 요청을 처리
+@async_post_view
+async def asign_up_view(request):
+    data = json.loads(request.body)
+
+    user_type = data.get('user_type', 's')
+    user_id = data.get("user_id")
+    password = data.get("password")
+    first_name = data.get("first_name")
+
+    if not first_name or not user_id or not password:
+        return JsonResponse({"error": "Please fill out the required fields"}, status=400)
+
+    if user_type not in ['s', 't']:
+        return JsonResponse({"error": "Invalid user type. Must be 's' (Student) or 't' (Teacher)."}, status=400)
+
+    if await User.objects.filter(user_id=user_id).aexists():
+        return JsonResponse({"error": "User ID already exists"}, status=400)
+
+    user = await User.objects.acreate_user(user_type=user_type, user_id=user_id, first_name=first_name, password=password)
+
+    await sync_to_async(login_user)(request, user)
+    return JsonResponse({'message':'User registered successfully'}, status = 201)
+
+
+# ASGI(BE/asgi_urls.py)에서 쓰는 login_view의 async 버전
+@async_post_view
+async def alogin_view(request):
+    data = json.loads(request.body)
+
+    user_type = data.get('user_type')
+    user_id = data.get("user_id")
+    password = data.get("password")
+
+    user = await aauthenticate_credentials(user_id, password)
+
+    if user is None:
+        return JsonResponse({'error':'invalid credentials'}, status = 400)
+    if user.user_type != user_type:
+        return JsonResponse({'error': 'Invalid user type.'}, status=400)
+
+    await sync_to_async(login_user)(request, user)
+
+    refresh_token, access_token = get_tokens_for_user(user)
+    return JsonResponse({
+        'message': 'login successful',
+        'access_token': access_token,
+        'refresh_token': refresh_token,
+    }, status=200)
+
+#로그아웃: access token(과 요청 본문의 refresh_token)을 만료 시각까지 denylist에 등록
+@csrf_exempt
 @api_view(['POST'])
+@authentication_classes([StatelessJWTAuthentication])
+@permission_classes([IsAuthenticated])
 def logout_view(request):
-    try:
-        return JsonResponse({
-            "message": "Successfully logged out."
-        }, status=200)
-    except Exception as e:
-        return JsonResponse({
-            "error": str(e)
-        }, status=401)
\ No newline at end of file
+    revoke(request.auth)
+
+    refresh_token = request.data.get('refresh_token')
+    if refresh_token:
+        try:
+            revoke(RefreshToken(refresh_token))
+        except TokenError as e:
+            return JsonResponse({
+                "error": str(e)
+            }, status=400)
+
+    return JsonResponse({
+        "message": "Successfully logged out."
+    }, status=200)
\ No newline at end of file